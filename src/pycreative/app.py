@@ -1,24 +1,153 @@
 from __future__ import annotations
 
 from typing import Optional, Tuple, Callable, Any, cast
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from .types import ColorOrNone, ColorTupleOrNone, ColorInput
 
 import time
 import os
+import sys
 import pygame
 import math
+import random as _random_mod
 
 from . import input as input_mod
+from . import noise as _noise_mod
 from .graphics import Surface as GraphicsSurface
 from .graphics import OffscreenSurface
 from .assets import Assets
+from .vector import PVector
 
 # Sentinel for pending state fields so we can distinguish "no pending value"
 # from an explicit `None` which means "disable this style" (e.g., no_fill()).
 _PENDING_UNSET = object()
 
 
+def _pvector_xy(x: Any) -> tuple[float, float]:
+    if isinstance(x, PVector):
+        return x.x, x.y
+    if hasattr(x, "__iter__"):
+        vals = list(x)
+        if len(vals) >= 2:
+            return float(vals[0]), float(vals[1])
+    raise TypeError("Expected a PVector or 2-length iterable")
+
+
+class _PVectorFactory:
+    """Callable `self.pvector`: `self.pvector(x, y)` plus class-style helpers.
+
+    Built once at import; every sketch shares the same stateless instance.
+    """
+
+    def __call__(self, x: float = 0.0, y: float = 0.0) -> "PVector":
+        # Accept None values (common when mouse pos isn't available)
+        x_val = 0.0 if x is None else float(x)
+        y_val = 0.0 if y is None else float(y)
+        return PVector(x_val, y_val)
+
+    @staticmethod
+    def sub(*args):
+        """Support sub(a, b) or sub([a, b])."""
+        if len(args) == 2:
+            a, b = args
+            ax, ay = _pvector_xy(a)
+            bx, by = _pvector_xy(b)
+            return PVector(ax - bx, ay - by)
+        if len(args) == 1:
+            pair = args[0]
+            # If caller accidentally passed a single PVector (common misuse),
+            # raise a helpful message guiding them to use the instance method.
+            if isinstance(pair, PVector):
+                raise TypeError("pvector.sub requires two vector arguments; to mutate an existing vector use v.sub(other).")
+            if hasattr(pair, "__iter__"):
+                lst = list(pair)
+                if len(lst) == 2:
+                    ax, ay = _pvector_xy(lst[0])
+                    bx, by = _pvector_xy(lst[1])
+                    return PVector(ax - bx, ay - by)
+            raise TypeError("pvector.sub requires two vector arguments or a single iterable of two vectors. For mutating subtraction use v.sub(other).")
+        raise TypeError("pvector.sub requires two arguments")
+
+    @staticmethod
+    def add(*args):
+        """Support add(a, b) or add([a, b])."""
+        if len(args) == 2:
+            a, b = args
+            ax, ay = _pvector_xy(a)
+            bx, by = _pvector_xy(b)
+            return PVector(ax + bx, ay + by)
+        if len(args) == 1:
+            pair = args[0]
+            if isinstance(pair, PVector):
+                raise TypeError("pvector.add requires two vector arguments; to mutate an existing vector use v.add(other).")
+            if hasattr(pair, "__iter__"):
+                lst = list(pair)
+                if len(lst) == 2:
+                    ax, ay = _pvector_xy(lst[0])
+                    bx, by = _pvector_xy(lst[1])
+                    return PVector(ax + bx, ay + by)
+            raise TypeError("pvector.add requires two vector arguments or a single iterable of two vectors. For mutating addition use v.add(other).")
+        raise TypeError("pvector.add requires two arguments")
+
+    @staticmethod
+    def random2d() -> "PVector":
+        """Return a new unit PVector pointing in a random 2D direction.
+
+        Delegates to `PVector.random2d()` so callers can use
+        `self.pvector.random2d()`.
+        """
+        return PVector.random2d()
+
+    @staticmethod
+    def from_angle(theta: float, target=None) -> "PVector":
+        """Create a PVector from an angle; forwards to PVector.from_angle.
+
+        Prefer snake_case API (project convention).
+        """
+        return PVector.from_angle(theta, target)
+
+    @staticmethod
+    def mult(v, scalar: float):
+        vx, vy = (v.x, v.y) if isinstance(v, PVector) else (float(v[0]), float(v[1]))
+        s = float(scalar)
+        return PVector(vx * s, vy * s)
+
+    @staticmethod
+    def div(v, scalar: float):
+        vx, vy = (v.x, v.y) if isinstance(v, PVector) else (float(v[0]), float(v[1]))
+        s = float(scalar)
+        if s == 0.0:
+            return PVector(vx, vy)
+        return PVector(vx / s, vy / s)
+
+    @staticmethod
+    def dot(a, b):
+        ax, ay = (a.x, a.y) if isinstance(a, PVector) else (float(a[0]), float(a[1]))
+        bx, by = (b.x, b.y) if isinstance(b, PVector) else (float(b[0]), float(b[1]))
+        return ax * bx + ay * by
+
+    @staticmethod
+    def dist(a, b):
+        """Euclidean distance between two PVectors or 2-length iterables."""
+        ax, ay = (a.x, a.y) if isinstance(a, PVector) else (float(a[0]), float(a[1]))
+        bx, by = (b.x, b.y) if isinstance(b, PVector) else (float(b[0]), float(b[1]))
+        return math.hypot(ax - bx, ay - by)
+
+    @staticmethod
+    def angle_between(a, b):
+        ax, ay = (a.x, a.y) if isinstance(a, PVector) else (float(a[0]), float(a[1]))
+        bx, by = (b.x, b.y) if isinstance(b, PVector) else (float(b[0]), float(b[1]))
+        mag_a = math.hypot(ax, ay)
+        mag_b = math.hypot(bx, by)
+        if mag_a == 0.0 or mag_b == 0.0:
+            return 0.0
+        cosv = (ax * bx + ay * by) / (mag_a * mag_b)
+        cosv = max(-1.0, min(1.0, cosv))
+        return math.acos(cosv)
+
+
 class Sketch:
     """Minimal Sketch runtime: lifecycle hooks and a pygame-based run loop.
 
@@ -40,6 +169,9 @@ class Sketch:
     MULTIPLY = GraphicsSurface.MULTIPLY
     SCREEN = GraphicsSurface.SCREEN
     REPLACE = GraphicsSurface.REPLACE
+    # Callable factory with helpers (`self.pvector(x, y)`, `self.pvector.sub(a, b)`);
+    # stateless, so one instance built at import serves every sketch.
+    pvector: Any = _PVectorFactory()
 
     def __init__(self, sketch_path: Optional[str] = None, seed: int | None = None) -> None:
         # Optional path to the user sketch file that instantiated this Sketch
@@ -59,6 +191,12 @@ class Sketch:
         self._title: str = "PyCreative"
         # Generic cache store for sketches (used by cached graphics helpers)
         self._cache_store: dict = {}
+        # Pool of offscreen buffers behind create_graphics(), created on first use
+        self._graphics_pool: Any = None
+        # Renders kept by cached_graphics(), created on first use
+        self._graphics_cache: Any = None
+        # Layer stack behind `self.layers`, created on first use
+        self._layers: Any = None
         # Pending drawing state if user sets it before the Surface is created.
         # Use a sentinel to distinguish "no pending change" from an explicit
         # `None` (which means disable fill/stroke). Narrow types where possible
@@ -101,6 +239,8 @@ class Sketch:
         # Use a plain assignment (no forward annotation) to avoid static
         # analysis issues in older type-checkers.
         self._save_folder: Optional[str] = None
+        # Optional on-disk decoded image cache directory (see enable_image_cache)
+        self._image_cache_dir: Optional[str] = None
         # Display options: double buffering and vsync
         # - double buffering reduces tearing and is recommended for smooth updates
         # - vsync requests buffer swap synchronization with the display; support
@@ -125,14 +265,15 @@ class Sketch:
         # Provide a small Processing-like math facade on the Sketch instance
         # so sketches can use `self.math.cos(...)` or `self.PI` without
         # depending on the stdlib math module directly. The module is
-        # implemented in `pycreative.pmath`.
+        # implemented in `pycreative.pmath`; `pycreative.fastmath` wraps it
+        # per sketch so `self.math.use_lut(True)` only affects this sketch.
         try:
             from . import pmath
+            from .fastmath import MathContext
 
-            # pmath exposes small math helpers used by sketches. Annotate as
-            # Any to satisfy type-checkers here; the runtime assignment can be
-            # either the pmath module or stdlib math as a fallback.
-            self.math: Any = pmath
+            # Annotate as Any to satisfy type-checkers here; the runtime
+            # value can be the MathContext facade or stdlib math as a fallback.
+            self.math: Any = MathContext()
             self.PI = pmath.PI
             self.TWO_PI = pmath.TWO_PI
             self.HALF_PI = pmath.HALF_PI
@@ -157,10 +298,29 @@ class Sketch:
         # Queue of raw pygame.Event objects received before the sketch is
         # ready. This is used by the input dispatcher to buffer and the run()
         # loop to flush after initialization.
-        self._pending_event_queue: list = []
+        self._pending_event_queue: deque = deque()
+        # Positions of every motion event seen this frame, in order (reset
+        # each frame). With coalesce_motion enabled, consecutive motion
+        # events are merged into one mouse_moved()/mouse_dragged() call.
+        self.mouse_path: list[tuple[int, int]] = []
+        self.coalesce_motion: bool = False
+        # Optional cap on events dispatched per frame; the rest carry over.
+        self.max_events_per_frame: Optional[int] = None
+        # Input recording / deterministic replay (see record_input()).
+        self._input_recorder: Any = None
+        self._input_replay: Any = None
+        self._fixed_dt: Optional[float] = None
+        # Source watcher for --watch (see enable_hot_reload()).
+        self._hot_reloader: Any = None
+
+        # Per-sketch random streams so sketches in one process never share
+        # state. The NumPy Generator used by the *_array helpers is created
+        # lazily from the same seed.
+        self.rng: _random_mod.Random = _random_mod.Random()
+        self._random_seed_value: int | None = None
+        self._np_rng: Any = None
 
         # Apply optional seed for deterministic behavior if provided.
-        # Use the random_seed helper which seeds Python's random module.
         if seed is not None:
             try:
                 self.random_seed(seed)
@@ -168,149 +328,6 @@ class Sketch:
                 # best-effort: ignore seed errors
                 pass
 
-        # Provide a pvector factory on the instance that is callable and
-        # exposes class-style helpers like sub/add/mult/div/dot/angleBetween.
-        try:
-            # Import only for runtime; TYPE_CHECKING import below helps static analyzers
-            from .vector import PVector
-
-            class _PVectorFactoryInst:
-                def __call__(self, x: float = 0.0, y: float = 0.0) -> "PVector":
-                    # Accept None values (common when mouse pos isn't available)
-                    x_val = 0.0 if x is None else float(x)
-                    y_val = 0.0 if y is None else float(y)
-                    return PVector(x_val, y_val)
-
-                @staticmethod
-                def sub(*args):
-                    """Support sub(a, b) or sub([a, b])."""
-                    def _to_xy(x):
-                        if isinstance(x, PVector):
-                            return x.x, x.y
-                        if hasattr(x, "__iter__"):
-                            vals = list(x)
-                            if len(vals) >= 2:
-                                return float(vals[0]), float(vals[1])
-                        raise TypeError("Expected a PVector or 2-length iterable")
-
-                    if len(args) == 2:
-                        a, b = args
-                        ax, ay = _to_xy(a)
-                        bx, by = _to_xy(b)
-                        return PVector(ax - bx, ay - by)
-                    if len(args) == 1:
-                        pair = args[0]
-                        # If caller accidentally passed a single PVector (common misuse),
-                        # raise a helpful message guiding them to use the instance method.
-                        if isinstance(pair, PVector):
-                            raise TypeError("pvector.sub requires two vector arguments; to mutate an existing vector use v.sub(other).")
-                        if hasattr(pair, "__iter__"):
-                            lst = list(pair)
-                            if len(lst) == 2:
-                                ax, ay = _to_xy(lst[0])
-                                bx, by = _to_xy(lst[1])
-                                return PVector(ax - bx, ay - by)
-                        raise TypeError("pvector.sub requires two vector arguments or a single iterable of two vectors. For mutating subtraction use v.sub(other).")
-                    raise TypeError("pvector.sub requires two arguments")
-
-                @staticmethod
-                def add(*args):
-                    """Support add(a, b) or add([a, b])."""
-                    def _to_xy(x):
-                        if isinstance(x, PVector):
-                            return x.x, x.y
-                        if hasattr(x, "__iter__"):
-                            vals = list(x)
-                            if len(vals) >= 2:
-                                return float(vals[0]), float(vals[1])
-                        raise TypeError("Expected a PVector or 2-length iterable")
-
-                    if len(args) == 2:
-                        a, b = args
-                        ax, ay = _to_xy(a)
-                        bx, by = _to_xy(b)
-                        return PVector(ax + bx, ay + by)
-                    if len(args) == 1:
-                        pair = args[0]
-                        if isinstance(pair, PVector):
-                            raise TypeError("pvector.add requires two vector arguments; to mutate an existing vector use v.add(other).")
-                        if hasattr(pair, "__iter__"):
-                            lst = list(pair)
-                            if len(lst) == 2:
-                                ax, ay = _to_xy(lst[0])
-                                bx, by = _to_xy(lst[1])
-                                return PVector(ax + bx, ay + by)
-                        raise TypeError("pvector.add requires two vector arguments or a single iterable of two vectors. For mutating addition use v.add(other).")
-                    raise TypeError("pvector.add requires two arguments")
-
-                @staticmethod
-                def random2d() -> "PVector":
-                    """Return a new unit PVector pointing in a random 2D direction.
-
-                    Delegates to `PVector.random2d()` so callers can use
-                    `self.pvector.random2d()`.
-                    """
-                    return PVector.random2d()
-
-                @staticmethod
-                def from_angle(theta: float, target=None) -> "PVector":
-                    """Create a PVector from an angle; forwards to PVector.from_angle.
-
-                    Prefer snake_case API (project convention).
-                    """
-                    return PVector.from_angle(theta, target)
-
-                @staticmethod
-                def mult(v, scalar: float):
-                    vx, vy = (v.x, v.y) if isinstance(v, PVector) else (float(v[0]), float(v[1]))
-                    s = float(scalar)
-                    return PVector(vx * s, vy * s)
-
-                @staticmethod
-                def div(v, scalar: float):
-                    vx, vy = (v.x, v.y) if isinstance(v, PVector) else (float(v[0]), float(v[1]))
-                    s = float(scalar)
-                    if s == 0.0:
-                        return PVector(vx, vy)
-                    return PVector(vx / s, vy / s)
-
-                @staticmethod
-                def dot(a, b):
-                    ax, ay = (a.x, a.y) if isinstance(a, PVector) else (float(a[0]), float(a[1]))
-                    bx, by = (b.x, b.y) if isinstance(b, PVector) else (float(b[0]), float(b[1]))
-                    return ax * bx + ay * by
-
-                @staticmethod
-                def dist(a, b):
-                    """Euclidean distance between two PVectors or 2-length iterables."""
-                    ax, ay = (a.x, a.y) if isinstance(a, PVector) else (float(a[0]), float(a[1]))
-                    bx, by = (b.x, b.y) if isinstance(b, PVector) else (float(b[0]), float(b[1]))
-                    return math.hypot(ax - bx, ay - by)
-
-                @staticmethod
-                def angle_between(a, b):
-                    ax, ay = (a.x, a.y) if isinstance(a, PVector) else (float(a[0]), float(a[1]))
-                    bx, by = (b.x, b.y) if isinstance(b, PVector) else (float(b[0]), float(b[1]))
-                    mag_a = math.hypot(ax, ay)
-                    mag_b = math.hypot(bx, by)
-                    if mag_a == 0.0 or mag_b == 0.0:
-                        return 0.0
-                    cosv = (ax * bx + ay * by) / (mag_a * mag_b)
-                    cosv = max(-1.0, min(1.0, cosv))
-                    return math.acos(cosv)
-
-            # attach factory instance to sketch instance; this shadows the
-            # `pvector` method so code can call `self.pvector.sub(...)` and
-            # `self.pvector(x,y)` interchangeably.
-            try:
-                # annotate as Any to avoid signature mismatch warnings from static checkers
-                self.pvector: Any = _PVectorFactoryInst()
-            except Exception:
-                # if assignment fails for any reason, leave method-based behavior
-                pass
-        except Exception:
-            # ignore failures; the pvector() method will still work as a fallback
-            pass
 
     # --- Key hooks (override in sketches) ---
     def key_pressed(self) -> None:
@@ -365,6 +382,10 @@ class Sketch:
         """Called once when the run loop exits. Override to clean up resources."""
         return None
 
+    def on_reload(self) -> None:
+        """Called after hot reload swaps in edited code. Override to refresh derived state."""
+        return None
+
     def set_save_folder(self, folder: Optional[str]) -> None:
         """Set a per-sketch snapshots folder.
 
@@ -377,6 +398,18 @@ class Sketch:
         """
         self._save_folder = None if folder is None else str(folder)
 
+    def enable_image_cache(self, folder: Optional[str] = None) -> None:
+        """Opt in to the persistent decoded-image cache for `load_image()`.
+
+        Decoded pixels are stored under `folder` (default: the per-user cache
+        directory) and memory-mapped on later runs instead of re-decoding.
+        """
+        from .image_cache import default_cache_dir
+
+        self._image_cache_dir = str(folder) if folder is not None else default_cache_dir()
+        if self.assets is not None:
+            self.assets.enable_disk_cache(self._image_cache_dir)
+
     def size(self, w: int, h: int, fullscreen: bool = False) -> None:
         """Set the sketch window size. Call this in `setup()`.
 
@@ -614,6 +647,70 @@ class Sketch:
         except Exception:
             self._escape_closes = True
 
+    def set_motion_coalescing(self, enabled: bool = True, max_events_per_frame: Optional[int] = None) -> None:
+        """Merge consecutive mouse-motion events into one hook call per frame.
+
+        High-rate mice and tablets can deliver hundreds of motion events per
+        frame; with coalescing on, `mouse_moved()`/`mouse_dragged()` run
+        once per run of motion and `self.mouse_path` still holds every
+        position. `max_events_per_frame` optionally caps how many events
+        are dispatched per frame (the remainder is handled next frame).
+        """
+        self.coalesce_motion = bool(enabled)
+        self.max_events_per_frame = None if max_events_per_frame is None else max(1, int(max_events_per_frame))
+
+    def enable_hot_reload(self, interval: float = 0.5) -> None:
+        """Reload edited sketch code while running (the CLI's `--watch`).
+
+        The sketch file and the `.py` files beside it are checked every
+        `interval` seconds. Changed code is patched into the live sketch
+        without re-running `setup()`; attributes, the display and loaded
+        assets are kept and `on_reload()` is called.
+        """
+        from .hot_reload import HotReloader
+
+        path = self.sketch_path
+        if not path:
+            import inspect
+
+            path = inspect.getfile(type(self))
+        self._hot_reloader = HotReloader(self, path, interval)
+
+    def record_input(self, path: str, seed: int | None = None) -> None:
+        """Record this run's input events to `path` for later replay.
+
+        The random and noise generators are seeded (with `seed`, the
+        sketch's existing seed, or a fresh one) and the seed is stored in the
+        recording, so `replay_input()` reproduces the run exactly.
+        """
+        from .recording import InputRecorder
+
+        if seed is None:
+            seed = self._random_seed_value
+        if seed is None:
+            seed = _random_mod.SystemRandom().randrange(2**31)
+        self.random_seed(seed, global_random=True)
+        self.noise_seed(seed)
+        self._input_recorder = InputRecorder(path, seed=seed, frame_rate=self._frame_rate, size=(self.width, self.height))
+
+    def replay_input(self, path: str, dt: float | None = None) -> Any:
+        """Replay a recording made with `record_input()` instead of live input.
+
+        Every frame receives the recorded events and a fixed `dt` (default
+        1 / recorded frame rate), the frame-rate limiter is skipped, and the
+        run stops after the last recorded frame. Returns the `InputReplay`;
+        its `mismatches` counts frames whose mouse state diverged.
+        """
+        from .recording import InputReplay
+
+        replay = InputReplay(path, dt=dt)
+        if replay.seed is not None:
+            self.random_seed(replay.seed, global_random=True)
+            self.noise_seed(replay.seed)
+        self._input_replay = replay
+        self._fixed_dt = replay.dt
+        return replay
+
     # --- Surface state helpers (delegate to self.surface) ---
     def fill(self, *args):
         """Set the sketch fill color.
@@ -1086,6 +1183,32 @@ class Sketch:
         except Exception:
             return
 
+    def points(self, pts, color=None) -> None:
+        """Draw many points in one call.
+
+        `pts` may be a `PVectorArray`, an (N, 2) array or an iterable of
+        (x, y) pairs. Styling follows `point()`.
+        """
+        if self.surface is None:
+            return
+        self.surface.points(pts, color)
+
+    def lines(self, starts, ends=None, stroke=None, stroke_weight: Optional[int] = None) -> None:
+        """Draw many independent line segments in one call.
+
+        Pass (N, 4) rows of (x1, y1, x2, y2), or two point collections
+        `starts` and `ends` (PVectorArray, (N, 2) arrays or pairs).
+        """
+        if self.surface is None:
+            return
+        self.surface.lines(starts, ends, color=stroke, width=stroke_weight)
+
+    def circles(self, pts, d: float, fill=None, stroke=None, stroke_weight: Optional[int] = None) -> None:
+        """Draw equal circles of diameter `d` at many positions in one call."""
+        if self.surface is None:
+            return
+        self.surface.circles(pts, d, fill=fill, stroke=stroke, stroke_weight=stroke_weight)
+
     # --- color/channel helpers (convenience for sketches) ---
     def _coerce_color(self, c):
         """Coerce various color forms to a Color instance.
@@ -1315,9 +1438,25 @@ class Sketch:
             self.surface.blit_image(src, int(x), int(y))
             return
         # scale image using the underlying surface
-        scaled = pygame.transform.smoothscale(src, (int(w), int(h)))
+        from .transform_cache import scaled as _scaled
+
+        scaled = _scaled(src, (int(w), int(h)))
         self.surface.blit_image(scaled, int(x), int(y))
 
+    def precompute_rotations(self, img, scale: float = 1.0, angle_step: Optional[float] = None) -> int:
+        """Pre-render every quantized rotation of `img` for transformed draws.
+
+        Useful for spinning sprites: later `image()` calls under rotate()
+        pick the cached rotation instead of resampling each frame. This
+        turns on rotation quantization (1° unless `angle_step` is given).
+        Returns the number of rotations cached.
+        """
+        if img is None:
+            return 0
+        from .transform_cache import precompute_rotations as _precompute
+
+        return _precompute(getattr(img, "raw", img), scale, angle_step)
+
     def shape_mode(self, mode: str | None) -> None:
         """Set the current shape drawing mode used by `shape()`.
 
@@ -1492,7 +1631,12 @@ class Sketch:
         `maximum` if `val > maximum`, otherwise returns `val`.
 
         Works with ints and floats and will attempt to coerce numeric-like inputs.
+        NumPy arrays are clamped elementwise.
         """
+        if hasattr(val, "shape"):
+            from .fastmath import constrain as _constrain
+
+            return _constrain(val, minimum, maximum)
         try:
             v = float(val)
             lo = float(minimum)
@@ -1515,8 +1659,13 @@ class Sketch:
     def dist(self, x1: float, y1: float, x2: float, y2: float) -> float:
         """Return the Euclidean distance between two 2D points.
 
-        Mirrors Processing.dist(x1, y1, x2, y2).
+        Mirrors Processing.dist(x1, y1, x2, y2). With NumPy arrays the
+        distances are computed elementwise.
         """
+        if any(hasattr(v, "shape") for v in (x1, y1, x2, y2)):
+            from .fastmath import dist as _dist
+
+            return _dist(x1, y1, x2, y2)
         try:
             import math
 
@@ -1680,19 +1829,20 @@ class Sketch:
           self.random() -> float in [0,1)
           self.random(high) -> float in [0, high)
           self.random(low, high) -> float in [low, high)
-        """
-        import random as _random
 
+        Draws from this sketch's own `self.rng` stream.
+        """
+        rnd = self.rng.random
         try:
             if len(args) == 0:
-                return _random.random()
+                return rnd()
             if len(args) == 1:
                 high = float(args[0])
-                return _random.random() * high
+                return rnd() * high
             if len(args) >= 2:
                 low = float(args[0])
                 high = float(args[1])
-                return low + _random.random() * (high - low)
+                return low + rnd() * (high - low)
         except Exception:
             return 0.0
         # fallback
@@ -1702,42 +1852,74 @@ class Sketch:
         """Return a normally-distributed random number with mean 0 and stddev 1.
 
         This mirrors Processing.randomGaussian(). For reproducible results
-        use `self.random_seed()` which seeds Python's `random` module.
+        use `self.random_seed()` or `Sketch(seed=...)`.
         """
-        import random as _random
-
         try:
-            return _random.gauss(0.0, 1.0)
+            return self.rng.gauss(0.0, 1.0)
         except Exception:
             # fallback: use Box-Muller directly
             try:
-                u1 = _random.random()
-                u2 = _random.random()
-                import math
-
+                u1 = self.rng.random()
+                u2 = self.rng.random()
                 z0 = math.sqrt(-2.0 * math.log(max(u1, 1e-12))) * math.cos(2.0 * math.pi * u2)
                 return z0
             except Exception:
                 return 0.0
 
-    def random_seed(self, seed: int | None):
-        """Seed the random number generator (Processing.randomSeed equivalent).
+    def random_seed(self, seed: int | None, global_random: bool = False):
+        """Seed this sketch's random generators (Processing.randomSeed equivalent).
 
-        Provide `None` to re-seed from the OS default.
+        Provide `None` to re-seed from the OS default. By default only this
+        sketch's streams are affected. With `global_random=True` the global
+        `random` module (used by `import random` code and
+        `PVector.random2d()`) and, if loaded, NumPy's legacy global generator
+        are seeded too; `pycreative --seed` and input recording/replay do
+        this so whole sketches run deterministically.
         """
-        import random as _random
-
         try:
-            if seed is None:
-                _random.seed()
-            else:
-                _random.seed(int(seed))
+            value = None if seed is None else int(seed)
         except Exception:
             # best-effort, ignore invalid seeds
-            try:
-                _random.seed()
-            except Exception:
-                pass
+            value = None
+        self._random_seed_value = value
+        self.rng.seed(value)
+        # re-created from the new seed on next use
+        self._np_rng = None
+        if global_random:
+            _random_mod.seed(value)
+            np = sys.modules.get("numpy")
+            if np is not None:
+                try:
+                    np.random.seed(None if value is None else value & 0xFFFFFFFF)
+                except Exception:
+                    pass
+
+    def _numpy_rng(self) -> Any:
+        if self._np_rng is None:
+            import numpy as np
+
+            self._np_rng = np.random.default_rng(self._random_seed_value)
+        return self._np_rng
+
+    def random_array(self, n: int, *args):
+        """Return a NumPy array of `n` uniform random floats.
+
+        Mirrors `random()`: `random_array(n)` -> [0,1),
+        `random_array(n, high)` -> [0, high), `random_array(n, low, high)`
+        -> [low, high). Uses a NumPy Generator seeded like `self.rng`.
+        """
+        gen = self._numpy_rng()
+        if len(args) == 0:
+            return gen.random(int(n))
+        if len(args) == 1:
+            return gen.random(int(n)) * float(args[0])
+        low = float(args[0])
+        high = float(args[1])
+        return gen.uniform(low, high, int(n))
+
+    def random_gaussian_array(self, n: int, mean: float = 0.0, sd: float = 1.0):
+        """Return a NumPy array of `n` normally distributed floats."""
+        return self._numpy_rng().normal(float(mean), float(sd), int(n))
 
     def stroke_width(self, w: int) -> None:
         if self.surface is not None:
@@ -2015,7 +2197,7 @@ class Sketch:
             print(f"[pycreative.initialize] debug: sketch_path={self.sketch_path}, width={self.width}, height={self.height}, fullscreen={self.fullscreen}")
         sketch_dir = os.path.dirname(self.sketch_path) if self.sketch_path else os.getcwd()
         try:
-            self.assets = Assets(sketch_dir, debug=debug)
+            self.assets = Assets(sketch_dir, debug=debug, image_cache_dir=self._image_cache_dir)
         except Exception:
             self.assets = None
 
@@ -2352,7 +2534,7 @@ class Sketch:
                 try:
                     from . import input as input_mod_inner
                     while q:
-                        ev = q.pop(0)
+                        ev = q.popleft()
                         try:
                             input_mod_inner.dispatch_event_now(self, ev)
                         except Exception:
@@ -2612,7 +2794,7 @@ class Sketch:
 
                     # drain queue in FIFO order
                     while q:
-                        ev = q.pop(0)
+                        ev = q.popleft()
                         try:
                             input_mod_inner.dispatch_event_now(self, ev)
                         except Exception:
@@ -2645,15 +2827,32 @@ class Sketch:
             now = time.perf_counter()
             dt = now - last_time
             last_time = now
+            if self._fixed_dt is not None:
+                dt = self._fixed_dt
 
             if debug:
                 print(f"[pycreative.run] debug: frame loop start frame={self.frame_count} dt={dt:.6f}")
 
-            for ev in pygame.event.get():
-                if ev.type == pygame.QUIT:
+            if self._hot_reloader is not None:
+                self._hot_reloader.poll(now)
+
+            events = pygame.event.get()
+            replay = self._input_replay
+            if replay is not None:
+                if replay.done(self.frame_count):
                     self._running = False
-                else:
-                    input_mod.dispatch_event(self, ev)
+                    break
+                # live input is ignored while replaying; QUIT still closes
+                quit_events = [ev for ev in events if ev.type == pygame.QUIT]
+                events = quit_events + replay.events_for(self.frame_count)
+            recorder = self._input_recorder
+            if recorder is not None:
+                recorder.capture(self.frame_count, events)
+            input_mod.dispatch_events(self, events)
+            if recorder is not None:
+                recorder.capture_mouse(self.frame_count, self)
+            elif replay is not None:
+                replay.check(self.frame_count, self)
 
             # Reset transform state at the start of each frame so calls like
             # `self.translate(...)` in `draw()` behave like Processing (not
@@ -2701,6 +2900,11 @@ class Sketch:
                     self._running = False
                     raise
 
+            # deliver coalesced Observable notifications once per frame
+            _obs_mod = sys.modules.get("pycreative.observable")
+            if _obs_mod is not None and _obs_mod._pending:
+                _obs_mod.flush_pending()
+
             if debug:
                 print(f"[pycreative.run] debug: calling pygame.display.flip() for frame={self.frame_count}")
             pygame.display.flip()
@@ -2714,11 +2918,16 @@ class Sketch:
             # If max_frames is provided, stop after reaching it
             if max_frames is not None and self.frame_count >= int(max_frames):
                 self._running = False
-            # enforce framerate
-            if self._clock is not None:
+            # enforce framerate (replays run as fast as possible)
+            if self._clock is not None and self._input_replay is None:
                 self._clock.tick(self._frame_rate)
 
         # Clean up
+        if self._input_recorder is not None:
+            try:
+                self._input_recorder.save()
+            except Exception as exc:
+                print(f"[pycreative.run] could not save input recording: {exc}")
         try:
             self.teardown()
         finally:
@@ -2730,8 +2939,12 @@ class Sketch:
         """Re-map a number from one range to another (Processing.map equivalent).
 
         Formula: start2 + (value - start1) * (stop2 - start2) / (stop1 - start1)
-        Does not clamp the output.
+        Does not clamp the output. NumPy arrays are mapped elementwise.
         """
+        if hasattr(value, "shape"):
+            from .fastmath import map as _map
+
+            return _map(value, start1, stop1, start2, stop2)
         try:
             v = float(value)
             s1 = float(start1)
@@ -2745,31 +2958,63 @@ class Sketch:
         except Exception:
             return 0.0
 
-    def noise(self, x: float, y: float | None = None) -> float:
-        """Return 1D or 2D Perlin noise in range [0,1].
+    def lerp(self, start, stop, amt):
+        """Linear interpolation between `start` and `stop` (Processing.lerp).
+
+        Works with floats and, elementwise, with NumPy arrays.
+        """
+        return start + (stop - start) * amt
+
+    def noise(self, x: float, y: float | None = None, z: float | None = None) -> float:
+        """Return 1D, 2D or 3D Perlin noise in range [0,1].
 
         Usage:
           self.noise(x)
           self.noise(x, y)
+          self.noise(x, y, z)
+
+        See `noise_detail()` for multi-octave noise.
         """
         try:
-            from .noise import noise as _noise
-
             if y is None:
-                return float(_noise(float(x)))
-            return float(_noise(float(x), float(y)))
+                return float(_noise_mod.noise(float(x)))
+            if z is None:
+                return float(_noise_mod.noise(float(x), float(y)))
+            return float(_noise_mod.noise(float(x), float(y), float(z)))
         except Exception:
             return 0.0
 
+    def noise_detail(self, octaves: int, falloff: float | None = None) -> None:
+        """Set the number of noise octaves and their amplitude falloff.
+
+        Mirrors Processing's noiseDetail(); octave i contributes with weight
+        falloff**i at twice the previous frequency. Defaults: 1 octave, 0.5.
+        """
+        try:
+            _noise_mod.noise_detail(octaves, falloff)
+        except Exception:
+            pass
+
+    def noise_grid(self, xs, ys=None, z=None):
+        """Return noise for the grid spanned by arrays `xs` and `ys` (NumPy).
+
+        The result has shape (len(ys), len(xs)); `[j, i]` equals
+        `self.noise(xs[i], ys[j])` (or `self.noise(xs[i], ys[j], z)`)
+        exactly. With `ys` omitted returns 1D noise for each x.
+        """
+        return _noise_mod.noise_grid(xs, ys, z)
+
+    def noise_array(self, coords):
+        """Return noise for an (N,), (N, 2) or (N, 3) array of coordinates (NumPy)."""
+        return _noise_mod.noise_array(coords)
+
     def noise_seed(self, seed: int | None) -> None:
         """Reseed the perlin noise generator used by `noise()`.
 
         Pass `None` to create a random seed.
         """
         try:
-            from .noise import seed as _seed
-
-            _seed(seed)
+            _noise_mod.seed(seed)
         except Exception:
             pass
 
@@ -2810,14 +3055,51 @@ class Sketch:
     # both callable creation and class-style helpers (add/sub/etc.).
 
 
+    def create_noise_field(self, w: int, h: int, scale: float = 0.02, octaves: int = 4, falloff: float = 0.5, seed: Optional[int] = None, tileable: bool = True):
+        """Precompute a noise texture of size (w, h) on a worker thread.
+
+        Returns a `pycreative.noise_field.NoiseField`; use `field.sample(x, y)`
+        for bilinear lookups and `field.to_surface()` to draw it. Requires
+        NumPy.
+        """
+        from .noise_field import NoiseField
+
+        return NoiseField(w, h, scale=scale, octaves=octaves, falloff=falloff, seed=seed, tileable=tileable)
+
+    def create_flow_field(self, resolution: int = 20, fn=None, scale: float = 0.1, seed: Optional[int] = None, octaves: int = 1, falloff: float = 0.5):
+        """Build a vector flow field covering the sketch window.
+
+        Returns a `pycreative.flow_field.FlowField` built from noise (or
+        `fn(xs, ys, t)`); use `field.sample(xs, ys)` for array lookups and
+        `field.draw(self)` to show it. Requires NumPy.
+        """
+        from .flow_field import FlowField
+
+        return FlowField(self.width, self.height, resolution=resolution, fn=fn, scale=scale, seed=seed, octaves=octaves, falloff=falloff)
+
+    @property
+    def graphics_pool(self) -> Any:
+        """The `SurfacePool` that `create_graphics()` draws buffers from.
+
+        Use `graphics_pool.set_budget(nbytes)` to bound idle pooled memory
+        and `graphics_pool.stats()` to inspect reuse.
+        """
+        if self._graphics_pool is None:
+            from .surface_pool import SurfacePool
+
+            self._graphics_pool = SurfacePool()
+        return self._graphics_pool
+
     def create_graphics(self, w: int, h: int, inherit_state: bool = False, inherit_transform: bool = False) -> OffscreenSurface:
         """Create an offscreen drawing surface matching the public Surface API.
 
         Returns an `OffscreenSurface` which supports the same primitives as
         the main surface and can be blitted via `blit_image` or `blit`.
+        Buffers given back with `off.release()` are cleared and reused by
+        later calls of the same size.
         """
-        surf = pygame.Surface((int(w), int(h)), flags=pygame.SRCALPHA)
-        off = OffscreenSurface(surf)
+        pool = self.graphics_pool
+        off = OffscreenSurface(pool.acquire(w, h, pygame.SRCALPHA), pool)
         if inherit_state:
             if self.surface is not None:
                 # copy drawing state from main surface to the offscreen surface
@@ -2886,6 +3168,26 @@ class Sketch:
                 pass
         return off
 
+    @contextmanager
+    def scratch_graphics(self, w: int, h: int, inherit_state: bool = False, inherit_transform: bool = False) -> Iterator[OffscreenSurface]:
+        """Lease a cleared offscreen buffer for the duration of a `with` block.
+
+        Example:
+            with self.scratch_graphics(self.width, self.height) as glow:
+                glow.ellipse(...)
+                self.image(glow, 0, 0)
+
+        The buffer goes back to `graphics_pool` when the block exits, so
+        per-frame passes reuse one allocation instead of creating a new
+        surface every frame. Don't keep references to it after the block.
+        """
+        off = self.create_graphics(w, h, inherit_state=inherit_state, inherit_transform=inherit_transform)
+        try:
+            with off:
+                yield off
+        finally:
+            off.release()
+
     # --- Caching helpers ---
     def cache_once(self, key: str, factory: Callable[[], Any]) -> Any:
         """Run a factory once and cache its result by key.
@@ -2901,29 +3203,74 @@ class Sketch:
         return self._cache_store[key]
 
     def clear_cache(self, key: Optional[str] = None) -> None:
-        """Clear a specific cache entry or the entire cache if key is None."""
+        """Clear a specific cache entry or the entire cache if key is None.
+
+        Covers both `cache_once()` values and `cached_graphics()` renders.
+        """
         if key is None:
             self._cache_store.clear()
+            if self._graphics_cache is not None:
+                self._graphics_cache.clear()
         else:
             self._cache_store.pop(key, None)
+            if self._graphics_cache is not None:
+                self._graphics_cache.discard(key)
 
-    def cached_graphics(self, key: str, w: int, h: int, render_fn: Callable[[OffscreenSurface], None]) -> OffscreenSurface:
+    @property
+    def graphics_cache(self) -> Any:
+        """The `GraphicsCache` holding `cached_graphics()` renders.
+
+        Use `graphics_cache.set_budget(nbytes)` to change the memory budget,
+        `graphics_cache.invalidate(key)` to force a redraw and
+        `graphics_cache.stats()` to inspect it.
+        """
+        if self._graphics_cache is None:
+            from .graphics_cache import GraphicsCache
+
+            self._graphics_cache = GraphicsCache(lambda w, h: self.create_graphics(w, h))
+        return self._graphics_cache
+
+    def cached_graphics(self, key: str, w: int, h: int, render_fn: Callable[[OffscreenSurface], None], deps: Any = None, watch: Any = None) -> OffscreenSurface:
         """Create or return a cached OffscreenSurface produced by `render_fn`.
 
-        `render_fn` is called once with an `OffscreenSurface` argument and should
-        draw into it. The resulting OffscreenSurface is cached under `key`.
+        `render_fn` is called with an `OffscreenSurface` argument and should
+        draw into it. The result is cached under `key` and redrawn only when
+        it goes stale: when `deps` (a tuple of values) differs from the
+        previous call, when an attribute listed in `watch` (pairs of
+        `(observable, "attr")`) is assigned, or when the size changes.
+        Renders share a byte budget with least-recently-used eviction.
         """
-        def factory() -> OffscreenSurface:
-            off = self.create_graphics(w, h)
-            try:
-                with off:
-                    render_fn(off)
-            except Exception:
-                # swallow render errors during cache generation
-                pass
-            return off
+        return self.graphics_cache.get(key, w, h, render_fn, deps=deps, watch=watch)
+
+    def cached_graphics_async(self, key: str, w: int, h: int, render_fn: Callable[[OffscreenSurface], None], deps: Any = None, watch: Any = None, placeholder: Any = None) -> Optional[OffscreenSurface]:
+        """Like `cached_graphics()` but renders on a worker thread.
+
+        Returns the latest finished render, or `placeholder` until the first
+        render is ready, so an expensive redraw never stalls `draw()`.
+        `render_fn` must only draw into the surface it receives.
+        """
+        return self.graphics_cache.get_async(key, w, h, render_fn, deps=deps, watch=watch, placeholder=placeholder)
+
+    @property
+    def layers(self) -> Any:
+        """The sketch's `Layers` stack of named offscreen layers.
+
+        Add layers in `setup()` with `self.layers.add(name, draw_fn, z=...,
+        every=..., opacity=..., blend=...)` and composite them with
+        `self.layers.render()` in `draw()`. Each layer is redrawn only when
+        it is due and the layers below the first every-frame layer are
+        kept as one cached image.
+        """
+        if self._layers is None:
+            from .layers import Layers
+
+            self._layers = Layers(self)
+        return self._layers
 
-        return self.cache_once(key, factory)
+    @layers.setter
+    def layers(self, value: Any) -> None:
+        # sketches written before the layer API may use the name themselves
+        self._layers = value
 
     # --- Convenience helpers: cached graphics and runtime no-loop control ---
     def no_loop(self, *args, **kwargs):
@@ -3,15 +3,31 @@ pycreative.assets: Asset manager for sketches (images, audio, video, etc.)
 """
 
 import os
-from typing import Optional, Dict, Any
+import sys
+import time
+from typing import Optional, Dict, Any, TYPE_CHECKING
 
 import pygame
 
+from . import transform_cache
+
+if TYPE_CHECKING:
+    from .image_cache import DiskImageCache
+
+# Same value as image_cache.ENV_VAR; the image cache and font index modules
+# are imported on first use so creating Assets stays cheap.
+_IMAGE_CACHE_ENV = "PYCREATIVE_IMAGE_CACHE"
+
+# Filesystems on these platforms are case-insensitive by default, so the
+# directory index also matches names case-insensitively there (mirroring
+# what os.path.exists would report).
+_CASE_INSENSITIVE_FS = sys.platform in ("darwin", "win32")
+
 
 class Assets:
     # Cache mapping (path or (path,size)) -> loaded asset
     cache: Dict[Any, Any]
-    def __init__(self, sketch_dir: str, debug: bool = False):
+    def __init__(self, sketch_dir: str, debug: bool = False, image_cache_dir: Optional[str] = None, poll_interval: Optional[float] = None):
         self.sketch_dir = sketch_dir
         # enable verbose debug printing when True
         self.debug = bool(debug)
@@ -19,8 +35,131 @@ class Assets:
         # (pygame.Surface, pygame.font.Font, PShape, or filepath). Store as an
         # instance attribute so static analyzers understand `self.cache`.
         self.cache = {}
+        # Bundled fonts found under the sketch directories (name -> path);
+        # scanned once on first list_fonts() call.
+        self._local_fonts: Optional[dict[str, str]] = None
+        # Path resolution caches. `_resolved` maps a requested path to its
+        # resolved file or None (negative cache); `_dir_index` maps each
+        # probed directory to its (names, casefolded names) listing, or None
+        # when the directory does not exist. Both are built on first use.
+        self._resolved: dict[str, Optional[str]] = {}
+        self._dir_index: dict[str, Optional[tuple[frozenset[str], frozenset[str]]]] = {}
+        self._dir_mtimes: dict[str, Optional[int]] = {}
+        # When set, directory mtimes are re-checked at most every
+        # `poll_interval` seconds and the caches dropped on change.
+        self.poll_interval: Optional[float] = poll_interval
+        self._last_poll = time.monotonic()
+        # Optional persistent decoded-image cache. Opt-in via the argument or
+        # the PYCREATIVE_IMAGE_CACHE environment variable.
+        self.disk_cache: Optional["DiskImageCache"] = None
+        cache_dir = image_cache_dir if image_cache_dir is not None else os.getenv(_IMAGE_CACHE_ENV)
+        if cache_dir:
+            self.enable_disk_cache(cache_dir)
+
+    def enable_disk_cache(self, cache_dir: Optional[str] = None) -> None:
+        """Enable the on-disk decoded image cache.
+
+        `cache_dir` defaults to the per-user cache directory
+        (`~/.cache/pycreative/images`).
+        """
+        from .image_cache import DiskImageCache
+
+        self.disk_cache = DiskImageCache(cache_dir)
+
+    def disable_disk_cache(self) -> None:
+        """Stop consulting the on-disk decoded image cache."""
+        self.disk_cache = None
+
+    def set_cache_budget(self, nbytes: int) -> None:
+        """Set the byte budget for derived image data (scaled copies, mipmaps).
+
+        The budget is shared by all sketches in the process; least recently
+        used entries are evicted once it is exceeded.
+        """
+        transform_cache.set_budget(nbytes)
+
+    def set_rotation_cache(self, angle_step: Optional[float] = None, scale_step: Optional[float] = None, budget: Optional[int] = None) -> None:
+        """Configure the cache of rotated images drawn under rotate()/scale().
+
+        Rotations are cached by exact angle and zoom unless `angle_step`
+        (degrees) / `scale_step` are set, in which case values are snapped
+        to those steps before lookup; `budget` bounds its memory in bytes.
+        """
+        if angle_step is not None or scale_step is not None:
+            transform_cache.set_rotation_quantization(angle_step, scale_step)
+        if budget is not None:
+            transform_cache.set_rotation_budget(budget)
+
+    @property
+    def cache_budget(self) -> int:
+        return transform_cache.get_budget()
+
+    def cache_stats(self) -> dict:
+        """Return usage counters for the derived image cache."""
+        return transform_cache.stats()
+
+    def invalidate_paths(self) -> None:
+        """Forget all resolved paths and directory listings.
+
+        Call after adding or removing asset files at runtime, or enable
+        `poll_interval` to have this happen automatically.
+        """
+        self._resolved.clear()
+        self._dir_index.clear()
+        self._dir_mtimes.clear()
+
+    def _poll_dirs(self) -> None:
+        """Invalidate the path caches if any indexed directory changed."""
+        if self.poll_interval is None:
+            return
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval:
+            return
+        self._last_poll = now
+        for d, mtime in self._dir_mtimes.items():
+            try:
+                current: Optional[int] = os.stat(d).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                if self.debug:
+                    print(f"[Assets] Debug: {d} changed; invalidating path cache")
+                self.invalidate_paths()
+                return
+
+    def _listing(self, d: str) -> Optional[tuple[frozenset[str], frozenset[str]]]:
+        if d in self._dir_index:
+            return self._dir_index[d]
+        entry: Optional[tuple[frozenset[str], frozenset[str]]]
+        try:
+            names = frozenset(os.listdir(d))
+            entry = (names, frozenset(n.casefold() for n in names))
+            mtime: Optional[int] = os.stat(d).st_mtime_ns
+        except OSError:
+            entry = None
+            mtime = None
+        self._dir_index[d] = entry
+        self._dir_mtimes[d] = mtime
+        return entry
+
+    def _indexed_exists(self, p: str) -> bool:
+        d, name = os.path.split(p)
+        if not name:
+            return os.path.exists(p)
+        entry = self._listing(d)
+        if entry is None:
+            return False
+        names, folded = entry
+        if name in names:
+            return True
+        return _CASE_INSENSITIVE_FS and name.casefold() in folded
 
     def _resolve_path(self, path: str) -> Optional[str]:
+        self._poll_dirs()
+        try:
+            return self._resolved[path]
+        except KeyError:
+            pass
         parts = path.replace("\\", "/").split("/")
         candidates = []
         # Primary: sketch_dir/data/<path>
@@ -33,17 +172,21 @@ class Assets:
 
         if self.debug:
             print(f"[Assets] Debug: sketch_dir={self.sketch_dir}")
+        found: Optional[str] = None
         for p in candidates:
             if self.debug:
                 print(f"[Assets] Debug: Trying {p}")
-            if os.path.exists(p):
+            if self._indexed_exists(p):
                 if self.debug:
                     print(f"[Assets] Debug: Found asset at {p}")
-                return p
+                found = p
+                break
 
-        if self.debug:
+        if found is None and self.debug:
             print("[Assets] Debug: Not found in candidate locations")
-        return None
+        # Cache hits and misses alike so repeat lookups are a dict access
+        self._resolved[path] = found
+        return found
 
     def load_image(self, path: str) -> Optional[pygame.Surface]:
         if self.debug:
@@ -58,9 +201,21 @@ class Assets:
             if self.debug:
                 print("[Assets] Debug: Returning cached image")
             return self.cache[resolved]
+        if self.disk_cache is not None:
+            img = self.disk_cache.load(resolved)
+            if img is not None:
+                if self.debug:
+                    print("[Assets] Debug: Image mapped from disk cache")
+                self.cache[resolved] = img
+                transform_cache.register_static(img)
+                return img
         try:
             img = pygame.image.load(resolved)
             self.cache[resolved] = img
+            # loaded images are treated as static so scaled draws can be cached
+            transform_cache.register_static(img)
+            if self.disk_cache is not None:
+                self.disk_cache.store(resolved, img)
             if self.debug:
                 print("[Assets] Debug: Image loaded successfully")
             return img
@@ -132,59 +287,19 @@ class Assets:
                     sys_path = None
             except Exception:
                 pass
-            # If match_font returned nothing or a TTC was ignored, attempt a
-            # smarter search through available system font family names to
-            # prefer a non-.ttc (TTF/OTF) match. This helps on macOS where
-            # 'courier' may resolve to a TTC but 'courier new' resolves to a
-            # TTF.
+            # If match_font returned nothing or a TTC was ignored, fall back to
+            # a loose search over installed families, preferring a non-.ttc
+            # (TTF/OTF) match. This helps on macOS where 'courier' may resolve
+            # to a TTC but 'courier new' resolves to a TTF. The process-wide
+            # font index resolves every family once, so repeat calls (and
+            # other sizes) are dict lookups.
             if not sys_path:
-                try:
-                    sys_fonts = pygame.font.get_fonts() or []
-                except Exception:
-                    sys_fonts = []
-                # Normalized requested name for loose matching
-                try:
-                    req_norm = str(path).lower().replace(' ', '')
-                except Exception:
-                    req_norm = ''
-                # Prepare ordered candidates that are likely to succeed
-                candidates = []
-                # common explicit variant
-                if req_norm:
-                    candidates.append(req_norm + 'new')
-                    candidates.append(''.join(req_norm.split()))
-                # then any family that contains the requested substring
-                for fam in sys_fonts:
-                    try:
-                        fam_norm = fam.lower().replace(' ', '')
-                    except Exception:
-                        fam_norm = fam
-                    if req_norm and (req_norm in fam_norm or fam_norm in req_norm):
-                        candidates.append(fam)
-                # Finally try all system fonts (best-effort)
-                candidates.extend(sys_fonts)
-                # Try each candidate via match_font and pick the first non-TTC
-                chosen = None
-                for cand in candidates:
-                    try:
-                        cand_path = pygame.font.match_font(cand)
-                    except Exception:
-                        cand_path = None
-                    if not cand_path:
-                        continue
-                    try:
-                        if cand_path.lower().endswith('.ttc'):
-                            if self.debug:
-                                print(f"[Assets] Debug: Skipping TTC candidate {cand} -> {cand_path}")
-                            continue
-                    except Exception:
-                        pass
-                    # Found a usable non-TTC system font file
-                    chosen = cand_path
-                    if self.debug:
-                        print(f"[Assets] Debug: Using system font candidate {cand} -> {chosen}")
-                    break
+                from .font_index import get_font_index
+
+                chosen = get_font_index().lookup(path)
                 if chosen:
+                    if self.debug:
+                        print(f"[Assets] Debug: Using indexed system font for {path} -> {chosen}")
                     sys_path = chosen
             if sys_path:
                 key = (sys_path, int(size))
@@ -221,16 +336,10 @@ class Assets:
             print(f"[Assets] Error loading font '{resolved}': {e}")
             return None
 
-    def list_fonts(self, include_paths: bool = False) -> list:
-        """Return a list of available fonts.
-
-        The returned list places fonts found under the sketch's data/examples
-        directories first (local bundled fonts), followed by system-installed
-        font family names discovered via pygame.font.get_fonts().
-
-        When `include_paths` is True the function returns a list of tuples
-        (name, path) for local fonts and (name, None) for system families.
-        """
+    def _scan_local_fonts(self) -> dict[str, str]:
+        """Return bundled fonts (name -> path), scanning the sketch dirs once."""
+        if self._local_fonts is not None:
+            return self._local_fonts
         local_fonts: dict[str, str] = {}
         # Candidate directories to search for bundled fonts
         candidates = [
@@ -258,6 +367,21 @@ class Assets:
                         continue
             except Exception:
                 continue
+        self._local_fonts = local_fonts
+        return local_fonts
+
+    def list_fonts(self, include_paths: bool = False) -> list:
+        """Return a list of available fonts.
+
+        The returned list places fonts found under the sketch's data/examples
+        directories first (local bundled fonts), followed by system-installed
+        font family names from the process-wide font index (see
+        `pycreative.font_index`). Both are computed once and reused.
+
+        When `include_paths` is True the function returns a list of tuples
+        (name, path) for local fonts and (name, None) for system families.
+        """
+        local_fonts = self._scan_local_fonts()
 
         results: list = []
         # Add local fonts first
@@ -267,14 +391,11 @@ class Assets:
             else:
                 results.append(name)
 
-        # Then append system font family names
+        # Then append system font family names from the shared font index
         try:
-            import pygame as _pygame
+            from .font_index import get_font_index
 
-            try:
-                sys_fonts = _pygame.font.get_fonts() or []
-            except Exception:
-                sys_fonts = []
+            sys_fonts = get_font_index().families
         except Exception:
             sys_fonts = []
 
@@ -0,0 +1,17 @@
+"""Cellular automata stepped with whole-array operations (Nature of Code chapter 7).
+
+- `ElementaryCA`: 1D Wolfram rules (0-255); each generation is a table
+  lookup on the 3-bit neighbourhood built from shifted copies of the row.
+- `LifeLike`: 2D outer-totalistic rules in B/S notation ("B3/S23" is
+  Conway's Game of Life); neighbour counts come from separable rolling sums.
+- `GridRenderer`: writes a state grid into an 8-bit palette surface and
+  scales it up with a nearest-neighbour blit, instead of one `square()`
+  call per cell.
+
+Requires NumPy (the `numeric` extra).
+"""
+from .elementary import ElementaryCA
+from .life import LifeLike, parse_rule
+from .render import GridRenderer
+
+__all__ = ["ElementaryCA", "LifeLike", "parse_rule", "GridRenderer"]
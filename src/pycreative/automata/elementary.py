@@ -0,0 +1,105 @@
+"""Elementary (1D, radius 1) Wolfram cellular automata."""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+from .render import GridRenderer
+
+
+class ElementaryCA:
+    """A row of `width` binary cells evolved by Wolfram rule `rule` (0-255).
+
+    Bit k of the rule number is the next state of a cell whose
+    (left, centre, right) neighbourhood reads k in binary, so rule 90 is
+    the `ruleset = [0, 1, 0, 1, 1, 0, 1, 0]` of Example 7.1. With
+    `wrap=True` the row is a ring; otherwise the two edge cells never
+    change, as in the example.
+
+    `history` keeps the last N generations as a (N, width) array (oldest
+    first) for drawing the familiar space-time diagram in one blit.
+    """
+
+    def __init__(self, width: int, rule: int = 90, wrap: bool = False, history: int = 0) -> None:
+        if not 0 <= int(rule) <= 255:
+            raise ValueError("rule must be in 0..255")
+        self.width = int(width)
+        self.rule = int(rule)
+        self.wrap = bool(wrap)
+        self.cells = np.zeros(self.width, dtype=np.uint8)
+        self.generation = 0
+        self._table = ((self.rule >> np.arange(8)) & 1).astype(np.uint8)
+        self.history_size = max(0, int(history))
+        self._history: Any = np.zeros((self.history_size, self.width), dtype=np.uint8)
+        self._filled = 0
+        self._renderer: Optional[GridRenderer] = None
+
+    def seed_center(self) -> "ElementaryCA":
+        """Clear the row and turn on the middle cell."""
+        self.cells[:] = 0
+        self.cells[self.width // 2] = 1
+        self._reset_history()
+        return self
+
+    def randomize(self, p: float = 0.5, rng: Any = None) -> "ElementaryCA":
+        """Set each cell on with probability `p`; `rng` is an optional NumPy Generator."""
+        gen = rng if rng is not None else np.random.default_rng()
+        self.cells[:] = gen.random(self.width) < p
+        self._reset_history()
+        return self
+
+    def _reset_history(self) -> None:
+        self.generation = 0
+        self._filled = 0
+        if self.history_size:
+            self._record()
+
+    def _record(self) -> None:
+        h = self._history
+        if self._filled < self.history_size:
+            h[self._filled] = self.cells
+            self._filled += 1
+        else:
+            h[:-1] = h[1:]
+            h[-1] = self.cells
+
+    @property
+    def history(self) -> Any:
+        """Recorded generations, oldest first, shape (recorded, width)."""
+        return self._history[:self._filled]
+
+    def step(self, n: int = 1) -> "ElementaryCA":
+        """Advance `n` generations."""
+        table = self._table
+        for _ in range(int(n)):
+            c = self.cells
+            if self.wrap:
+                idx = (np.roll(c, 1) << 2) | (c << 1) | np.roll(c, -1)
+                self.cells = table[idx]
+            else:
+                nxt = c.copy()
+                nxt[1:-1] = table[(c[:-2] << 2) | (c[1:-1] << 1) | c[2:]]
+                self.cells = nxt
+            self.generation += 1
+            if self.history_size:
+                self._record()
+        return self
+
+    def run(self, generations: int) -> Any:
+        """Evolve `generations` steps and return every row, shape (generations + 1, width)."""
+        out = np.empty((int(generations) + 1, self.width), dtype=np.uint8)
+        out[0] = self.cells
+        for g in range(1, int(generations) + 1):
+            self.step()
+            out[g] = self.cells
+        return out
+
+    def draw(self, target: Any, x: float = 0, y: float = 0, cell: int = 1, palette: Any = None) -> None:
+        """Draw the recorded history (or the current row) with one scaled blit."""
+        if self._renderer is None:
+            self._renderer = GridRenderer() if palette is None else GridRenderer(palette)
+        elif palette is not None:
+            self._renderer.palette = palette
+        state = self.history if self._filled else self.cells
+        self._renderer.draw(target, state, x, y, cell)
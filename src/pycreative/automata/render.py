@@ -0,0 +1,72 @@
+"""Draw state grids with one scaled pixel blit."""
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence
+
+import numpy as np
+import pygame
+
+DEFAULT_PALETTE = ((255, 255, 255), (0, 0, 0))
+
+
+class GridRenderer:
+    """Renders a (rows, cols) integer state grid, one palette colour per state.
+
+    States are written into an 8-bit palette surface with
+    `pygame.surfarray.blit_array` and scaled by `cell` pixels with a
+    nearest-neighbour `pygame.transform.scale` into a reused surface. Both
+    surfaces are kept between frames while the grid shape and cell size
+    stay the same.
+    """
+
+    def __init__(self, palette: Sequence[Any] = DEFAULT_PALETTE) -> None:
+        self._palette = [tuple(int(c) for c in col[:3]) for col in palette]
+        self._small: Optional[pygame.Surface] = None
+        self._scaled: Optional[pygame.Surface] = None
+
+    @property
+    def palette(self) -> list[tuple[int, ...]]:
+        return list(self._palette)
+
+    @palette.setter
+    def palette(self, colors: Sequence[Any]) -> None:
+        self._palette = [tuple(int(c) for c in col[:3]) for col in colors]
+        for surf in (self._small, self._scaled):
+            if surf is not None:
+                surf.set_palette(self._palette)
+
+    def to_surface(self, state: Any, cell: int = 1) -> pygame.Surface:
+        """Return a pygame.Surface of `state` with each cell `cell` pixels wide."""
+        grid = np.asarray(state)
+        if grid.ndim == 1:
+            grid = grid[np.newaxis, :]
+        rows, cols = grid.shape
+        cell = max(1, int(cell))
+        small = self._small
+        if small is None or small.get_size() != (cols, rows):
+            small = pygame.Surface((cols, rows), 0, 8)
+            small.set_palette(self._palette)
+            self._small = small
+            self._scaled = None
+        # surfarray is indexed [x, y]
+        pygame.surfarray.blit_array(small, grid.T.astype(np.uint8, copy=False))
+        if cell == 1:
+            return small
+        size = (cols * cell, rows * cell)
+        if self._scaled is None or self._scaled.get_size() != size:
+            self._scaled = pygame.Surface(size, 0, 8)
+            self._scaled.set_palette(self._palette)
+        pygame.transform.scale(small, size, self._scaled)
+        return self._scaled
+
+    def draw(self, target: Any, state: Any, x: float = 0, y: float = 0, cell: int = 1) -> None:
+        """Draw `state` onto a Sketch, pycreative Surface or pygame.Surface at (x, y)."""
+        surface = getattr(target, "surface", target)
+        if surface is None:
+            return
+        img = self.to_surface(state, cell)
+        if isinstance(surface, pygame.Surface):
+            surface.blit(img, (int(x), int(y)))
+        else:
+            # pycreative Surfaces honour the current transform and blend mode
+            surface.image(img, x, y)
@@ -4,14 +4,14 @@ PyCreative CLI runner
 
 import argparse
 from typing import Any
-import importlib.util
-import inspect
 import pathlib
 import sys
 import os
+import time
 
 # Avoid importing pycreative.app at module import time to prevent heavy side-effects
-# (pygame prints to stdout when imported). We'll import lazily in run_sketch().
+# (pygame prints to stdout when imported). We'll import lazily in run_sketch(),
+# together with importlib.util/inspect, so `--help` and `--version` stay fast.
 
 # Ensure project root is in sys.path for editable installs
 # Determine repository root by searching upward for pyproject.toml so we can
@@ -29,7 +29,38 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 
-def run_sketch(path, max_frames=None, debug: bool = False, seed: int | None = None):
+def _run_instance(inst, max_frames=None, debug: bool = False, seed: int | None = None, record: str | None = None, replay: str | None = None, replay_dt: float | None = None, watch: bool = False):
+    # apply seed if provided and supported by the sketch
+    try:
+        if seed is not None and hasattr(inst, "random_seed"):
+            # also seeds the global `random` module used by helper classes
+            inst.random_seed(seed, global_random=True)
+    except Exception:
+        pass
+    rep = None
+    if replay is not None:
+        rep = inst.replay_input(replay, dt=replay_dt)
+    elif record is not None:
+        inst.record_input(record, seed=seed)
+    if watch:
+        inst.enable_hot_reload()
+    start = time.perf_counter()
+    inst.run(max_frames=max_frames, debug=debug)
+    if rep is not None:
+        elapsed = time.perf_counter() - start
+        frames = max(1, inst.frame_count)
+        print(
+            f"[pycreative.cli] Replayed {inst.frame_count} frame(s) in {elapsed:.3f}s "
+            f"({elapsed * 1000.0 / frames:.2f} ms/frame, {rep.mismatches} mismatch(es))"
+        )
+    elif record is not None:
+        print(f"[pycreative.cli] Recorded {inst.frame_count} frame(s) of input to {record}")
+
+
+def run_sketch(path, max_frames=None, debug: bool = False, seed: int | None = None, record: str | None = None, replay: str | None = None, replay_dt: float | None = None, watch: bool = False):
+    import importlib.util
+    import inspect
+
     path = pathlib.Path(path)
     if not path.exists():
         print(f"Error: Sketch file '{path}' does not exist.")
@@ -40,6 +71,11 @@ def run_sketch(path, max_frames=None, debug: bool = False, seed: int | None = No
         sys.exit(2)
     module = importlib.util.module_from_spec(spec)
     sys.path.insert(0, str(path.parent))
+    if seed is not None:
+        # cover module-level randomness and main()/run() entry points too
+        import random
+
+        random.seed(seed)
     try:
         spec.loader.exec_module(module)
     except Exception as e:
@@ -77,13 +113,7 @@ def run_sketch(path, max_frames=None, debug: bool = False, seed: int | None = No
                 found_subclass = True
                 try:
                     inst = obj(sketch_path=str(path))
-                    # apply seed if provided and supported by the sketch
-                    try:
-                        if seed is not None and hasattr(inst, "random_seed"):
-                            inst.random_seed(seed)
-                    except Exception:
-                        pass
-                    inst.run(max_frames=max_frames, debug=debug)
+                    _run_instance(inst, max_frames, debug, seed, record, replay, replay_dt, watch)
                     return
                 except Exception as e:
                     print(f"Error running {name}: {e}")
@@ -93,12 +123,7 @@ def run_sketch(path, max_frames=None, debug: bool = False, seed: int | None = No
         print("[pycreative.cli] Found 'Sketch' class entry point (fallback).")
         try:
             inst = module.Sketch(sketch_path=str(path))
-            try:
-                if seed is not None and hasattr(inst, "random_seed"):
-                    inst.random_seed(seed)
-            except Exception:
-                pass
-            inst.run(max_frames=max_frames, debug=debug)
+            _run_instance(inst, max_frames, debug, seed, record, replay, replay_dt, watch)
         except Exception as e:
             print(f"Error running Sketch: {e}")
             sys.exit(2)
@@ -110,6 +135,29 @@ def run_sketch(path, max_frames=None, debug: bool = False, seed: int | None = No
     )
 
 
+def manage_image_cache(sketch_path=None, warm: bool = False, clear: bool = False, cache_dir: str | None = None) -> None:
+    """Warm or clear the persistent decoded-image cache.
+
+    Warming decodes every image below the sketch directory (including its
+    `data/` folder) and stores the raw pixels so later runs skip decoding.
+    """
+    from pycreative.image_cache import DiskImageCache, find_images, ENV_VAR
+
+    cache = DiskImageCache(cache_dir or os.getenv(ENV_VAR))
+    if clear:
+        removed = cache.clear()
+        print(f"[pycreative.cli] Removed {removed} cached image(s) from {cache.cache_dir}")
+    if warm:
+        if not sketch_path:
+            print("Error: --warm-image-cache requires a sketch path.")
+            sys.exit(2)
+        path = pathlib.Path(sketch_path)
+        root = path.parent if path.suffix == ".py" else path
+        images = find_images(str(root))
+        written = cache.warm(images)
+        print(f"[pycreative.cli] Cached {written} of {len(images)} image(s) in {cache.cache_dir}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run a PyCreative sketch.")
     parser.add_argument("sketch_path", nargs="?", help="Path to sketch file")
@@ -132,6 +180,44 @@ def main():
         default=None,
         help="Optional random seed to make sketches deterministic",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Reload the sketch and its sibling modules when they change, keeping the running state",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        default=None,
+        help="Record input events (and the seed) to PATH for later replay",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        default=None,
+        help="Replay a recording headlessly with a fixed dt and report frame timings",
+    )
+    parser.add_argument(
+        "--replay-dt",
+        type=float,
+        default=None,
+        help="Fixed dt in seconds for --replay (default: 1 / recorded frame rate)",
+    )
+    parser.add_argument(
+        "--warm-image-cache",
+        action="store_true",
+        help="Decode the sketch's images into the persistent image cache and exit",
+    )
+    parser.add_argument(
+        "--clear-image-cache",
+        action="store_true",
+        help="Delete all entries from the persistent image cache and exit",
+    )
+    parser.add_argument(
+        "--image-cache-dir",
+        default=None,
+        help="Image cache directory (default: $PYCREATIVE_IMAGE_CACHE or ~/.cache/pycreative/images)",
+    )
     parser.add_argument(
         "--version",
         action="store_true",
@@ -176,13 +262,33 @@ def main():
 
         print(f"pycreative {ver}" if ver else "pycreative (unknown)")
         return
+    if args.warm_image_cache or args.clear_image_cache:
+        manage_image_cache(
+            args.sketch_path,
+            warm=args.warm_image_cache,
+            clear=args.clear_image_cache,
+            cache_dir=args.image_cache_dir,
+        )
+        return
     # Require a sketch path unless --version was passed
     if not args.sketch_path:
         parser.error("sketch_path is required unless --version is used")
-    if args.headless:
+    if args.headless or args.replay:
         # Set dummy driver early so pygame picks it up
         os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
-    run_sketch(args.sketch_path, max_frames=args.max_frames, debug=args.debug, seed=args.seed)
+    if args.image_cache_dir:
+        # Assets reads this when the sketch starts, opting it into the cache
+        os.environ["PYCREATIVE_IMAGE_CACHE"] = args.image_cache_dir
+    run_sketch(
+        args.sketch_path,
+        max_frames=args.max_frames,
+        debug=args.debug,
+        seed=args.seed,
+        record=args.record,
+        replay=args.replay,
+        replay_dt=args.replay_dt,
+        watch=args.watch,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,248 @@
+"""Table-driven trigonometry and array-aware mapping helpers.
+
+`SinCosTable` generalises the lookup tables of Example 5.14: sine, cosine
+and arctangent are precomputed at a configurable precision and read back
+by index. Every function accepts a float or a NumPy array; array lookups
+are one fancy-indexing pass, which is faster than `np.sin`/`np.cos`
+on large arrays at the cost of quantised results. For single floats in
+CPython the stdlib functions are already native calls, so the tables
+mostly matter for arrays or for reproducing the quantised look of the
+example.
+
+`map`, `lerp`, `constrain`, `dist` and `mag` follow the Processing
+helpers but also work elementwise on NumPy arrays.
+
+`MathContext` is the per-sketch `self.math` facade: it exposes everything
+in `pycreative.pmath` and `use_lut(True)` switches its `sin`/`cos`/
+`atan2` (and therefore `Sketch.sin`/`cos`/`atan2`) to a table.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional
+import math as _math
+
+from . import pmath
+
+DEFAULT_PRECISION = 0.5  # degrees per table entry, as in Example 5.14
+DEFAULT_ATAN_SIZE = 4096
+
+
+def _is_array(v: Any) -> bool:
+    return hasattr(v, "shape") and hasattr(v, "dtype")
+
+
+class SinCosTable:
+    """Sine/cosine tables with `precision` degrees per entry plus an atan table.
+
+    Angles are in radians and rounded to the nearest table entry; any
+    angle (negative or beyond TWO_PI) is wrapped. `atan_size` entries
+    cover atan(t) for t in [0, 1]; `atan2` reduces other inputs to that
+    octant.
+    """
+
+    def __init__(self, precision: float = DEFAULT_PRECISION, atan_size: int = DEFAULT_ATAN_SIZE) -> None:
+        if precision <= 0:
+            raise ValueError("precision must be positive")
+        self.precision = float(precision)
+        self.period = max(1, int(round(360.0 / self.precision)))
+        self._inv = self.period / (2.0 * _math.pi)
+        step = 2.0 * _math.pi / self.period
+        self.sin_table = [_math.sin(i * step) for i in range(self.period)]
+        self.cos_table = [_math.cos(i * step) for i in range(self.period)]
+        self.atan_size = max(1, int(atan_size))
+        self.atan_table = [_math.atan(i / self.atan_size) for i in range(self.atan_size + 1)]
+        self._np_tables: Optional[tuple[Any, Any, Any]] = None
+
+    def _arrays(self) -> tuple[Any, Any, Any]:
+        if self._np_tables is None:
+            import numpy as np
+
+            self._np_tables = (
+                np.asarray(self.sin_table, dtype=np.float64),
+                np.asarray(self.cos_table, dtype=np.float64),
+                np.asarray(self.atan_table, dtype=np.float64),
+            )
+        return self._np_tables
+
+    def index(self, theta: Any) -> Any:
+        """Table index of angle `theta` (int, or an int array for arrays)."""
+        if _is_array(theta):
+            import numpy as np
+
+            return np.floor(theta * self._inv + 0.5).astype(np.intp) % self.period
+        return int(_math.floor(theta * self._inv + 0.5)) % self.period
+
+    def sin(self, theta: Any) -> Any:
+        if _is_array(theta):
+            return self._arrays()[0][self.index(theta)]
+        return self.sin_table[int(_math.floor(theta * self._inv + 0.5)) % self.period]
+
+    def cos(self, theta: Any) -> Any:
+        if _is_array(theta):
+            return self._arrays()[1][self.index(theta)]
+        return self.cos_table[int(_math.floor(theta * self._inv + 0.5)) % self.period]
+
+    def atan2(self, y: Any, x: Any) -> Any:
+        if _is_array(y) or _is_array(x):
+            return self._atan2_array(y, x)
+        ax = abs(x)
+        ay = abs(y)
+        if ax == 0.0 and ay == 0.0:
+            return 0.0
+        n = self.atan_size
+        if ay <= ax:
+            a = self.atan_table[int(ay / ax * n + 0.5)]
+        else:
+            a = _math.pi / 2 - self.atan_table[int(ax / ay * n + 0.5)]
+        if x < 0:
+            a = _math.pi - a
+        return -a if y < 0 else a
+
+    def _atan2_array(self, y: Any, x: Any) -> Any:
+        import numpy as np
+
+        yy, xx = np.broadcast_arrays(np.asarray(y, dtype=np.float64), np.asarray(x, dtype=np.float64))
+        ax = np.abs(xx)
+        ay = np.abs(yy)
+        lo = np.minimum(ax, ay)
+        hi = np.maximum(ax, ay)
+        ratio = lo / np.where(hi == 0.0, 1.0, hi)
+        a = self._arrays()[2][(ratio * self.atan_size + 0.5).astype(np.intp)]
+        a = np.where(ay > ax, _math.pi / 2 - a, a)
+        a = np.where(xx < 0, _math.pi - a, a)
+        return np.where(yy < 0, -a, a)
+
+
+_default: Optional[SinCosTable] = None
+
+
+def default_table() -> SinCosTable:
+    """The shared table used by the module-level `sin`/`cos`/`atan2`."""
+    global _default
+    if _default is None:
+        _default = SinCosTable()
+    return _default
+
+
+def set_precision(precision: float, atan_size: int = DEFAULT_ATAN_SIZE) -> SinCosTable:
+    """Rebuild the shared table at `precision` degrees per entry."""
+    global _default
+    _default = SinCosTable(precision, atan_size)
+    return _default
+
+
+def sin(theta: Any) -> Any:
+    return default_table().sin(theta)
+
+
+def cos(theta: Any) -> Any:
+    return default_table().cos(theta)
+
+
+def atan2(y: Any, x: Any) -> Any:
+    return default_table().atan2(y, x)
+
+
+# --- array-aware Processing helpers ---
+def map(value: Any, start1: Any, stop1: Any, start2: Any, stop2: Any) -> Any:
+    """Re-map `value` from [start1, stop1] to [start2, stop2] without clamping.
+
+    A zero-width input range maps to `start2`.
+    """
+    span = stop1 - start1
+    if _is_array(span):
+        import numpy as np
+
+        zero = span == 0
+        out = start2 + (value - start1) * (stop2 - start2) / np.where(zero, 1.0, span)
+        return np.where(zero, start2, out)
+    if span == 0:
+        return start2 + value * 0.0 if _is_array(value) else float(start2)
+    return start2 + (value - start1) * (stop2 - start2) / span
+
+
+def lerp(start: Any, stop: Any, amt: Any) -> Any:
+    """Linear interpolation: start + (stop - start) * amt."""
+    return start + (stop - start) * amt
+
+
+def constrain(value: Any, low: Any, high: Any) -> Any:
+    """Clamp `value` to [low, high] (bounds are swapped if reversed)."""
+    if _is_array(value) or _is_array(low) or _is_array(high):
+        import numpy as np
+
+        lo = np.minimum(low, high)
+        hi = np.maximum(low, high)
+        return np.clip(value, lo, hi)
+    if low > high:
+        low, high = high, low
+    return low if value < low else high if value > high else value
+
+
+def dist(x1: Any, y1: Any, x2: Any, y2: Any) -> Any:
+    """Euclidean distance between points; elementwise for arrays."""
+    if any(_is_array(v) for v in (x1, y1, x2, y2)):
+        import numpy as np
+
+        return np.hypot(x2 - x1, y2 - y1)
+    return _math.hypot(x2 - x1, y2 - y1)
+
+
+def mag(x: Any, y: Any) -> Any:
+    """Length of vector (x, y); elementwise for arrays."""
+    if _is_array(x) or _is_array(y):
+        import numpy as np
+
+        return np.hypot(x, y)
+    return _math.hypot(x, y)
+
+
+class MathContext:
+    """Per-sketch `self.math`: `pmath` plus switchable lookup-table trig.
+
+    Attributes not defined here are read from `pycreative.pmath`, so
+    `self.math.PI`, `self.math.sqrt` and friends keep working.
+    """
+
+    map = staticmethod(map)
+    lerp = staticmethod(lerp)
+    constrain = staticmethod(constrain)
+    dist = staticmethod(dist)
+    mag = staticmethod(mag)
+
+    def __init__(self) -> None:
+        self.table: Optional[SinCosTable] = None
+        self.use_lut(False)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(pmath, name)
+
+    @property
+    def lut_enabled(self) -> bool:
+        return self.table is not None
+
+    def use_lut(self, enabled: bool = True, precision: Optional[float] = None, atan_size: Optional[int] = None) -> None:
+        """Route `sin`/`cos`/`atan2` through lookup tables (or back to stdlib).
+
+        `precision` is degrees per sine/cosine entry (default 0.5);
+        `atan_size` the number of arctangent entries. Without either the
+        shared module table is reused.
+        """
+        if not enabled:
+            self.table = None
+            self.sin = pmath.sin
+            self.cos = pmath.cos
+            self.atan2 = pmath.atan2
+            return
+        if precision is None and atan_size is None:
+            table = default_table()
+        else:
+            table = SinCosTable(
+                DEFAULT_PRECISION if precision is None else precision,
+                DEFAULT_ATAN_SIZE if atan_size is None else atan_size,
+            )
+        self.table = table
+        # bound methods stored on the instance: one lookup per call
+        self.sin = table.sin
+        self.cos = table.cos
+        self.atan2 = table.atan2
@@ -0,0 +1,186 @@
+"""Process-wide index of installed system fonts.
+
+`pygame.font.match_font` is cheap for an exact family name, but the loose
+fallback search used by `Assets.load_font` used to call it for every family
+returned by `pygame.font.get_fonts()`, on every call and for every size. This
+module builds a family -> file index once per process, with font collections
+(.ttc) filtered out up front, so the fallback becomes a few dict lookups.
+
+The index can optionally be persisted to a small JSON file so later runs skip
+the per-family resolution too. Persistence is enabled by passing a path to
+`get_font_index()` or by setting the `PYCREATIVE_FONT_INDEX` environment
+variable (use `1` for the default per-user location).
+"""
+from __future__ import annotations
+
+from typing import Optional
+import hashlib
+import json
+import os
+
+ENV_VAR = "PYCREATIVE_FONT_INDEX"
+
+_FORMAT_VERSION = 1
+
+
+def normalize_name(name: object) -> str:
+    """Normalize a family name the way pygame's sysfont does (lowercase alnum)."""
+    try:
+        return "".join(c for c in str(name).lower() if c.isalnum())
+    except Exception:
+        return ""
+
+
+def default_index_path() -> str:
+    """Return the per-user default location of the persisted font index."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pycreative", "fonts.json")
+
+
+def _is_collection(path: str) -> bool:
+    return path.lower().endswith(".ttc")
+
+
+class FontIndex:
+    """Mapping of normalized family names to font file paths.
+
+    `families` keeps the order reported by pygame; `paths` holds only
+    individual font files (TTF/OTF), never collections.
+    """
+
+    def __init__(self, families: list[str], paths: dict[str, str]) -> None:
+        self.families = list(families)
+        self.paths = dict(paths)
+        # memoized lookup results keyed by the requested (raw) name
+        self._lookups: dict[str, Optional[str]] = {}
+
+    @classmethod
+    def build(cls) -> "FontIndex":
+        """Resolve every installed family once via pygame."""
+        import pygame
+
+        try:
+            families = list(pygame.font.get_fonts() or [])
+        except Exception:
+            families = []
+        paths: dict[str, str] = {}
+        for fam in families:
+            try:
+                p = pygame.font.match_font(fam)
+            except Exception:
+                p = None
+            if p and not _is_collection(p):
+                paths[normalize_name(fam)] = p
+        return cls(families, paths)
+
+    @staticmethod
+    def _fingerprint(families: list[str]) -> str:
+        return hashlib.sha1("\n".join(sorted(families)).encode("utf8")).hexdigest()
+
+    @classmethod
+    def load(cls, path: str, families: list[str]) -> Optional["FontIndex"]:
+        """Load a persisted index if it matches the currently installed families."""
+        try:
+            with open(path, "r", encoding="utf8") as f:
+                data = json.load(f)
+        except Exception:
+            return None
+        if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION:
+            return None
+        if data.get("fingerprint") != cls._fingerprint(families):
+            return None
+        paths = data.get("paths")
+        if not isinstance(paths, dict):
+            return None
+        # a removed font file means the index is stale
+        if any(not os.path.exists(p) for p in paths.values()):
+            return None
+        return cls(families, {str(k): str(v) for k, v in paths.items()})
+
+    def save(self, path: str) -> bool:
+        """Persist the index as JSON. Returns False on failure."""
+        data = {
+            "version": _FORMAT_VERSION,
+            "fingerprint": self._fingerprint(self.families),
+            "paths": self.paths,
+        }
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf8") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+            return True
+        except Exception:
+            return False
+
+    def path_for(self, family: str) -> Optional[str]:
+        """Return the non-collection file for an exact family name, if any."""
+        return self.paths.get(normalize_name(family))
+
+    def lookup(self, name: str) -> Optional[str]:
+        """Return the best non-collection font file for a loose family name.
+
+        Candidates are tried in order: `<name>new` (e.g. 'courier' ->
+        'couriernew'), the name itself, families containing the name (or
+        contained in it), and finally any installed family.
+        """
+        if name in self._lookups:
+            return self._lookups[name]
+        req = normalize_name(name)
+        candidates: list[str] = []
+        if req:
+            candidates.append(req + "new")
+            candidates.append(req)
+            for fam in self.families:
+                fam_norm = normalize_name(fam)
+                if req in fam_norm or fam_norm in req:
+                    candidates.append(fam_norm)
+        candidates.extend(normalize_name(f) for f in self.families)
+        chosen = None
+        for cand in candidates:
+            chosen = self.paths.get(cand)
+            if chosen:
+                break
+        self._lookups[name] = chosen
+        return chosen
+
+
+_index: Optional[FontIndex] = None
+
+
+def get_font_index(persist_path: Optional[str] = None) -> FontIndex:
+    """Return the process-wide FontIndex, building it on first use.
+
+    `persist_path` (or the PYCREATIVE_FONT_INDEX environment variable)
+    names a JSON file used to reuse the index across runs.
+    """
+    global _index
+    if _index is not None:
+        return _index
+    if persist_path is None:
+        env = os.getenv(ENV_VAR)
+        if env:
+            persist_path = default_index_path() if env == "1" else env
+    if persist_path:
+        import pygame
+
+        try:
+            families = list(pygame.font.get_fonts() or [])
+        except Exception:
+            families = []
+        loaded = FontIndex.load(persist_path, families)
+        if loaded is not None:
+            _index = loaded
+            return _index
+        _index = FontIndex.build()
+        _index.save(persist_path)
+        return _index
+    _index = FontIndex.build()
+    return _index
+
+
+def reset_font_index() -> None:
+    """Drop the process-wide index (e.g. after installing fonts)."""
+    global _index
+    _index = None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple, cast
+from typing import Callable, Optional, Tuple, TypeVar, cast
+import functools
 from collections.abc import Sequence
 from .types import ColorInput, ColorTupleOrNone, ColorTuple, Number
 
@@ -22,6 +23,7 @@ from .transforms import (
 from .color import Color
 from pycreative.shape_math import flatten_cubic_bezier, bezier_point, bezier_tangent, curve_point, curve_tangent
 from pycreative import primitives as _primitives
+from pycreative import transform_cache as _transform_cache
 
 
 # NOTE: numpy support removed — pixel helpers use pure-Python nested lists.
@@ -31,6 +33,27 @@ _np = None
 
 # Pixel helpers delegated to `pycreative.pixels` (see pixels.py)
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _modifies(fn: _F) -> _F:
+    """Mark drawing methods that write to `self._surf`.
+
+    Cached scaled/rotated copies of a static image (see
+    `pycreative.transform_cache`) are invalidated after the call, so drawing
+    primitives onto a loaded image never leaves stale copies behind.
+    """
+    static_ids = _transform_cache._static_ids
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            if id(self._surf) in static_ids:
+                _transform_cache.mark_modified(self._surf)
+    return cast(_F, wrapper)
+
 
 class Surface:
     """Lightweight wrapper around a pygame.Surface exposing primitives and
@@ -429,6 +452,7 @@ class Surface:
         """Convenience property returning (width, height) of the surface."""
         return self.get_size()
 
+    @_modifies
     def text(self, txt: str, x: int, y: int, font_name: Optional[object] = None, size: int = 24, color: Optional[Tuple[int, int, int]] = None) -> None:
         """Render text onto the surface. Provided on Surface for convenience so
         sketches can call `self.surface.text(...)` regardless of whether the
@@ -654,6 +678,7 @@ class Surface:
             return
 
     # --- basic operations ---
+    @_modifies
     def clear(self, color: ColorInput) -> None:
         """Fill the entire surface with a color.
 
@@ -721,6 +746,7 @@ class Surface:
             # best-effort: ignore invalid input
             return
 
+    @_modifies
     def rect(
         self,
         x: float,
@@ -739,6 +765,7 @@ class Surface:
         # alpha-aware compositing and transform handling.
         return _primitives.rect(self, x, y, w, h, fill=fill, stroke=stroke, stroke_weight=stroke_weight, stroke_width=stroke_width, cap=cap, join=join)
 
+    @_modifies
     def square(
         self,
         x: float,
@@ -756,6 +783,7 @@ class Surface:
 
  
 
+    @_modifies
     def ellipse(
         self,
         x: float,
@@ -772,6 +800,7 @@ class Surface:
         """Draw ellipse with optional per-call fill/stroke/weight overrides."""
         return _primitives.ellipse(self, x, y, w, h, fill=fill, stroke=stroke, stroke_weight=stroke_weight, stroke_width=stroke_width, cap=cap, join=join)
 
+    @_modifies
     def circle(
         self,
         x: float,
@@ -793,6 +822,7 @@ class Surface:
         """Compatibility alias matching some examples that call `img(...)` on surfaces."""
         return self.image(*args, **kwargs)
 
+    @_modifies
     def line(
         self,
         x1: float,
@@ -817,15 +847,19 @@ class Surface:
 
     # Convenience shape helpers to mirror Sketch API on Surface so OffscreenSurface
     # supports triangle/quad directly.
+    @_modifies
     def triangle(self, x1, y1, x2, y2, x3, y3, fill: ColorTupleOrNone = None, stroke: ColorTupleOrNone = None, stroke_weight: Optional[int] = None, stroke_width: Optional[int] = None) -> None:
         return _primitives.triangle(self, x1, y1, x2, y2, x3, y3, fill=fill, stroke=stroke, stroke_weight=stroke_weight, stroke_width=stroke_width)
 
+    @_modifies
     def quad(self, x1, y1, x2, y2, x3, y3, x4, y4, fill: ColorTupleOrNone = None, stroke: ColorTupleOrNone = None, stroke_weight: Optional[int] = None, stroke_width: Optional[int] = None) -> None:
         return _primitives.quad(self, x1, y1, x2, y2, x3, y3, x4, y4, fill=fill, stroke=stroke, stroke_weight=stroke_weight, stroke_width=stroke_width)
 
+    @_modifies
     def arc(self, x: float, y: float, w: float, h: float, start_rad: float, end_rad: float, mode: str = "open", fill: ColorTupleOrNone = None, stroke: ColorTupleOrNone = None, stroke_weight: Optional[int] = None, stroke_width: Optional[int] = None) -> None:
         return _primitives.arc(self, x, y, w, h, start_rad, end_rad, mode=mode, fill=fill, stroke=stroke, stroke_weight=stroke_weight, stroke_width=stroke_width)
 
+    @_modifies
     def point(self, x: float, y: float, color: ColorTupleOrNone = None, z: float | None = None) -> None:
         """Draw a point at (x,y).
 
@@ -836,6 +870,22 @@ class Surface:
         """
         return _primitives.point(self, x, y, color=color, z=z)
 
+    @_modifies
+    def points(self, pts: Any, color: ColorTupleOrNone = None) -> None:
+        """Draw many points at once (PVectorArray, (N,2) array or pairs)."""
+        return _primitives.points(self, pts, color=color)
+
+    @_modifies
+    def lines(self, starts: Any, ends: Any = None, color: ColorTupleOrNone = None, width: Optional[int] = None) -> None:
+        """Draw many line segments at once ((N, 4) rows or start/end point arrays)."""
+        return _primitives.lines(self, starts, ends, color=color, width=width)
+
+    @_modifies
+    def circles(self, pts: Any, d: float, fill: ColorTupleOrNone = None, stroke: ColorTupleOrNone = None, stroke_weight: Optional[int] = None, blend_flags: int = 0) -> None:
+        """Draw equal circles of diameter `d` at many positions in one batched call."""
+        return _primitives.circles(self, pts, d, fill=fill, stroke=stroke, stroke_weight=stroke_weight, blend_flags=blend_flags)
+
+    @_modifies
     def blit(self, other: pygame.Surface, x: int = 0, y: int = 0) -> None:
         self._surf.blit(other, (int(x), int(y)))
 
@@ -849,6 +899,7 @@ class Surface:
         # Kept for existing code; prefer `image()` in new examples.
         self.image(img, x, y)
 
+    @_modifies
     def image(self, img: object, x: int = 0, y: int = 0, w: int | None = None, h: int | None = None) -> None:
         """Draw an image or OffscreenSurface-like object onto this surface.
 
@@ -856,7 +907,8 @@ class Surface:
         - `img` may be a pygame.Surface or an object exposing `raw` which
           returns a pygame.Surface (e.g., `OffscreenSurface`).
         - If `w` and `h` are provided the source will be scaled using
-          pygame.transform.smoothscale before drawing.
+          pygame.transform.smoothscale before drawing. Scaled copies of
+          static images (see `pycreative.transform_cache`) are cached.
         """
         if img is None:
             return
@@ -885,7 +937,7 @@ class Surface:
                 if w is None or h is None:
                     _blit_with_optional_tint(src_surf, bx, by)
                 else:
-                    scaled = pygame.transform.smoothscale(src_surf, (int(w), int(h)))
+                    scaled = _transform_cache.scaled(src_surf, (int(w), int(h)))
                     _blit_with_optional_tint(scaled, bx, by)
             elif self._image_mode == self.MODE_CORNERS:
                 # Interpret (x,y,w,h) as (x1,y1,x2,y2)
@@ -906,7 +958,7 @@ class Surface:
                     height = abs(y2 - y1)
                     if width == 0 or height == 0:
                         return
-                    scaled = pygame.transform.smoothscale(src_surf, (width, height))
+                    scaled = _transform_cache.scaled(src_surf, (width, height))
                     _blit_with_optional_tint(scaled, left, top)
             else:
                 # default CORNER: x,y represent top-left
@@ -915,40 +967,68 @@ class Surface:
                 if w is None or h is None:
                     _blit_with_optional_tint(src_surf, bx, by)
                 else:
-                    scaled = pygame.transform.smoothscale(src_surf, (int(w), int(h)))
+                    scaled = _transform_cache.scaled(src_surf, (int(w), int(h)))
                     _blit_with_optional_tint(scaled, bx, by)
         else:
-            # Simple image transform support: handle translation + uniform scale + rotation via rotozoom
-            # Attempt to detect uniform scale from current matrix; fall back to blit at transformed origin.
-            sx, sy = decompose_scale(self._current_matrix())
+            m = self._current_matrix()
+            a, c = m[0][0], m[0][1]
+            b, d = m[1][0], m[1][1]
+            # Local rect of the image, anchored by image_mode exactly as in
+            # the identity branch; the transform then maps this rect.
+            if w is None or h is None:
+                img_surf = src_surf
+                iw, ih = src_surf.get_size()
+                lx, ly = float(x), float(y)
+            elif self._image_mode == self.MODE_CORNERS:
+                lx, ly = float(min(x, w)), float(min(y, h))
+                iw, ih = int(abs(w - x)), int(abs(h - y))
+                if iw == 0 or ih == 0:
+                    return
+                img_surf = _transform_cache.scaled(src_surf, (iw, ih))
+            else:
+                iw, ih = int(w), int(h)
+                lx, ly = float(x), float(y)
+                img_surf = _transform_cache.scaled(src_surf, (iw, ih))
+            if self._image_mode == self.MODE_CENTER:
+                lx -= iw / 2.0
+                ly -= ih / 2.0
+            if a == 1.0 and b == 0.0 and c == 0.0 and d == 1.0:
+                # pure translation: a plain blit at the moved corner
+                tx, ty = self._transform_point(lx, ly)
+                _blit_with_optional_tint(img_surf, int(round(tx)), int(round(ty)))
+                return
+            if not _transform_cache.is_similarity(a, b, c, d):
+                # Shear / non-uniform scale: rotozoom cannot express these, so
+                # map the image rect through the full affine matrix instead.
+                res = _transform_cache.affine(img_surf, a, b, c, d)
+                if res is not None:
+                    out, (ox, oy) = res
+                    tx, ty = self._transform_point(lx, ly)
+                    self._surf.blit(out, (int(round(tx + ox)), int(round(ty + oy))))
+                return
+            # Rotation + uniform scale via rotozoom, which rotates about the
+            # image centre: place the result on the transformed rect centre.
+            sx, sy = decompose_scale(m)
             avg_scale = (sx + sy) / 2.0 if sx > 0 and sy > 0 else 1.0
-            # compute transformed origin
-            tx, ty = self._transform_point(x, y)
+            tx, ty = self._transform_point(lx + iw / 2.0, ly + ih / 2.0)
             try:
-                if w is None or h is None:
-                    img_surf = src_surf
-                else:
-                    img_surf = pygame.transform.smoothscale(src_surf, (int(w), int(h)))
-                # use rotozoom for rotation+scale; angle extraction is approximate
-                # compute angle from matrix using arctan2 of first column
                 import math
 
-                a = self._current_matrix()[0][0]
-                b = self._current_matrix()[1][0]
                 angle = math.degrees(math.atan2(b, a))
-                transformed = pygame.transform.rotozoom(img_surf, -angle, avg_scale)
-                # rotozoom rotates around center; blit centered at transformed center
+                # static images hit the rotation cache instead of resampling
+                transformed = _transform_cache.rotozoomed(img_surf, -angle, avg_scale)
                 rect = transformed.get_rect()
-                # adjust for rotation/scaling centering
-                self._surf.blit(transformed, (int(tx - rect.width / 2), int(ty - rect.height / 2)))
+                self._surf.blit(transformed, (int(round(tx - rect.width / 2.0)), int(round(ty - rect.height / 2.0))))
             except Exception:
-                # fallback: simple blit at transformed origin
-                self._surf.blit(src_surf, (int(tx), int(ty)))
-        
+                # fallback: simple blit at the transformed corner
+                cx, cy = self._transform_point(lx, ly)
+                self._surf.blit(src_surf, (int(cx), int(cy)))
 
+    @_modifies
     def polygon(self, points: list[tuple[float, float]]) -> None:
         return _primitives.polygon(self, points)
 
+    @_modifies
     def polygon_with_style(self, points: list[tuple[float, float]], fill: ColorTupleOrNone = None, stroke: ColorTupleOrNone = None, stroke_weight: Optional[int] = None, cap: Optional[str] = None, join: Optional[str] = None) -> None:
         return _primitives.polygon_with_style(self, points, fill=fill, stroke=stroke, stroke_weight=stroke_weight, cap=cap, join=join)
 
@@ -965,6 +1045,7 @@ class Surface:
         except Exception:
             self._shape_mode = None
 
+    @_modifies
     def shape(self, shp, x: float, y: float, w: Optional[float] = None, h: Optional[float] = None) -> None:
         """Draw a PShape-like object respecting the current shape_mode.
 
@@ -1067,6 +1148,7 @@ class Surface:
     bezierVertex = bezier_vertex
 
 
+    @_modifies
     def end_shape(self, close: bool = False) -> None:
         """Finish the current shape and draw it.
 
@@ -1250,10 +1332,12 @@ class Surface:
         # draw as open polyline
         self.polyline(pts)
 
+    @_modifies
     def polyline(self, points: list[tuple[float, float]]) -> None:
         # default simple wrapper uses the current stroke/weight — delegate
         return _primitives.polyline(self, points)
 
+    @_modifies
     def polyline_with_style(self, points: list[tuple[float, float]], stroke: ColorTupleOrNone = None, stroke_weight: Optional[int] = None, cap: Optional[str] = None, join: Optional[str] = None) -> None:
         """Draw an open polyline connecting the sequence of points with optional per-call styling."""
         if not points:
@@ -1583,7 +1667,8 @@ class Surface:
 
         Delegates to `pycreative.pixels.set_pixels`.
         """
-        return set_pixels(self._surf, arr)
+        set_pixels(self._surf, arr)
+        _transform_cache.mark_modified(self._surf)
 
     def get_pixel(self, x: int, y: int) -> Tuple[int, ...]:
         """Return a single pixel color tuple (RGB) or (RGBA). Delegates to `pixels.get_pixel`."""
@@ -1591,7 +1676,8 @@ class Surface:
 
     def set_pixel(self, x: int, y: int, color: ColorTuple) -> None:
         """Set a single pixel color. Accepts (r,g,b) or (r,g,b,a). Delegates to `pixels.set_pixel`."""
-        return set_pixel(self._surf, x, y, color)
+        set_pixel(self._surf, x, y, color)
+        _transform_cache.mark_modified(self._surf)
 
     # --- PImage-style pixel helpers ---
     @contextmanager
@@ -1607,6 +1693,15 @@ class Surface:
         # copy-on-enter and writes back on exit.
         with pixels_ctx(self._surf) as pv:
             yield pv
+        _transform_cache.mark_modified(self._surf)
+
+    def mark_modified(self) -> None:
+        """Invalidate cached scaled copies after drawing into a static image.
+
+        Drawing and pixel methods call this automatically; call it yourself
+        after writing to `raw` directly on a surface returned by `load_image`.
+        """
+        _transform_cache.mark_modified(self._surf)
 
     def load_pixels(self) -> Any:
         """Compatibility shim: returns a PixelView copy of the surface pixels."""
@@ -1659,6 +1754,7 @@ class Surface:
 
         raise TypeError("get() accepts 0, 2, or 4 arguments")
 
+    @_modifies
     def copy(self, *args) -> None:
         """PImage-style copy.
 
@@ -1701,17 +1797,9 @@ class Surface:
             # nothing to copy
             return None
 
-        # Extract the source region into a temporary surface
-        tmp_flags = pygame.SRCALPHA if (src_surf.get_flags() & pygame.SRCALPHA) else 0
-        tmp = pygame.Surface((real_sw, real_sh), tmp_flags)
-        tmp.blit(src_surf, (0, 0), pygame.Rect(sx1, sy1, real_sw, real_sh))
-
-        # Scale if necessary
-        if (real_sw, real_sh) != (dw, dh):
-            try:
-                tmp = pygame.transform.smoothscale(tmp, (dw, dh))
-            except Exception:
-                tmp = pygame.transform.scale(tmp, (dw, dh))
+        # Extract (and scale if necessary) the source region; cached when
+        # the source is a static image.
+        tmp = _transform_cache.scaled_region(src_surf, pygame.Rect(sx1, sy1, real_sw, real_sh), (dw, dh))
 
     # Blit into destination (self._surf)
         try:
@@ -1750,6 +1838,7 @@ class Surface:
                     self._surf.set_at((int(x), int(y)), (int(value[0]) & 255, int(value[1]) & 255, int(value[2]) & 255))
             except Exception as e:
                 raise RuntimeError(f"set pixel failed: {e}")
+            _transform_cache.mark_modified(self._surf)
             return
 
         # If value is surface-like, delegate to image() which handles scaling/clipping
@@ -1769,15 +1858,39 @@ class OffscreenSurface(Surface):
     without changes.
     """
 
-    def __init__(self, surf: pygame.Surface) -> None:
+    def __init__(self, surf: pygame.Surface, pool: Any = None) -> None:
         super().__init__(surf)
+        # SurfacePool the buffer was leased from (see Sketch.create_graphics)
+        self._pool = pool
+
+    def release(self) -> None:
+        """Return the buffer to the pool it came from so it can be reused.
+
+        The surface must not be drawn to or blitted after release. Calling
+        this on a surface that did not come from a pool does nothing.
+        """
+        pool = self._pool
+        if pool is not None:
+            self._pool = None
+            pool.release(self._surf)
+
+    def _reset_state(self) -> None:
+        """Restore default drawing state and transform for a redraw in place.
+
+        Keeps the pixel buffer, its pool and the temp surface cache.
+        """
+        surf, pool, temp = self._surf, self._pool, self._temp_surface_cache
+        Surface.__init__(self, surf)
+        self._pool = pool
+        self._temp_surface_cache = temp
 
     def __enter__(self) -> "OffscreenSurface":
         # Context manager entry — no global state to swap for now.
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
-        # Nothing special to clean up; provided for convenience.
+        # Drawing inside the block may have changed a cached static image
+        _transform_cache.mark_modified(self._surf)
         return None
 
     def save(self, path: str) -> None:
@@ -1790,6 +1903,7 @@ class OffscreenSurface(Surface):
 
 
     # --- text/image helpers ---
+    @_modifies
     def text(self, txt: str, x: int, y: int, font_name: Optional[object] = None, size: int = 24, color: Optional[Tuple[int, int, int]] = None) -> None:
         # Accept either an object Font instance or a font name; mirror Surface.text behavior
         try:
@@ -1856,6 +1970,7 @@ class OffscreenSurface(Surface):
         # Delegate to the unified `image` API (keeps compatibility)
         self.image(img, int(x), int(y))
 
+    @_modifies
     def polygon(self, points: list[tuple[float, float]]) -> None:
         # Delegate to the alpha-aware polygon_with_style implementation so
         # OffscreenSurface shares the same compositing behavior as Surface
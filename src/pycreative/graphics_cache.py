@@ -0,0 +1,211 @@
+"""Keyed cache of rendered offscreen surfaces behind `Sketch.cached_graphics`.
+
+Each entry remembers the dependencies it was rendered with and is redrawn
+only when they change:
+
+- `deps` is a tuple of plain values, compared with `==` on every call
+  (e.g. `deps=(self.palette_index, self.width)`);
+- `watch` is a list of `(observable, "attr")` pairs; assigning to a
+  watched attribute marks the entry dirty through `Observable.observe()`.
+
+All entries share a byte budget and the least recently used renders are
+evicted first. `get_async()` renders on a worker thread into a fresh
+surface and swaps it in once finished, returning the previous render (or
+a placeholder) in the meantime.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+from .transform_cache import surface_bytes
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+class _Entry:
+    __slots__ = ("surface", "size", "deps", "dirty", "nbytes", "future", "watchers")
+
+    def __init__(self) -> None:
+        self.surface: Any = None
+        self.size: Optional[tuple[int, int]] = None
+        self.deps: Any = None
+        self.dirty = True
+        self.nbytes = 0
+        self.future: Any = None
+        self.watchers: list[tuple[Any, str, Callable[[Any], None]]] = []
+
+
+class GraphicsCache:
+    """LRU of rendered surfaces with dependency tracking and a byte budget.
+
+    `create(w, h)` allocates a new offscreen surface (the sketch passes
+    `create_graphics`).
+    """
+
+    def __init__(self, create: Callable[[int, int], Any], budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        self._create = create
+        self.budget_bytes = max(0, int(budget_bytes))
+        self.current_bytes = 0
+        self._items: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._executor: Any = None
+        self.hits = 0
+        self.renders = 0
+        self.evictions = 0
+
+    # --- lookups ---
+    def get(self, key: Hashable, w: int, h: int, render_fn: Callable[[Any], None], deps: Any = None, watch: Optional[Iterable[tuple[Any, str]]] = None) -> Any:
+        """Return the render for `key`, redrawing it first if it is stale."""
+        entry = self._entry(key, watch)
+        size = (int(w), int(h))
+        if not self._stale(entry, size, deps):
+            self.hits += 1
+            return entry.surface
+        entry.dirty = False
+        if entry.surface is None or entry.size != size:
+            off = self._create(*size)
+        else:
+            # redraw in place so references kept by the sketch stay current
+            off = entry.surface
+            off.raw.fill((0, 0, 0, 0))
+            # start from defaults, as a freshly created surface would
+            off._reset_state()
+        self._render(off, render_fn)
+        self._store(key, entry, off, size, deps)
+        return off
+
+    def get_async(self, key: Hashable, w: int, h: int, render_fn: Callable[[Any], None], deps: Any = None, watch: Optional[Iterable[tuple[Any, str]]] = None, placeholder: Any = None) -> Any:
+        """Like `get()` but renders on a worker thread.
+
+        Returns the most recent finished render, or `placeholder` until
+        the first one completes. `render_fn` must only draw into the
+        surface it is given.
+        """
+        entry = self._entry(key, watch)
+        size = (int(w), int(h))
+        fut = entry.future
+        if fut is not None and fut.done():
+            entry.future = None
+            try:
+                off, rsize, rdeps = fut.result()
+                self._store(key, entry, off, rsize, rdeps)
+            except Exception:
+                # a failed render keeps the previous surface
+                pass
+        if entry.future is None and self._stale(entry, size, deps):
+            entry.dirty = False
+            off = self._create(*size)
+            entry.future = self._pool().submit(self._render_job, off, render_fn, size, deps)
+        elif entry.surface is not None:
+            self.hits += 1
+        return entry.surface if entry.surface is not None else placeholder
+
+    # --- invalidation and budget ---
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Mark one entry (or all) stale without dropping the current render."""
+        for k, entry in self._items.items():
+            if key is None or k == key:
+                entry.dirty = True
+
+    def discard(self, key: Hashable) -> None:
+        entry = self._items.pop(key, None)
+        if entry is not None:
+            self._drop(entry)
+
+    def clear(self) -> None:
+        while self._items:
+            _key, entry = self._items.popitem(last=False)
+            self._drop(entry)
+
+    def set_budget(self, budget_bytes: int) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._evict()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._items),
+            "bytes": self.current_bytes,
+            "budget": self.budget_bytes,
+            "hits": self.hits,
+            "renders": self.renders,
+            "evictions": self.evictions,
+        }
+
+    # --- internals ---
+    def _entry(self, key: Hashable, watch: Optional[Iterable[tuple[Any, str]]]) -> _Entry:
+        entry = self._items.get(key)
+        if entry is None:
+            entry = _Entry()
+            self._items[key] = entry
+            for obj, attr in watch or ():
+                observe = getattr(obj, "observe", None)
+                if observe is None:
+                    raise TypeError(f"cannot watch {attr!r} on {type(obj).__name__}: not an Observable")
+                cb = self._dirty_callback(entry)
+                observe(attr, cb)
+                entry.watchers.append((obj, attr, cb))
+        else:
+            self._items.move_to_end(key)
+        return entry
+
+    @staticmethod
+    def _dirty_callback(entry: _Entry) -> Callable[[Any], None]:
+        def mark(_value: Any) -> None:
+            entry.dirty = True
+        return mark
+
+    @staticmethod
+    def _stale(entry: _Entry, size: tuple[int, int], deps: Any) -> bool:
+        return entry.surface is None or entry.dirty or entry.size != size or entry.deps != deps
+
+    def _render(self, off: Any, render_fn: Callable[[Any], None]) -> None:
+        self.renders += 1
+        try:
+            with off:
+                render_fn(off)
+        except Exception:
+            # swallow render errors during cache generation
+            pass
+
+    def _render_job(self, off: Any, render_fn: Callable[[Any], None], size: tuple[int, int], deps: Any) -> tuple[Any, tuple[int, int], Any]:
+        self._render(off, render_fn)
+        return off, size, deps
+
+    def _store(self, key: Hashable, entry: _Entry, off: Any, size: tuple[int, int], deps: Any) -> None:
+        if self._items.get(key) is not entry:
+            # evicted or cleared while rendering
+            return
+        nbytes = surface_bytes(off.raw)
+        self.current_bytes += nbytes - entry.nbytes
+        entry.surface = off
+        entry.size = size
+        entry.deps = deps
+        entry.nbytes = nbytes
+        self._evict(keep=key)
+
+    def _evict(self, keep: Optional[Hashable] = None) -> None:
+        while self.current_bytes > self.budget_bytes and len(self._items) > (1 if keep in self._items else 0):
+            key = next(iter(self._items))
+            if key == keep:
+                self._items.move_to_end(key)
+                continue
+            entry = self._items.pop(key)
+            self._drop(entry)
+            self.evictions += 1
+
+    def _drop(self, entry: _Entry) -> None:
+        self.current_bytes -= entry.nbytes
+        entry.nbytes = 0
+        for obj, attr, cb in entry.watchers:
+            try:
+                obj.unobserve(attr, cb)
+            except Exception:
+                pass
+        entry.watchers = []
+
+    def _pool(self) -> Any:
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pycreative-cache")
+        return self._executor
@@ -0,0 +1,211 @@
+"""Hot reload of sketch code while the sketch keeps running.
+
+`HotReloader` polls the modification times of the sketch file and the
+`.py` files next to it. When one changes it reloads that code and patches
+the new function and class bodies into the *existing* classes. The live
+`Sketch` instance (and any `Mover`/`Boid` objects it holds) then runs the
+new methods while keeping its attributes, display surface and `Assets`
+cache. `setup()` is not re-run; the sketch's optional `on_reload()` hook is.
+
+A reload that fails (syntax error, exception at import) is reported and
+the sketch keeps running the previous code.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional
+import importlib
+import importlib.util
+import os
+import sys
+import time
+import traceback
+
+# attributes that belong to the class object itself and must not be copied
+_SKIP = {"__dict__", "__weakref__", "__module__", "__qualname__"}
+
+
+def _functions(value: Any) -> list[Any]:
+    """Plain functions behind a class attribute (methods, properties, ...)."""
+    if isinstance(value, (staticmethod, classmethod)):
+        value = value.__func__
+    if isinstance(value, property):
+        return [f for f in (value.fget, value.fset, value.fdel) if f is not None]
+    return [value] if hasattr(value, "__code__") else []
+
+
+def _rebind_class_cell(value: Any, new: type, old: type) -> None:
+    # zero-argument super() reads the implicit __class__ cell, which still
+    # points at the freshly executed class; point it at the live one
+    for fn in _functions(value):
+        for cell in fn.__closure__ or ():
+            try:
+                if cell.cell_contents is new:
+                    cell.cell_contents = old
+            except ValueError:
+                # empty cell
+                pass
+
+
+def patch_class(old: type, new: type) -> None:
+    """Copy the namespace of `new` onto `old` so existing instances see it."""
+    if old is new:
+        return
+    for name, value in list(new.__dict__.items()):
+        if name in _SKIP:
+            continue
+        _rebind_class_cell(value, new, old)
+        try:
+            setattr(old, name, value)
+        except (AttributeError, TypeError):
+            pass
+    for name in [n for n, v in old.__dict__.items() if callable(v) and n not in new.__dict__]:
+        try:
+            delattr(old, name)
+        except (AttributeError, TypeError):
+            pass
+    # Observable subclasses cache their on_<attr> hooks per class
+    refresh = getattr(old, "refresh_hooks", None)
+    if callable(refresh):
+        refresh()
+
+
+def _patch_module_classes(old_ns: dict, new_ns: dict, module_name: str) -> None:
+    """Patch classes redefined in `new_ns` into the old ones and rebind the
+    names to the old class objects, so objects created after the reload are
+    still instances of the classes existing objects belong to."""
+    for name, old in old_ns.items():
+        new = new_ns.get(name)
+        if isinstance(old, type) and isinstance(new, type) and old is not new and old.__module__ == module_name:
+            patch_class(old, new)
+            new_ns[name] = old
+
+
+class HotReloader:
+    """Watches a sketch's source files and patches changes into `sketch`."""
+
+    def __init__(self, sketch: Any, path: str, interval: float = 0.5) -> None:
+        self.sketch = sketch
+        self.path = os.path.abspath(path)
+        self.directory = os.path.dirname(self.path)
+        self.interval = float(interval)
+        self.reloads = 0
+        self._next_check = 0.0
+        self._mtimes = self._scan()
+        # The sketch module's namespace. The CLI does not register the
+        # sketch in sys.modules, so find it through the class's functions.
+        self._namespace = self._find_namespace()
+
+    def _find_namespace(self) -> Optional[dict]:
+        cls = type(self.sketch)
+        mod = sys.modules.get(cls.__module__)
+        if mod is not None and os.path.abspath(getattr(mod, "__file__", "") or "") == self.path:
+            return mod.__dict__
+        for value in cls.__dict__.values():
+            for fn in _functions(value):
+                ns = getattr(fn, "__globals__", None)
+                if ns is not None and os.path.abspath(ns.get("__file__") or "") == self.path:
+                    return ns
+        return None
+
+    def _scan(self) -> dict[str, float]:
+        mtimes: dict[str, float] = {}
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            names = []
+        for name in names:
+            if name.endswith(".py"):
+                p = os.path.join(self.directory, name)
+                try:
+                    mtimes[p] = os.stat(p).st_mtime
+                except OSError:
+                    pass
+        return mtimes
+
+    def changed(self) -> list[str]:
+        """Paths whose modification time changed since the last call."""
+        mtimes = self._scan()
+        out = [p for p, m in mtimes.items() if self._mtimes.get(p) != m]
+        self._mtimes = mtimes
+        return out
+
+    def poll(self, now: Optional[float] = None) -> bool:
+        """Check for changes at most every `interval` seconds; reload if any."""
+        now = time.perf_counter() if now is None else now
+        if now < self._next_check:
+            return False
+        self._next_check = now + self.interval
+        paths = self.changed()
+        if not paths:
+            return False
+        return self.reload(paths)
+
+    def _sibling_modules(self) -> dict[str, Any]:
+        mods = {}
+        for mod in list(sys.modules.values()):
+            f = getattr(mod, "__file__", None)
+            if f and os.path.dirname(os.path.abspath(f)) == self.directory:
+                mods[os.path.abspath(f)] = mod
+        return mods
+
+    def reload(self, paths: Optional[list[str]] = None) -> bool:
+        """Reload `paths` (default: the sketch file) and call `on_reload()`."""
+        paths = [os.path.abspath(p) for p in (paths or [self.path])]
+        try:
+            siblings = self._sibling_modules()
+            for p in paths:
+                mod = siblings.get(p)
+                if mod is None or p == self.path:
+                    continue
+                old_ns = dict(mod.__dict__)
+                importlib.reload(mod)
+                _patch_module_classes(old_ns, mod.__dict__, mod.__name__)
+            # re-execute the sketch module when it (or anything it imports
+            # from the sketch folder) changed, so module-level names rebind
+            self._reload_sketch_module()
+        except Exception:
+            print(f"[pycreative.reload] reload failed, keeping previous code:\n{traceback.format_exc()}")
+            return False
+        self.reloads += 1
+        print(f"[pycreative.reload] reloaded {', '.join(os.path.basename(p) for p in paths)}")
+        try:
+            self.sketch.on_reload()
+        except Exception:
+            print(f"[pycreative.reload] on_reload() raised:\n{traceback.format_exc()}")
+        return True
+
+    def _reload_sketch_module(self) -> None:
+        cls = type(self.sketch)
+        module_name = cls.__module__
+        ns = self._namespace
+        if ns is None:
+            self._reload_detached(cls, module_name)
+            return
+        with open(self.path, "r", encoding="utf8") as f:
+            code = compile(f.read(), self.path, "exec")
+        # Re-execute into the original namespace so module-level state and
+        # the globals of existing functions stay one dict, then patch every
+        # class defined in the file back onto the original class objects.
+        old_ns = dict(ns)
+        try:
+            exec(code, ns)
+            if not isinstance(ns.get(cls.__name__), type):
+                raise ImportError(f"{cls.__name__} no longer defined in {self.path}")
+        except BaseException:
+            ns.clear()
+            ns.update(old_ns)
+            raise
+        _patch_module_classes(old_ns, ns, module_name)
+
+    def _reload_detached(self, cls: type, module_name: str) -> None:
+        # no namespace to reuse: patch the sketch class from a fresh module
+        spec = importlib.util.spec_from_file_location(module_name, self.path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"cannot load {self.path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        new_cls = getattr(module, cls.__name__, None)
+        if not isinstance(new_cls, type):
+            raise ImportError(f"{cls.__name__} no longer defined in {self.path}")
+        patch_class(cls, new_cls)
+        module.__dict__[cls.__name__] = cls
@@ -0,0 +1,193 @@
+"""Persistent on-disk cache of decoded images.
+
+Decoding large PNG/JPEG files with `pygame.image.load` can dominate sketch
+startup. This module stores the decoded pixels as raw RGB/RGBA files with a
+tiny fixed header so later runs can `mmap` them and wrap the mapping with
+`pygame.image.frombuffer`, skipping the decode step entirely.
+
+Entries are keyed by the absolute source path plus its mtime and size, so an
+edited asset simply misses the cache and is re-decoded; the outdated entry
+for that file is deleted when the miss is noticed or the new one is stored.
+Images with a colorkey keep it: the key is stored in the header and restored
+on load. The cache is opt-in:
+`Assets` only consults it when a cache directory has been configured (see
+`Assets.enable_disk_cache()` or the `PYCREATIVE_IMAGE_CACHE` environment
+variable). The CLI exposes `--warm-image-cache` and `--clear-image-cache`.
+
+File layout (little-endian)::
+
+    magic  4s  b"PCIC"
+    ver    B   format version
+    chans  B   3 (RGB) or 4 (RGBA)
+    haskey B   1 if the image uses a colorkey
+    pad    x
+    width  I
+    height I
+    key    4s  colorkey as RGBA bytes (zero when unused)
+    pixels width * height * chans bytes
+
+Entry files are named `<hash of source path>-<hash of mtime and size>` so
+every version of one source can be found (and pruned) by its prefix.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Optional
+import hashlib
+import mmap
+import os
+import struct
+
+import pygame
+
+# Environment variable naming a cache directory; setting it opts sketches in.
+ENV_VAR = "PYCREATIVE_IMAGE_CACHE"
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga", ".webp"}
+
+_MAGIC = b"PCIC"
+_VERSION = 2
+_HEADER = struct.Struct("<4sBBBxII4s")
+_SUFFIX = ".rgba"
+
+
+def default_cache_dir() -> str:
+    """Return the per-user default cache directory (XDG-style)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pycreative", "images")
+
+
+class DiskImageCache:
+    """Directory of decoded images keyed by path + mtime + size."""
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self.cache_dir = os.path.abspath(cache_dir or default_cache_dir())
+
+    def _source_prefix(self, path: str) -> str:
+        return hashlib.sha1(os.path.abspath(path).encode("utf8")).hexdigest()[:20] + "-"
+
+    def _entry_path(self, path: str) -> Optional[str]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        version = hashlib.sha1(f"{st.st_mtime_ns}|{st.st_size}".encode("utf8")).hexdigest()[:20]
+        return os.path.join(self.cache_dir, self._source_prefix(path) + version + _SUFFIX)
+
+    def _prune_source(self, path: str, keep: Optional[str]) -> int:
+        """Delete entries for older versions of `path` (all but `keep`)."""
+        prefix = self._source_prefix(path)
+        keep_name = os.path.basename(keep) if keep else None
+        removed = 0
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return 0
+        for name in names:
+            if name.startswith(prefix) and name.endswith(_SUFFIX) and name != keep_name:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def contains(self, path: str) -> bool:
+        """Return True if a valid cache entry exists for the current file version."""
+        entry = self._entry_path(path)
+        return entry is not None and os.path.exists(entry)
+
+    def load(self, path: str) -> Optional[pygame.Surface]:
+        """Return a Surface mapped from the cache entry for `path`, or None on a miss.
+
+        The mapping is copy-on-write, so drawing into the returned Surface
+        never modifies the cache file.
+        """
+        entry = self._entry_path(path)
+        if entry is None or not os.path.exists(entry):
+            # the source changed (or vanished): drop entries for old versions
+            self._prune_source(path, None)
+            return None
+        try:
+            with open(entry, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, ver, chans, haskey, w, h, key = _HEADER.unpack_from(mm, 0)
+            if magic != _MAGIC or ver != _VERSION or chans not in (3, 4):
+                mm.close()
+                return None
+            if len(mm) != _HEADER.size + w * h * chans:
+                mm.close()
+                return None
+            pixels = memoryview(mm)[_HEADER.size:]
+            # frombuffer keeps a reference to the buffer, which keeps the map alive
+            surf = pygame.image.frombuffer(pixels, (w, h), "RGBA" if chans == 4 else "RGB")
+            if haskey:
+                surf.set_colorkey(tuple(key))
+            return surf
+        except Exception:
+            return None
+
+    def store(self, path: str, surf: pygame.Surface) -> bool:
+        """Write the decoded pixels of `surf` as the cache entry for `path`."""
+        entry = self._entry_path(path)
+        if entry is None:
+            return False
+        chans = 4 if surf.get_flags() & pygame.SRCALPHA else 3
+        colorkey = surf.get_colorkey()
+        key = bytes(tuple(colorkey)[:4]) if colorkey is not None else b"\0\0\0\0"
+        try:
+            data = pygame.image.tobytes(surf, "RGBA" if chans == 4 else "RGB")
+            w, h = surf.get_size()
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{entry}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, chans, colorkey is not None, w, h, key.ljust(4, b"\xff")))
+                f.write(data)
+            # atomic rename so concurrent sketches never map a partial file
+            os.replace(tmp, entry)
+            self._prune_source(path, entry)
+            return True
+        except Exception:
+            return False
+
+    def warm(self, paths: Iterable[str]) -> int:
+        """Decode and store every image in `paths` missing from the cache.
+
+        Returns the number of entries written.
+        """
+        written = 0
+        for p in paths:
+            if self.contains(p):
+                continue
+            try:
+                surf = pygame.image.load(p)
+            except Exception:
+                continue
+            if self.store(p, surf):
+                written += 1
+        return written
+
+    def clear(self) -> int:
+        """Remove every cache entry and return the number of files deleted."""
+        removed = 0
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return 0
+        for name in names:
+            if name.endswith(_SUFFIX) or name.endswith(".tmp"):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+def find_images(root: str) -> list[str]:
+    """Return image files below `root` (recursively) with a known extension."""
+    found: list[str] = []
+    for dirpath, _dirs, files in os.walk(root):
+        for name in files:
+            if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+                found.append(os.path.join(dirpath, name))
+    return sorted(found)
@@ -2,8 +2,9 @@
 pycreative.input: Unified event abstraction and dispatch for PyCreative.
 """
 
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import pygame
 
@@ -54,7 +55,7 @@ def dispatch_event(sketch, event: Any):
             q = getattr(sketch, "_pending_event_queue", None)
             if q is None:
                 try:
-                    sketch._pending_event_queue = []
+                    sketch._pending_event_queue = deque()
                     q = sketch._pending_event_queue
                 except Exception:
                     # If we cannot create the queue fall back to dropping events
@@ -225,6 +226,76 @@ def dispatch_event(sketch, event: Any):
         pass
 
 
+def _merge_motion(prev: Any, ev: Any) -> Any:
+    """Fold two consecutive MOUSEMOTION events into one (summing `rel`)."""
+    try:
+        data = dict(ev.dict)
+        pr = getattr(prev, "rel", None)
+        er = getattr(ev, "rel", None)
+        if pr is not None and er is not None:
+            data["rel"] = (pr[0] + er[0], pr[1] + er[1])
+        return pygame.event.Event(pygame.MOUSEMOTION, data)
+    except Exception:
+        return ev
+
+
+def dispatch_events(sketch, events: Iterable[Any]) -> None:
+    """
+    Dispatch one frame's worth of raw pygame events.
+
+    Events are appended to the sketch's pending deque and drained in FIFO
+    order. Every motion position is recorded in `sketch.mouse_path` (reset
+    each frame). With `sketch.coalesce_motion` enabled, consecutive motion
+    events with the same button state are merged so `mouse_moved()` /
+    `mouse_dragged()` run once per run of motion rather than once per
+    event. `sketch.max_events_per_frame` caps how many events are handled
+    per frame; the rest stay queued for the next frame. QUIT stops the
+    sketch immediately.
+    """
+    q = getattr(sketch, "_pending_event_queue", None)
+    if not isinstance(q, deque):
+        q = deque(q or ())
+        try:
+            sketch._pending_event_queue = q
+        except Exception:
+            pass
+    path = getattr(sketch, "mouse_path", None)
+    if path is None:
+        path = []
+        try:
+            sketch.mouse_path = path
+        except Exception:
+            pass
+    else:
+        path.clear()
+    coalesce = getattr(sketch, "coalesce_motion", False)
+    motion = pygame.MOUSEMOTION
+    for ev in events:
+        etype = ev.type
+        if etype == pygame.QUIT:
+            try:
+                sketch._running = False
+            except Exception:
+                pass
+            continue
+        if etype == motion:
+            pos = getattr(ev, "pos", None)
+            if pos is not None:
+                path.append((pos[0], pos[1]))
+            if coalesce and q:
+                last = q[-1]
+                if last.type == motion and getattr(last, "buttons", None) == getattr(ev, "buttons", None):
+                    q[-1] = _merge_motion(last, ev)
+                    continue
+        q.append(ev)
+
+    budget = getattr(sketch, "max_events_per_frame", None)
+    n = len(q) if budget is None else min(len(q), max(1, int(budget)))
+    popleft = q.popleft
+    for _ in range(n):
+        dispatch_event(sketch, popleft())
+
+
 def dispatch_event_now(sketch, event: Any):
     """
     Immediately dispatch a normalized Event to the sketch without any
@@ -0,0 +1,239 @@
+"""Named offscreen layers composited with per-layer dirty tracking.
+
+`Sketch.layers` is a `Layers` stack. Each `Layer` owns an offscreen buffer
+and a draw function, and is redrawn only when it is due:
+
+- `every=1` (default) redraws it every frame,
+- `every=N` every N frames,
+- `every=None` only on the first render and after `invalidate()`.
+
+`render()` composites the stack onto the sketch in z order. Everything
+below the lowest every-frame layer is flattened into one cached base
+image that is rebuilt only when one of those layers is redrawn or has its
+opacity, blend mode, visibility or order changed. A typical installation
+with a static background, a slow middle layer and a fast foreground then
+costs one base blit plus the foreground per frame instead of three full
+redraws.
+
+Flattening is exact only when the bottom of the cached run is an opaque,
+normally blended layer covering the whole target: the base then replaces
+the target outright. Otherwise (translucent or blended bottom layer) the
+cached layers are blitted one by one onto the target as usual.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Optional
+
+import pygame
+
+DrawFn = Callable[[Any], None]
+
+
+class Layer:
+    """One named layer; see `Layers.add()` for the parameters."""
+
+    def __init__(self, name: str, draw_fn: DrawFn, z: float, every: Optional[int], opacity: float, blend: Optional[str], x: int, y: int, size: tuple[int, int]) -> None:
+        self.name = name
+        self.draw_fn = draw_fn
+        self.z = z
+        self.every = None if every is None else max(1, int(every))
+        self.opacity = float(opacity)
+        self.blend = blend
+        self.visible = True
+        self.x = int(x)
+        self.y = int(y)
+        self.size = size
+        self.surface: Any = None
+        # bumped on every redraw; the compositor compares it to detect changes
+        self.version = 0
+        self.dirty = True
+        self.last_update: Optional[int] = None
+        # (version, fully opaque?) so the alpha scan runs once per redraw
+        self._opaque: tuple[int, bool] = (-1, False)
+
+    def invalidate(self) -> None:
+        """Redraw this layer on the next `render()`."""
+        self.dirty = True
+
+    def due(self, frame: int) -> bool:
+        if self.dirty or self.surface is None or self.last_update is None:
+            return True
+        return self.every is not None and frame - self.last_update >= self.every
+
+    def covers(self, size: tuple[int, int]) -> bool:
+        """True if this layer, blitted normally, fully replaces a target of `size`."""
+        if self.surface is None or self.opacity < 1.0 or self.blend not in (None, "BLEND"):
+            return False
+        w, h = self.size
+        if self.x > 0 or self.y > 0 or self.x + w < size[0] or self.y + h < size[1]:
+            return False
+        if self._opaque[0] != self.version:
+            raw = self.surface.raw
+            if raw.get_flags() & pygame.SRCALPHA:
+                opaque = pygame.mask.from_surface(raw, 254).count() == w * h
+            else:
+                opaque = raw.get_alpha() is None
+            self._opaque = (self.version, opaque)
+        return self._opaque[1]
+
+    def _signature(self) -> tuple:
+        return (self.name, self.version, self.z, self.opacity, self.blend, self.visible, self.x, self.y)
+
+
+class Layers:
+    """Z-ordered stack of `Layer`s belonging to a sketch."""
+
+    def __init__(self, sketch: Any) -> None:
+        self.sketch = sketch
+        self._layers: dict[str, Layer] = {}
+        self._order: list[Layer] = []
+        self._base: Any = None
+        self._base_sig: Optional[tuple] = None
+        self._next_z = 0.0
+        self.updates = 0
+        self.base_rebuilds = 0
+        self.blits = 0
+
+    # --- managing layers ---
+    def add(self, name: str, draw_fn: DrawFn, z: Optional[float] = None, every: Optional[int] = 1, opacity: float = 1.0, blend: Optional[str] = None, x: int = 0, y: int = 0, size: Optional[tuple[int, int]] = None) -> Layer:
+        """Add (or replace) layer `name` drawn by `draw_fn(g)`.
+
+        `z` orders layers bottom to top (default: above every existing
+        layer); `every` is the redraw period in frames (None = on demand);
+        `opacity` is 0..1; `blend` is a blend mode constant such as
+        `Sketch.ADD` (None draws normally); `size` defaults to the sketch
+        size and the layer is placed at (x, y).
+        """
+        if z is None:
+            z = self._next_z
+        self._next_z = max(self._next_z, float(z) + 1.0)
+        if size is None:
+            size = (int(self.sketch.width), int(self.sketch.height))
+        layer = Layer(name, draw_fn, z, every, opacity, blend, x, y, (int(size[0]), int(size[1])))
+        self._layers[name] = layer
+        self._reorder()
+        return layer
+
+    def remove(self, name: str) -> None:
+        if self._layers.pop(name, None) is not None:
+            self._reorder()
+
+    def __getitem__(self, name: str) -> Layer:
+        return self._layers[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._layers
+
+    def __iter__(self) -> Iterator[Layer]:
+        self._reorder()
+        return iter(list(self._order))
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Redraw one layer (or all layers) on the next `render()`."""
+        for layer in self._layers.values():
+            if name is None or layer.name == name:
+                layer.dirty = True
+
+    def _reorder(self) -> None:
+        self._order = sorted(self._layers.values(), key=lambda layer: layer.z)
+
+    # --- rendering ---
+    def update(self, frame: Optional[int] = None) -> int:
+        """Redraw every layer that is due; returns how many were redrawn."""
+        frame = int(self.sketch.frame_count) if frame is None else frame
+        n = 0
+        for layer in self._layers.values():
+            if layer.visible and layer.due(frame):
+                self._redraw(layer, frame)
+                n += 1
+        return n
+
+    def _redraw(self, layer: Layer, frame: int) -> None:
+        g = layer.surface
+        if g is None or g.raw.get_size() != layer.size:
+            g = layer.surface = self.sketch.create_graphics(*layer.size)
+        else:
+            g.raw.fill((0, 0, 0, 0))
+            g._reset_state()
+        try:
+            with g:
+                layer.draw_fn(g)
+        except Exception as exc:
+            print(f"[pycreative.layers] layer {layer.name!r} draw failed: {exc}")
+        layer.version += 1
+        layer.dirty = False
+        layer.last_update = frame
+        self.updates += 1
+
+    def render(self, target: Any = None) -> None:
+        """Update due layers and composite the stack onto `target` (default: the sketch)."""
+        surface = getattr(target if target is not None else self.sketch, "surface", target)
+        if surface is None:
+            return
+        dst = getattr(surface, "raw", surface)
+        self._reorder()
+        self.update()
+        order = self._order
+        # layers below the lowest every-frame layer change rarely: cache them
+        split = len(order)
+        for i, layer in enumerate(order):
+            if layer.every == 1 and layer.visible:
+                split = i
+                break
+        lower = [layer for layer in order[:split] if layer.visible]
+        if len(lower) >= 2 and lower[0].covers(dst.get_size()):
+            self._blit_base(dst, lower)
+            rest = order[split:]
+        else:
+            self._base = None
+            self._base_sig = None
+            rest = order
+        for layer in rest:
+            self._blit(dst, layer)
+
+    def _blit_base(self, dst: pygame.Surface, lower: list[Layer]) -> None:
+        sig = tuple(layer._signature() for layer in lower)
+        size = dst.get_size()
+        flags = dst.get_flags() & pygame.SRCALPHA
+        base = self._base
+        if base is None or base.get_size() != size or base.get_flags() & pygame.SRCALPHA != flags or sig != self._base_sig:
+            if base is None or base.get_size() != size or base.get_flags() & pygame.SRCALPHA != flags:
+                # same pixel format as the target so blends land identically
+                base = self._base = pygame.Surface(size, flags, dst)
+            # lower[0] is opaque and covers the base, so no clear is needed
+            for layer in lower:
+                self._blit(base, layer)
+            self._base_sig = sig
+            self.base_rebuilds += 1
+        dst.blit(base, (0, 0))
+        self.blits += 1
+
+    def _blit(self, dst: pygame.Surface, layer: Layer) -> None:
+        if not layer.visible or layer.surface is None or layer.opacity <= 0.0:
+            return
+        src = layer.surface.raw
+        fade = layer.opacity < 1.0
+        if fade:
+            src.set_alpha(int(round(layer.opacity * 255)))
+        try:
+            if layer.blend is None or layer.blend == "BLEND":
+                dst.blit(src, (layer.x, layer.y))
+            else:
+                from .blending import apply_blit_with_blend
+
+                apply_blit_with_blend(dst, src, layer.x, layer.y, layer.blend)
+        finally:
+            if fade:
+                src.set_alpha(255)
+        self.blits += 1
+
+    def stats(self) -> dict:
+        return {
+            "layers": len(self._layers),
+            "updates": self.updates,
+            "base_rebuilds": self.base_rebuilds,
+            "blits": self.blits,
+        }
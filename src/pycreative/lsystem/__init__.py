@@ -0,0 +1,15 @@
+"""L-systems with lazy expansion and batched turtle rendering (Nature of Code 8.6).
+
+- `LSystem` expands its axiom on demand: `chunks()` streams the sentence of
+  the current generation as string pieces without ever building it in
+  full, reusing memoized expansions of short (symbol, depth) pairs.
+- `Turtle` interprets a sentence into flat (N, 4) segment arrays, merging
+  consecutive collinear steps, and draws them with one batched `lines()`
+  call, optionally from a cached offscreen image.
+
+Requires NumPy (the `numeric` extra).
+"""
+from .system import LSystem
+from .turtle import Turtle
+
+__all__ = ["LSystem", "Turtle"]
@@ -0,0 +1,96 @@
+"""Lazy, memoized L-system expansion."""
+from __future__ import annotations
+
+from itertools import chain
+from typing import Iterator, Mapping, Optional
+
+# expansions up to this many characters are kept as strings and reused
+MEMO_MAX_LEN = 4096
+_MEMO_MAX_ENTRIES = 4096
+
+
+class LSystem:
+    """Axiom plus rewriting rules; `generate()` advances one generation.
+
+    Unlike Example 8.9, `generate()` does no string work: it only bumps
+    `generation`. The sentence is produced lazily by `chunks()` (string
+    pieces) or `expand()` (single symbols) by recursively rewriting each
+    axiom symbol to the requested depth. Expansions of (symbol, depth) no
+    longer than `MEMO_MAX_LEN` are built once and reused, so repeated
+    sub-trees cost a dictionary lookup.
+    """
+
+    def __init__(self, axiom: str, rules: Mapping[str, str]) -> None:
+        self.axiom = axiom
+        self.rules = dict(rules)
+        self.generation = 0
+        self._memo: dict[tuple[str, int], str] = {}
+        self._lengths: dict[tuple[str, int], int] = {}
+
+    @property
+    def key(self) -> tuple:
+        """Hashable identity of the current sentence (for caching drawings)."""
+        return (self.axiom, tuple(sorted(self.rules.items())), self.generation)
+
+    def generate(self, n: int = 1) -> "LSystem":
+        """Advance `n` generations (lazily)."""
+        self.generation += int(n)
+        return self
+
+    def reset(self) -> "LSystem":
+        self.generation = 0
+        return self
+
+    def set_rules(self, rules: Mapping[str, str]) -> None:
+        """Replace the ruleset and drop memoized expansions."""
+        self.rules = dict(rules)
+        self._memo.clear()
+        self._lengths.clear()
+
+    # --- expansion ---
+    def symbol_length(self, symbol: str, depth: int) -> int:
+        """Length of `symbol` rewritten `depth` times, without expanding it."""
+        if depth <= 0 or symbol not in self.rules:
+            return 1
+        key = (symbol, depth)
+        n = self._lengths.get(key)
+        if n is None:
+            n = sum(self.symbol_length(c, depth - 1) for c in self.rules[symbol])
+            self._lengths[key] = n
+        return n
+
+    def __len__(self) -> int:
+        return sum(self.symbol_length(c, self.generation) for c in self.axiom)
+
+    def _chunks(self, symbol: str, depth: int) -> Iterator[str]:
+        if depth <= 0 or symbol not in self.rules:
+            yield symbol
+            return
+        key = (symbol, depth)
+        hit = self._memo.get(key)
+        if hit is not None:
+            yield hit
+            return
+        if self.symbol_length(symbol, depth) <= MEMO_MAX_LEN:
+            text = "".join(chain.from_iterable(self._chunks(c, depth - 1) for c in self.rules[symbol]))
+            if len(self._memo) < _MEMO_MAX_ENTRIES:
+                self._memo[key] = text
+            yield text
+            return
+        for c in self.rules[symbol]:
+            yield from self._chunks(c, depth - 1)
+
+    def chunks(self, depth: Optional[int] = None) -> Iterator[str]:
+        """Stream the sentence at `depth` (default: current generation) as string pieces."""
+        d = self.generation if depth is None else int(depth)
+        for c in self.axiom:
+            yield from self._chunks(c, d)
+
+    def expand(self, depth: Optional[int] = None) -> Iterator[str]:
+        """Stream the sentence one symbol at a time."""
+        return chain.from_iterable(self.chunks(depth))
+
+    @property
+    def sentence(self) -> str:
+        """The full current sentence (materialized; prefer `chunks()` for large ones)."""
+        return "".join(self.chunks())
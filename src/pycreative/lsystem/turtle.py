@@ -0,0 +1,243 @@
+"""Turtle interpretation of L-system sentences into segment arrays."""
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+import math
+
+import numpy as np
+
+# chunks at least this long have their local geometry traced once and reused
+_GEOMETRY_MIN_LEN = 32
+_GEOMETRY_CACHE_MAX = 1024
+_TRACE_CACHE_MAX = 8
+_IMAGE_CACHE_MAX = 4
+
+
+class _Unbalanced(Exception):
+    pass
+
+
+class Turtle:
+    """Interprets turtle symbols into an (N, 4) array of line segments.
+
+    Symbols: `draw` characters (default "FG") step forward drawing a line,
+    `move` characters ("f") step without drawing, "+"/"-" turn by
+    `angle` radians, "[" and "]" push and pop the turtle state. Other
+    symbols are ignored. The turtle starts at the origin facing `heading`
+    (up the screen by default), like the push/translate/rotate turtle of
+    Example 8.9 drawn after `translate(width / 2, height)`.
+
+    Consecutive steps along the same heading are merged into one segment.
+    Chunks produced by `LSystem.chunks()` repeat heavily, so each distinct
+    chunk with balanced brackets is traced once at the origin and then
+    placed by rotating and translating its segment array.
+    """
+
+    def __init__(self, length: float = 10.0, angle: float = math.radians(25), heading: float = -math.pi / 2, draw: str = "FG", move: str = "f") -> None:
+        self.length = float(length)
+        self.angle = float(angle)
+        self.heading = float(heading)
+        self.draw_symbols = draw
+        self.move_symbols = move
+        self._params: tuple = ()
+        self._dirs: dict[int, tuple[float, float]] = {}
+        self._geometry: "OrderedDict[str, Optional[tuple[Any, float, float, int]]]" = OrderedDict()
+        self._traces: "OrderedDict[Any, Any]" = OrderedDict()
+        self._images: "OrderedDict[Any, tuple[Any, float, float]]" = OrderedDict()
+
+    def _check_params(self) -> None:
+        params = (self.length, self.angle, self.heading, self.draw_symbols, self.move_symbols)
+        if params != self._params:
+            self._params = params
+            self._dirs.clear()
+            self._geometry.clear()
+            self._traces.clear()
+            self._images.clear()
+
+    def _dir(self, k: int) -> tuple[float, float]:
+        d = self._dirs.get(k)
+        if d is None:
+            h = self.heading + k * self.angle
+            d = (math.cos(h) * self.length, math.sin(h) * self.length)
+            self._dirs[k] = d
+        return d
+
+    def _walk(self, text: str, x: float, y: float, k: int, stack: list, out: Any, joined: bool, strict: bool) -> tuple[float, float, int, bool]:
+        draw = self.draw_symbols
+        move = self.move_symbols
+        dirs = self._dirs
+        for c in text:
+            if c in draw:
+                d = dirs.get(k) or self._dir(k)
+                nx = x + d[0]
+                ny = y + d[1]
+                if joined:
+                    out[-2] = nx
+                    out[-1] = ny
+                else:
+                    out.extend((x, y, nx, ny))
+                    joined = True
+                x = nx
+                y = ny
+            elif c == "+":
+                k += 1
+                joined = False
+            elif c == "-":
+                k -= 1
+                joined = False
+            elif c == "[":
+                stack.append((x, y, k))
+            elif c == "]":
+                if not stack:
+                    if strict:
+                        raise _Unbalanced()
+                    continue
+                x, y, k = stack.pop()
+                joined = False
+            elif c in move:
+                d = dirs.get(k) or self._dir(k)
+                x += d[0]
+                y += d[1]
+                joined = False
+        return x, y, k, joined
+
+    def _chunk_geometry(self, chunk: str) -> Optional[tuple[Any, float, float, int]]:
+        if chunk in self._geometry:
+            self._geometry.move_to_end(chunk)
+            return self._geometry[chunk]
+        stack: list = []
+        out = array("d")
+        try:
+            ex, ey, ek, _ = self._walk(chunk, 0.0, 0.0, 0, stack, out, False, True)
+            geom: Optional[tuple[Any, float, float, int]] = None
+            if not stack:
+                geom = (np.frombuffer(out, dtype=np.float64).reshape(-1, 4), ex, ey, ek)
+        except _Unbalanced:
+            geom = None
+        self._geometry[chunk] = geom
+        if len(self._geometry) > _GEOMETRY_CACHE_MAX:
+            self._geometry.popitem(last=False)
+        return geom
+
+    def trace(self, source: Any) -> Any:
+        """Segments for an LSystem, a sentence string or an iterable of chunks.
+
+        Returns a float64 array of shape (N, 4) holding (x1, y1, x2, y2) rows.
+        """
+        self._check_params()
+        chunks: Iterable[str]
+        if isinstance(source, str):
+            chunks = (source,)
+        elif hasattr(source, "chunks"):
+            chunks = source.chunks()
+        else:
+            chunks = source
+        parts: list[Any] = []
+        out = array("d")
+        stack: list = []
+        x = y = 0.0
+        k = 0
+        joined = False
+        for chunk in chunks:
+            geom = self._chunk_geometry(chunk) if len(chunk) >= _GEOMETRY_MIN_LEN else None
+            if geom is None:
+                x, y, k, joined = self._walk(chunk, x, y, k, stack, out, joined, False)
+                continue
+            segs, ex, ey, ek = geom
+            if len(out):
+                parts.append(np.frombuffer(out, dtype=np.float64).reshape(-1, 4))
+                out = array("d")
+            theta = k * self.angle
+            c = math.cos(theta)
+            s = math.sin(theta)
+            if len(segs):
+                placed = np.empty_like(segs)
+                placed[:, 0::2] = x + c * segs[:, 0::2] - s * segs[:, 1::2]
+                placed[:, 1::2] = y + s * segs[:, 0::2] + c * segs[:, 1::2]
+                parts.append(placed)
+            x, y = x + c * ex - s * ey, y + s * ex + c * ey
+            k += ek
+            joined = False
+        if len(out):
+            parts.append(np.frombuffer(out, dtype=np.float64).reshape(-1, 4))
+        if not parts:
+            return np.empty((0, 4), dtype=np.float64)
+        return np.concatenate(parts)
+
+    def segments(self, source: Any) -> Any:
+        """`trace(source)`, cached for LSystems (by `key`) and strings."""
+        self._check_params()
+        key = source.key if hasattr(source, "key") else source if isinstance(source, str) else None
+        if key is None:
+            return self.trace(source)
+        hit = self._traces.get(key)
+        if hit is None:
+            hit = self.trace(source)
+            self._traces[key] = hit
+            if len(self._traces) > _TRACE_CACHE_MAX:
+                self._traces.popitem(last=False)
+        else:
+            self._traces.move_to_end(key)
+        return hit
+
+    def bounds(self, source: Any) -> tuple[float, float, float, float]:
+        """(x, y, w, h) bounding box of the traced drawing."""
+        segs = self.segments(source)
+        if len(segs) == 0:
+            return (0.0, 0.0, 0.0, 0.0)
+        xs = segs[:, 0::2]
+        ys = segs[:, 1::2]
+        x0 = float(xs.min())
+        y0 = float(ys.min())
+        return (x0, y0, float(xs.max()) - x0, float(ys.max()) - y0)
+
+    def draw(self, target: Any, source: Any, x: float = 0, y: float = 0, color: Any = None, weight: Optional[int] = None, cache: bool = False) -> None:
+        """Draw `source` with its origin at (x, y) using one batched `lines()` call.
+
+        With `cache=True` the drawing is rendered once into an offscreen
+        image (per sentence, colour and weight) and later calls just draw
+        that image, which suits sketches that redraw a finished plant every
+        frame.
+        """
+        surface = getattr(target, "surface", target)
+        if surface is None:
+            return
+        segs = self.segments(source)
+        if len(segs) == 0:
+            return
+        if color is None:
+            color = getattr(surface, "_stroke", (0, 0, 0))
+        w = int(weight) if weight is not None else int(getattr(surface, "_stroke_weight", 1))
+        if not cache:
+            surface.lines(segs + (x, y, x, y), color=color, width=w)
+            return
+        key = (source.key if hasattr(source, "key") else source, tuple(color) if color is not None else None, w)
+        hit = self._images.get(key)
+        if hit is None:
+            hit = self._render_image(segs, color, w)
+            self._images[key] = hit
+            if len(self._images) > _IMAGE_CACHE_MAX:
+                self._images.popitem(last=False)
+        img, ox, oy = hit
+        surface.image(img, x + ox, y + oy)
+
+    def _render_image(self, segs: Any, color: Any, weight: int) -> tuple[Any, float, float]:
+        import pygame
+
+        from ..graphics import OffscreenSurface
+
+        pad = weight + 1
+        ox = math.floor(float(segs[:, 0::2].min())) - pad
+        oy = math.floor(float(segs[:, 1::2].min())) - pad
+        w = int(math.ceil(float(segs[:, 0::2].max()) - ox)) + pad + 1
+        h = int(math.ceil(float(segs[:, 1::2].max()) - oy)) + pad + 1
+        off = OffscreenSurface(pygame.Surface((w, h), pygame.SRCALPHA))
+        off.lines(segs - (ox, oy, ox, oy), color=color, width=weight)
+        return off, float(ox), float(oy)
+
+    def clear_cache(self) -> None:
+        """Drop cached traces, chunk geometry and offscreen images."""
+        self._params = ()
+        self._check_params()
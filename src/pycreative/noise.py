@@ -1,30 +1,72 @@
-"""Pure-Python Perlin noise implementation (1D) with optional seeding.
+"""Pure-Python Perlin noise implementation (1D/2D/3D) with optional seeding.
 
 This module provides a lightweight PerlinNoise class and convenience
-functions `noise(x)` and `seed(s)` backed by a module-level instance.
+functions `noise(x[, y[, z]])`, `noise_detail(octaves, falloff)` and
+`seed(s)` backed by a module-level instance.
+
+`noise_detail` sums several octaves inside the generator: octave `i` is
+sampled at frequency `2**i` with weight `falloff**i` and the sum is divided
+by the total weight, so output stays in [0, 1]. The default of one octave
+reproduces plain single-octave noise exactly.
 
 The noise output is normalized to the range [0, 1], which matches
 Processing's noise() expectations for examples in this repository.
+
+`noise_array(coords)` and `noise_grid(xs, ys)` evaluate many points at once
+with NumPy (imported lazily, only when these are used). They share the
+permutation table of the scalar generator and perform the same floating
+point operations in the same order, so results are bit-for-bit identical to
+calling `noise()` per point.
 """
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Optional
 import math
 import random
 
 
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as e:  # pragma: no cover - numpy is an optional extra
+        raise ImportError("vectorized noise requires numpy (pip install pycreative[numeric])") from e
+    return np
+
+
+# Gradient vectors indexed by (hash & 7) for 2D noise
+_GRAD2 = ((1, 1), (-1, 1), (1, -1), (-1, -1), (1, 0), (-1, 0), (0, 1), (0, -1))
+# Improved-noise gradients indexed by (hash & 15) for 3D noise
+_GRAD3 = (
+    (1, 1, 0), (-1, 1, 0), (1, -1, 0), (-1, -1, 0),
+    (1, 0, 1), (-1, 0, 1), (1, 0, -1), (-1, 0, -1),
+    (0, 1, 1), (0, -1, 1), (0, 1, -1), (0, -1, -1),
+    (1, 1, 0), (-1, 1, 0), (0, -1, 1), (0, -1, -1),
+)
+
+
 class PerlinNoise:
-    """A minimal 1D Perlin noise generator.
+    """A minimal 1D/2D/3D Perlin noise generator.
 
     Uses a shuffled permutation table seeded via the provided integer seed.
+    `octaves` and `falloff` control fractal summation in `sample()`.
     """
 
-    def __init__(self, seed: Optional[int] = None) -> None:
+    def __init__(self, seed: Optional[int] = None, octaves: int = 1, falloff: float = 0.5) -> None:
         self._rand = random.Random(seed)
         # Classic Perlin uses a 256-entry permutation table duplicated
         p = list(range(256))
         self._rand.shuffle(p)
         self.perm = p + p
+        self.octaves = max(1, int(octaves))
+        self.falloff = float(falloff)
+        # NumPy copy of `perm`, built on first vectorized call
+        self._perm_np: Any = None
+
+    def _perm_array(self) -> Any:
+        if self._perm_np is None:
+            np = _numpy()
+            self._perm_np = np.asarray(self.perm, dtype=np.intp)
+        return self._perm_np
 
     @staticmethod
     def _fade(t: float) -> float:
@@ -61,27 +103,17 @@ class PerlinNoise:
         # Perlin output is typically in -1..1; normalize to 0..1
         return (val + 1.0) * 0.5
 
-    def _grad2(self, hashval: int, x: float, y: float) -> float:
-        # 2D gradient selection: use low 3 bits to pick one of 8 unit vectors
-        h = hashval & 7
-        if h == 0:
-            gx, gy = 1, 1
-        elif h == 1:
-            gx, gy = -1, 1
-        elif h == 2:
-            gx, gy = 1, -1
-        elif h == 3:
-            gx, gy = -1, -1
-        elif h == 4:
-            gx, gy = 1, 0
-        elif h == 5:
-            gx, gy = -1, 0
-        elif h == 6:
-            gx, gy = 0, 1
-        else:
-            gx, gy = 0, -1
+    @staticmethod
+    def _grad2(hashval: int, x: float, y: float) -> float:
+        # 2D gradient selection: use low 3 bits to pick one of 8 vectors
+        gx, gy = _GRAD2[hashval & 7]
         return gx * x + gy * y
 
+    @staticmethod
+    def _grad3(hashval: int, x: float, y: float, z: float) -> float:
+        gx, gy, gz = _GRAD3[hashval & 15]
+        return gx * x + gy * y + gz * z
+
     def noise2d(self, x: float, y: float) -> float:
         """Compute 2D Perlin noise for coordinates (x,y). Returns value in [0,1]."""
         xi = math.floor(x) & 255
@@ -109,29 +141,278 @@ class PerlinNoise:
 
         return (val + 1.0) * 0.5
 
+    def noise3d(self, x: float, y: float, z: float) -> float:
+        """Compute 3D Perlin noise for (x,y,z). Returns value in [0,1]."""
+        perm = self.perm
+        xi = math.floor(x) & 255
+        yi = math.floor(y) & 255
+        zi = math.floor(z) & 255
+        xf = x - math.floor(x)
+        yf = y - math.floor(y)
+        zf = z - math.floor(z)
+
+        u = self._fade(xf)
+        v = self._fade(yf)
+        w = self._fade(zf)
+
+        a = perm[xi] + yi
+        b = perm[xi + 1] + yi
+        aa = perm[a] + zi
+        ab = perm[a + 1] + zi
+        ba = perm[b] + zi
+        bb = perm[b + 1] + zi
+
+        g = self._grad3
+        x1 = self._lerp(g(perm[aa], xf, yf, zf), g(perm[ba], xf - 1, yf, zf), u)
+        x2 = self._lerp(g(perm[ab], xf, yf - 1, zf), g(perm[bb], xf - 1, yf - 1, zf), u)
+        y1 = self._lerp(x1, x2, v)
+        x1 = self._lerp(g(perm[aa + 1], xf, yf, zf - 1), g(perm[ba + 1], xf - 1, yf, zf - 1), u)
+        x2 = self._lerp(g(perm[ab + 1], xf, yf - 1, zf - 1), g(perm[bb + 1], xf - 1, yf - 1, zf - 1), u)
+        y2 = self._lerp(x1, x2, v)
+        val = self._lerp(y1, y2, w)
+
+        return (val + 1.0) * 0.5
+
+    def detail(self, octaves: int, falloff: Optional[float] = None) -> None:
+        """Set octave count and per-octave amplitude falloff (Processing's noiseDetail)."""
+        self.octaves = max(1, int(octaves))
+        if falloff is not None:
+            self.falloff = float(falloff)
+
+    def sample(self, x: float, y: Optional[float] = None, z: Optional[float] = None) -> float:
+        """Fractal (multi-octave) noise in 1, 2 or 3 dimensions, in [0,1]."""
+        if y is None:
+            return self._fractal(self.noise1d, (x,))
+        if z is None:
+            return self._fractal(self.noise2d, (x, y))
+        return self._fractal(self.noise3d, (x, y, z))
+
+    def sample_array(self, xs: Any, ys: Any = None, zs: Any = None) -> Any:
+        """Vectorized `sample`; arrays are broadcast together.
+
+        Identical, bit for bit, to calling `sample` per element.
+        """
+        np = _numpy()
+        x = np.asarray(xs, dtype=np.float64)
+        if ys is None:
+            return self._fractal(self.noise1d_array, (x,))
+        y = np.asarray(ys, dtype=np.float64)
+        if zs is None:
+            return self._fractal(self.noise2d_array, (x, y))
+        return self._fractal(self.noise3d_array, (x, y, np.asarray(zs, dtype=np.float64)))
+
+    def _fractal(self, fn: Any, coords: tuple) -> Any:
+        # Shared by scalar and array paths so both perform the same float ops
+        if self.octaves == 1:
+            return fn(*coords)
+        total: Any = 0.0
+        norm = 0.0
+        amp = 1.0
+        freq = 1.0
+        for _ in range(self.octaves):
+            total = total + amp * fn(*(c * freq for c in coords))
+            norm += amp
+            amp *= self.falloff
+            freq *= 2.0
+        return total / norm
+
+    # --- vectorized variants (NumPy) ---
+    def noise1d_array(self, xs: Any) -> Any:
+        """Vectorized `noise1d` over an array of x coordinates."""
+        np = _numpy()
+        perm = self._perm_array()
+        x = np.asarray(xs, dtype=np.float64)
+        fl = np.floor(x)
+        xi = fl.astype(np.intp) & 255
+        xf = x - fl
+        u = xf * xf * xf * (xf * (xf * 6 - 15) + 10)
+        a = perm[xi]
+        b = perm[xi + 1]
+        ga = np.where((a & 1) == 0, xf, -xf)
+        xf1 = xf - 1
+        gb = np.where((b & 1) == 0, xf1, -xf1)
+        val = ga + u * (gb - ga)
+        return (val + 1.0) * 0.5
+
+    def noise2d_array(self, xs: Any, ys: Any) -> Any:
+        """Vectorized `noise2d`; `xs` and `ys` are broadcast together."""
+        np = _numpy()
+        perm = self._perm_array()
+        x, y = np.broadcast_arrays(np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64))
+        flx = np.floor(x)
+        fly = np.floor(y)
+        xi = flx.astype(np.intp) & 255
+        yi = fly.astype(np.intp) & 255
+        xf = x - flx
+        yf = y - fly
+        u = xf * xf * xf * (xf * (xf * 6 - 15) + 10)
+        v = yf * yf * yf * (yf * (yf * 6 - 15) + 10)
+
+        pa = perm[xi]
+        pb = perm[xi + 1]
+        aa = perm[pa + yi]
+        ab = perm[pa + yi + 1]
+        ba = perm[pb + yi]
+        bb = perm[pb + yi + 1]
+
+        gx, gy = _grad2_tables(np)
+        xf1 = xf - 1
+        yf1 = yf - 1
+        h = aa & 7
+        ga = gx[h] * xf + gy[h] * yf
+        h = ba & 7
+        gb = gx[h] * xf1 + gy[h] * yf
+        h = ab & 7
+        gc = gx[h] * xf + gy[h] * yf1
+        h = bb & 7
+        gd = gx[h] * xf1 + gy[h] * yf1
+
+        x1 = ga + u * (gb - ga)
+        x2 = gc + u * (gd - gc)
+        val = x1 + v * (x2 - x1)
+        return (val + 1.0) * 0.5
+
+    def noise3d_array(self, xs: Any, ys: Any, zs: Any) -> Any:
+        """Vectorized `noise3d`; `xs`, `ys` and `zs` are broadcast together."""
+        np = _numpy()
+        perm = self._perm_array()
+        x, y, z = np.broadcast_arrays(
+            np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64), np.asarray(zs, dtype=np.float64)
+        )
+        flx = np.floor(x)
+        fly = np.floor(y)
+        flz = np.floor(z)
+        xi = flx.astype(np.intp) & 255
+        yi = fly.astype(np.intp) & 255
+        zi = flz.astype(np.intp) & 255
+        xf = x - flx
+        yf = y - fly
+        zf = z - flz
+        u = xf * xf * xf * (xf * (xf * 6 - 15) + 10)
+        v = yf * yf * yf * (yf * (yf * 6 - 15) + 10)
+        w = zf * zf * zf * (zf * (zf * 6 - 15) + 10)
+
+        a = perm[xi] + yi
+        b = perm[xi + 1] + yi
+        aa = perm[a] + zi
+        ab = perm[a + 1] + zi
+        ba = perm[b] + zi
+        bb = perm[b + 1] + zi
+
+        gx, gy, gz = _grad3_tables(np)
+        xf1 = xf - 1
+        yf1 = yf - 1
+        zf1 = zf - 1
+
+        def g(hv: Any, px: Any, py: Any, pz: Any) -> Any:
+            h = hv & 15
+            return gx[h] * px + gy[h] * py + gz[h] * pz
+
+        x1 = g(perm[aa], xf, yf, zf)
+        x1 = x1 + u * (g(perm[ba], xf1, yf, zf) - x1)
+        x2 = g(perm[ab], xf, yf1, zf)
+        x2 = x2 + u * (g(perm[bb], xf1, yf1, zf) - x2)
+        y1 = x1 + v * (x2 - x1)
+        x1 = g(perm[aa + 1], xf, yf, zf1)
+        x1 = x1 + u * (g(perm[ba + 1], xf1, yf, zf1) - x1)
+        x2 = g(perm[ab + 1], xf, yf1, zf1)
+        x2 = x2 + u * (g(perm[bb + 1], xf1, yf1, zf1) - x2)
+        y2 = x1 + v * (x2 - x1)
+        val = y1 + w * (y2 - y1)
+        return (val + 1.0) * 0.5
+
+
+_grad2_np: Any = None
+_grad3_np: Any = None
+
+
+def _grad2_tables(np: Any) -> Any:
+    global _grad2_np
+    if _grad2_np is None:
+        _grad2_np = (
+            np.array([g[0] for g in _GRAD2], dtype=np.float64),
+            np.array([g[1] for g in _GRAD2], dtype=np.float64),
+        )
+    return _grad2_np
+
+
+def _grad3_tables(np: Any) -> Any:
+    global _grad3_np
+    if _grad3_np is None:
+        _grad3_np = tuple(np.array([g[i] for g in _GRAD3], dtype=np.float64) for i in range(3))
+    return _grad3_np
+
 
 # Module-level default generator
 _default = PerlinNoise()
 
 
 def noise(*args) -> float:
-    """Convenience function: compute 1D or 2D noise using the module default.
+    """Convenience function: compute 1D, 2D or 3D noise using the module default.
 
     Usage:
       noise(x)
       noise(x, y)
+      noise(x, y, z)
     """
     try:
         if len(args) == 1:
-            return _default.noise1d(float(args[0]))
+            return _default.sample(float(args[0]))
         elif len(args) == 2:
-            return _default.noise2d(float(args[0]), float(args[1]))
+            return _default.sample(float(args[0]), float(args[1]))
+        elif len(args) == 3:
+            return _default.sample(float(args[0]), float(args[1]), float(args[2]))
     except Exception:
         pass
     return 0.0
 
 
+def noise_detail(octaves: int, falloff: Optional[float] = None) -> None:
+    """Set octaves and falloff of the module-level generator."""
+    _default.detail(octaves, falloff)
+
+
 def seed(s: Optional[int]) -> None:
-    """Reseed the module-level noise generator. Pass None to reseed randomly."""
+    """Reseed the module-level noise generator. Pass None to reseed randomly.
+
+    The current `noise_detail` settings are kept.
+    """
     global _default
-    _default = PerlinNoise(s)
+    _default = PerlinNoise(s, _default.octaves, _default.falloff)
+
+
+def noise_array(coords: Any) -> Any:
+    """Compute noise for many points at once using the module default.
+
+    `coords` is an array of shape (N,) for 1D noise, or (N, 2) / (N, 3) for
+    2D / 3D noise (any leading shape works; the last axis holds the
+    dimensions). Returns a float64 array with the leading shape.
+    """
+    np = _numpy()
+    c = np.asarray(coords, dtype=np.float64)
+    if c.ndim == 0 or c.ndim == 1:
+        return _default.sample_array(c)
+    if c.shape[-1] == 1:
+        return _default.sample_array(c[..., 0])
+    if c.shape[-1] == 2:
+        return _default.sample_array(c[..., 0], c[..., 1])
+    if c.shape[-1] == 3:
+        return _default.sample_array(c[..., 0], c[..., 1], c[..., 2])
+    raise ValueError("noise_array expects coordinates of shape (N,), (N, 2) or (N, 3)")
+
+
+def noise_grid(xs: Any, ys: Any = None, z: Any = None) -> Any:
+    """Evaluate noise on the grid spanned by 1D arrays `xs` and `ys`.
+
+    Returns an array of shape (len(ys), len(xs)) where `[j, i]` equals
+    `noise(xs[i], ys[j])`, or `noise(xs[i], ys[j], z)` when the scalar `z`
+    (e.g. time) is given. With `ys` omitted, returns 1D noise for `xs`.
+    """
+    np = _numpy()
+    x = np.asarray(xs, dtype=np.float64)
+    if ys is None:
+        return _default.sample_array(x)
+    y = np.asarray(ys, dtype=np.float64)
+    if z is None:
+        return _default.sample_array(x[np.newaxis, :], y[:, np.newaxis])
+    return _default.sample_array(x[np.newaxis, :], y[:, np.newaxis], float(z))
@@ -0,0 +1,240 @@
+"""Precomputed (optionally tileable) noise textures.
+
+Sketches that sample the same static noise field every frame pay for the
+full Perlin evaluation each time. A `NoiseField` evaluates the field once,
+on a worker thread, into a float array of shape (height, width) with values
+in [0, 1]. Lookups are then O(1) bilinear interpolations, and `to_surface()`
+returns a grayscale `OffscreenSurface` ready to draw.
+
+Fields are cached in-process by (seed, scale, size, octaves, falloff,
+tileable). With a cache directory configured (argument or the
+`PYCREATIVE_NOISE_CACHE` environment variable) seeded fields are also
+stored as `.npy` files so later runs load them instead of recomputing.
+
+Requires NumPy (the `numeric` extra).
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+from .noise import PerlinNoise
+
+ENV_VAR = "PYCREATIVE_NOISE_CACHE"
+
+# In-process cache of computed fields keyed by NoiseField.key
+_memory: dict[tuple, Any] = {}
+_memory_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def default_cache_dir() -> str:
+    """Return the per-user default noise cache directory (XDG-style)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pycreative", "noise")
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pycreative-noise")
+    return _executor
+
+
+def compute_field(width: int, height: int, scale: float, octaves: int, falloff: float, seed: Optional[int], tileable: bool) -> Any:
+    """Evaluate a (height, width) float32 noise texture with values in [0, 1].
+
+    Tileable fields blend four offset copies of the noise so opposite edges
+    match exactly.
+    """
+    gen = PerlinNoise(seed, octaves, falloff)
+    xs = np.arange(width, dtype=np.float64)[np.newaxis, :]
+    ys = np.arange(height, dtype=np.float64)[:, np.newaxis]
+    if not tileable:
+        return gen.sample_array(xs * scale, ys * scale).astype(np.float32)
+    # f(x,y) weighted with its copies shifted by one period in x, y and both
+    fw = float(width)
+    fh = float(height)
+    a = gen.sample_array(xs * scale, ys * scale)
+    b = gen.sample_array((xs - fw) * scale, ys * scale)
+    c = gen.sample_array(xs * scale, (ys - fh) * scale)
+    d = gen.sample_array((xs - fw) * scale, (ys - fh) * scale)
+    out = (a * (fw - xs) * (fh - ys) + b * xs * (fh - ys) + c * (fw - xs) * ys + d * xs * ys) / (fw * fh)
+    return out.astype(np.float32)
+
+
+class NoiseField:
+    """A noise texture computed once and sampled by bilinear lookup.
+
+    Coordinates passed to `sample()` are in field pixels. With
+    `tileable=True` they wrap around, otherwise they are clamped to the
+    edges. Construction returns immediately when `background` is True;
+    `data` (and every lookup) waits for the worker to finish.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        scale: float = 0.02,
+        octaves: int = 4,
+        falloff: float = 0.5,
+        seed: Optional[int] = None,
+        tileable: bool = True,
+        background: bool = True,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        if width <= 0 or height <= 0:
+            raise ValueError("NoiseField size must be positive")
+        self.width = int(width)
+        self.height = int(height)
+        self.scale = float(scale)
+        self.octaves = max(1, int(octaves))
+        self.falloff = float(falloff)
+        self.seed = seed
+        self.tileable = bool(tileable)
+        self.key = (seed, self.scale, self.width, self.height, self.octaves, self.falloff, self.tileable)
+        if cache_dir is None:
+            cache_dir = os.getenv(ENV_VAR) or None
+        # unseeded fields differ every run, so only seeded ones are persisted
+        self.cache_dir: Optional[str] = cache_dir if seed is not None else None
+        self._data: Any = None
+        self._future: Optional[Future] = None
+        self._surface: Any = None
+
+        cached = _memory.get(self.key) if seed is not None else None
+        if cached is not None:
+            self._data = cached
+        elif background:
+            self._future = _get_executor().submit(self._compute)
+        else:
+            self._data = self._compute()
+
+    def _cache_path(self) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha1(repr(self.key).encode("utf8")).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".npy")
+
+    def _compute(self) -> Any:
+        path = self._cache_path()
+        data = None
+        if path and os.path.exists(path):
+            try:
+                data = np.load(path)
+                if data.shape != (self.height, self.width):
+                    data = None
+            except Exception:
+                data = None
+        if data is None:
+            data = compute_field(self.width, self.height, self.scale, self.octaves, self.falloff, self.seed, self.tileable)
+            if path:
+                try:
+                    os.makedirs(self.cache_dir or ".", exist_ok=True)
+                    tmp = f"{path}.{os.getpid()}.tmp.npy"
+                    np.save(tmp, data)
+                    os.replace(tmp, path)
+                except Exception:
+                    pass
+        if self.seed is not None:
+            with _memory_lock:
+                _memory[self.key] = data
+        return data
+
+    def ready(self) -> bool:
+        """True once the texture has been computed."""
+        return self._data is not None or (self._future is not None and self._future.done())
+
+    def wait(self) -> "NoiseField":
+        """Block until the texture is available and return self."""
+        if self._data is None and self._future is not None:
+            self._data = self._future.result()
+            self._future = None
+        return self
+
+    @property
+    def data(self) -> Any:
+        """The (height, width) float32 array of noise values."""
+        if self._data is None:
+            self.wait()
+        return self._data
+
+    def sample(self, x: float, y: float) -> float:
+        """Bilinearly interpolated value at field coordinates (x, y)."""
+        d = self.data
+        w = self.width
+        h = self.height
+        if self.tileable:
+            x = x % w
+            y = y % h
+        else:
+            x = min(max(x, 0.0), w - 1.0)
+            y = min(max(y, 0.0), h - 1.0)
+        x0 = int(x)
+        y0 = int(y)
+        tx = x - x0
+        ty = y - y0
+        if self.tileable:
+            # x % w can round up to exactly w for tiny negative x
+            x0 %= w
+            y0 %= h
+            x1 = (x0 + 1) % w
+            y1 = (y0 + 1) % h
+        else:
+            x1 = min(x0 + 1, w - 1)
+            y1 = min(y0 + 1, h - 1)
+        top = d[y0, x0] + (d[y0, x1] - d[y0, x0]) * tx
+        bottom = d[y1, x0] + (d[y1, x1] - d[y1, x0]) * tx
+        return float(top + (bottom - top) * ty)
+
+    def sample_array(self, xs: Any, ys: Any) -> Any:
+        """Vectorized `sample` over broadcastable coordinate arrays."""
+        d = self.data
+        w = self.width
+        h = self.height
+        x, y = np.broadcast_arrays(np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64))
+        if self.tileable:
+            x = np.mod(x, w)
+            y = np.mod(y, h)
+        else:
+            x = np.clip(x, 0.0, w - 1.0)
+            y = np.clip(y, 0.0, h - 1.0)
+        x0 = np.floor(x).astype(np.intp)
+        y0 = np.floor(y).astype(np.intp)
+        tx = x - x0
+        ty = y - y0
+        if self.tileable:
+            x0 %= w
+            y0 %= h
+            x1 = (x0 + 1) % w
+            y1 = (y0 + 1) % h
+        else:
+            x1 = np.minimum(x0 + 1, w - 1)
+            y1 = np.minimum(y0 + 1, h - 1)
+        top = d[y0, x0] + (d[y0, x1] - d[y0, x0]) * tx
+        bottom = d[y1, x0] + (d[y1, x1] - d[y1, x0]) * tx
+        return top + (bottom - top) * ty
+
+    def to_surface(self) -> Any:
+        """Return a grayscale `OffscreenSurface` of the field (cached)."""
+        if self._surface is None:
+            import pygame
+
+            from .graphics import OffscreenSurface
+
+            gray = (np.clip(self.data, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+            # surfarray is indexed [x, y]
+            rgb = np.repeat(gray.T[:, :, np.newaxis], 3, axis=2)
+            self._surface = OffscreenSurface(pygame.surfarray.make_surface(rgb))
+        return self._surface
+
+
+def clear_cache() -> None:
+    """Forget all in-process cached fields."""
+    with _memory_lock:
+        _memory.clear()
@@ -3,12 +3,58 @@
 This allows subclasses to remain Processing-idiomatic (use plain assignment)
 while still reacting to changes (for example updating a radius when mass changes)
 without requiring per-attribute property definitions.
+
+Which attributes have `on_<attr>` hooks (and whether each hook takes the
+new value or the old and new values) is worked out once per class when the
+subclass is created, so assignments to attributes nobody observes cost a
+dictionary miss on top of a plain assignment.
 """
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Any
+from contextlib import contextmanager
+from typing import Callable, ClassVar, Dict, Iterator, List, Any, Optional, Tuple
 import inspect
 
+_MISSING = object()
+
+# Instances with deferred notifications; drained by flush_pending(), which
+# the Sketch run loop calls once per frame after draw().
+_pending: List["Observable"] = []
+
+
+def _hook_arity(cls: type, method_name: str) -> Optional[int]:
+    """Return 1 for on_<attr>(new), 2 for on_<attr>(old, new), None if not a method."""
+    try:
+        raw = inspect.getattr_static(cls, method_name)
+    except AttributeError:
+        return None
+    if isinstance(raw, staticmethod):
+        fn, skip = raw.__func__, 0
+    elif isinstance(raw, classmethod):
+        fn, skip = raw.__func__, 1
+    elif callable(raw):
+        fn, skip = raw, 1
+    else:
+        return None
+    try:
+        sig = inspect.signature(fn)
+    except (TypeError, ValueError):
+        return 1
+    params = len([
+        p for p in sig.parameters.values()
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+    ]) - skip
+    return 2 if params >= 2 else 1
+
+
+def flush_pending() -> None:
+    """Deliver deferred notifications of every batching Observable."""
+    while _pending:
+        items = list(_pending)
+        _pending.clear()
+        for inst in items:
+            inst.flush_notifications()
+
 
 class Observable:
     """Mixin that lets instances observe attribute assignments.
@@ -16,24 +62,52 @@ class Observable:
     Usage:
         self.observe('mass', lambda v: setattr(self, 'radius', v*8))
         self.mass = 10  # observer will run
+
+    Set `batch_notifications = True` on a subclass (or instance) to defer
+    notifications: repeated assignments to an attribute within a frame are
+    coalesced into one callback carrying the first old value and the last
+    new value, delivered after `draw()` (or on `flush_notifications()`).
+    `with obj.batched():` does the same for a block of code.
     """
 
+    # attr name -> (hook method name, arity); rebuilt for every subclass
+    _on_hooks: ClassVar[Dict[str, Tuple[str, int]]] = {}
+    _attr_observers: Optional[Dict[str, List[Callable[[Any], None]]]] = None
+    _pending_changes: Optional[Dict[str, List[Any]]] = None
+    _batch_depth = 0
+    batch_notifications = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.refresh_hooks()
+
+    @classmethod
+    def refresh_hooks(cls) -> None:
+        """Recompute the on_<attr> hook table (call after adding hooks dynamically)."""
+        hooks: Dict[str, Tuple[str, int]] = {}
+        for method_name in dir(cls):
+            if not method_name.startswith("on_") or len(method_name) <= 3:
+                continue
+            arity = _hook_arity(cls, method_name)
+            if arity is not None:
+                hooks[method_name[3:]] = (method_name, arity)
+        cls._on_hooks = hooks
+
     def observe(self, name: str, callback: Callable[[Any], None]) -> None:
         """Register callback(new_value) for attribute `name`.
 
         Callbacks are called after the attribute is assigned.
         """
-        if not hasattr(self, "_attr_observers"):
-            object.__setattr__(self, "_attr_observers", {})
-        obs: Dict[str, List[Callable[[Any], None]]] = getattr(self, "_attr_observers")
+        obs = self._attr_observers
+        if obs is None:
+            obs = {}
+            object.__setattr__(self, "_attr_observers", obs)
         obs.setdefault(name, []).append(callback)
 
     def unobserve(self, name: str, callback: Callable[[Any], None] | None = None) -> None:
         """Unregister callbacks. If callback is None remove all observers for name."""
-        if not hasattr(self, "_attr_observers"):
-            return
-        obs = getattr(self, "_attr_observers")
-        if name not in obs:
+        obs = self._attr_observers
+        if not obs or name not in obs:
             return
         if callback is None:
             obs.pop(name, None)
@@ -44,17 +118,39 @@ class Observable:
                 pass
 
     def __setattr__(self, name: str, value: Any) -> None:
-        # Detect whether the attribute existed before assignment; capture
-        # old value only when it did. This avoids calling on_<attr> during
-        # initial __init__ assignments.
-        existed = hasattr(self, name)
-        old = getattr(self, name, None) if existed else None
+        hook = self._on_hooks.get(name)
+        obs = self._attr_observers
+        if hook is None and (not obs or name not in obs):
+            # fast path: nothing observes this attribute
+            object.__setattr__(self, name, value)
+            return
 
-        # Always perform the assignment first
+        # Capture the old value only when the attribute already existed, so
+        # initial __init__ assignments don't trigger on_<attr> hooks.
+        old = getattr(self, name, _MISSING) if hook is not None else _MISSING
         object.__setattr__(self, name, value)
 
-        # Then notify explicit observers if any
-        obs = getattr(self, "_attr_observers", None)
+        if self.batch_notifications or self._batch_depth:
+            pending = self._pending_changes
+            if pending is None:
+                pending = {}
+                object.__setattr__(self, "_pending_changes", pending)
+            if not pending:
+                _pending.append(self)
+            entry = pending.get(name)
+            if entry is None:
+                pending[name] = [old, value]
+            else:
+                if entry[0] is _MISSING:
+                    # first assignment created the attribute; keep the
+                    # earliest real old value so on_<attr> still fires
+                    entry[0] = old
+                entry[1] = value
+            return
+        self._notify(name, old, value)
+
+    def _notify(self, name: str, old: Any, value: Any) -> None:
+        obs = self._attr_observers
         if obs:
             cbs = obs.get(name)
             if cbs:
@@ -65,25 +161,37 @@ class Observable:
                         # best-effort: swallow observer errors
                         pass
 
-        # Convenience: if the class defines an `on_<attr>` method, call it.
-        # Support signatures of either (new_value) or (old_value, new_value).
-        method_name = f"on_{name}"
-        meth = getattr(self, method_name, None)
-        # Only invoke on_<attr> for attributes that existed before assignment
-        # so initial __init__ assignments don't trigger them.
-        if existed and meth is not None and callable(meth):
+        # Convenience: if the class defines an `on_<attr>` method, call it
+        # with (new_value) or (old_value, new_value) depending on its arity.
+        hook = self._on_hooks.get(name)
+        if hook is not None and old is not _MISSING:
+            method_name, arity = hook
             try:
-                sig = inspect.signature(meth)
-                params = len([
-                    p for p in sig.parameters.values()
-                    if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
-                ])
-                if params >= 2:
-                    # provide (old, new)
+                meth = getattr(self, method_name)
+                if arity >= 2:
                     meth(old, value)
                 else:
-                    # provide (new,) only
                     meth(value)
             except Exception:
                 # best-effort: don't let observer errors propagate
                 pass
+
+    def flush_notifications(self) -> None:
+        """Deliver coalesced notifications queued while batching."""
+        pending = self._pending_changes
+        if not pending:
+            return
+        object.__setattr__(self, "_pending_changes", {})
+        for name, (old, value) in pending.items():
+            self._notify(name, old, value)
+
+    @contextmanager
+    def batched(self) -> Iterator["Observable"]:
+        """Coalesce notifications for assignments made inside the block."""
+        object.__setattr__(self, "_batch_depth", self._batch_depth + 1)
+        try:
+            yield self
+        finally:
+            object.__setattr__(self, "_batch_depth", self._batch_depth - 1)
+            if not self._batch_depth:
+                self.flush_notifications()
@@ -0,0 +1,16 @@
+"""Vectorized particle system.
+
+Particles live in a preallocated structure-of-arrays pool (`ParticleSystem`)
+and are recycled through a free list, so emitting and killing particles
+never allocates per-particle objects. Forces (`Gravity`, `Drag`,
+`Repeller`, `Attractor`) act on the whole pool with NumPy, and
+`ParticleSystem.draw()` renders every live particle with one batched blit,
+fading alpha with remaining lifespan and honouring the sketch blend mode.
+
+Requires NumPy (the `numeric` extra).
+"""
+from .system import ParticleSystem
+from .forces import Force, Gravity, Drag, Repeller, Attractor
+from .render import render
+
+__all__ = ["ParticleSystem", "Force", "Gravity", "Drag", "Repeller", "Attractor", "render"]
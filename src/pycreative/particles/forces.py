@@ -0,0 +1,83 @@
+"""Whole-pool forces for `ParticleSystem`.
+
+A force is any object with `apply(system)` that adds to
+`system.acceleration` for all slots at once. Forces persist on a system via
+`ParticleSystem.add_force()` and are applied on every `update()`.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .system import ParticleSystem
+
+
+class Force:
+    """Base class; subclasses implement `apply(system)`."""
+
+    enabled = True
+
+    def apply(self, system: "ParticleSystem") -> None:  # pragma: no cover - interface
+        raise NotImplementedError
+
+
+class Gravity(Force):
+    """Constant acceleration (gx, gy) applied to every particle."""
+
+    def __init__(self, gx: float = 0.0, gy: float = 0.1) -> None:
+        self.gx = float(gx)
+        self.gy = float(gy)
+
+    def apply(self, system: "ParticleSystem") -> None:
+        acc = system._acc
+        acc[0] += self.gx
+        acc[1] += self.gy
+
+
+class Drag(Force):
+    """Fluid drag opposing motion: a = -c * |v| * v (Nature of Code 2.5)."""
+
+    def __init__(self, coefficient: float = 0.01) -> None:
+        self.coefficient = float(coefficient)
+
+    def apply(self, system: "ParticleSystem") -> None:
+        vel = system._vel
+        speed = np.hypot(vel[0], vel[1])
+        k = self.coefficient * speed
+        system._acc[0] -= k * vel[0]
+        system._acc[1] -= k * vel[1]
+
+
+class Repeller(Force):
+    """Inverse-square push away from (x, y) (Nature of Code 4.7).
+
+    Distances are clamped to [min_dist, max_dist] to avoid extreme forces.
+    A negative `strength` attracts instead.
+    """
+
+    def __init__(self, x: float, y: float, strength: float = 150.0, min_dist: float = 5.0, max_dist: float = 50.0) -> None:
+        self.x = float(x)
+        self.y = float(y)
+        self.strength = float(strength)
+        self.min_dist = float(min_dist)
+        self.max_dist = float(max_dist)
+
+    def apply(self, system: "ParticleSystem") -> None:
+        pos = system._pos
+        dx = pos[0] - self.x
+        dy = pos[1] - self.y
+        d = np.hypot(dx, dy)
+        safe = np.where(d == 0.0, 1.0, d)
+        dc = np.clip(d, self.min_dist, self.max_dist)
+        mag = self.strength / (dc * dc)
+        system._acc[0] += dx / safe * mag
+        system._acc[1] += dy / safe * mag
+
+
+class Attractor(Repeller):
+    """Inverse-square pull towards (x, y)."""
+
+    def __init__(self, x: float, y: float, strength: float = 150.0, min_dist: float = 5.0, max_dist: float = 50.0) -> None:
+        super().__init__(x, y, -float(strength), min_dist, max_dist)
@@ -0,0 +1,178 @@
+"""Preallocated structure-of-arrays particle pool."""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+from ..vector_array import PVectorArray
+from .forces import Force
+
+
+class ParticleSystem:
+    """A fixed-capacity pool of particles updated with whole-array math.
+
+    State is kept in (2, capacity) position/velocity/acceleration arrays
+    plus `life`/`max_life` arrays and an `alive` mask. Free slots sit on an
+    index stack: `emit()` pops from it and dead particles are pushed back
+    during `update()`, so steady-state emission allocates nothing per
+    particle. Slots that are not alive still hold stale values; use
+    `alive` (or `alive_indices()`) when reading state.
+    """
+
+    def __init__(self, capacity: int = 10000, lifespan: float = 255.0, decay: float = 2.0, seed: Any = None) -> None:
+        self.capacity = int(capacity)
+        self.lifespan = float(lifespan)
+        self.decay = float(decay)
+        # accepts an int seed or an existing NumPy Generator
+        self.rng = np.random.default_rng(seed)
+        n = self.capacity
+        self._pos = np.zeros((2, n), dtype=np.float64)
+        self._vel = np.zeros((2, n), dtype=np.float64)
+        self._acc = np.zeros((2, n), dtype=np.float64)
+        self.life = np.zeros(n, dtype=np.float64)
+        self.max_life = np.ones(n, dtype=np.float64)
+        self.alive = np.zeros(n, dtype=bool)
+        # free-slot stack; the top `_free_top` entries are available
+        self._free = np.arange(n - 1, -1, -1, dtype=np.intp)
+        self._free_top = n
+        self.forces: list[Force] = []
+
+    # --- views ---
+    @property
+    def position(self) -> PVectorArray:
+        """Positions of all slots as a PVectorArray sharing memory."""
+        return PVectorArray._wrap(self._pos)
+
+    @property
+    def velocity(self) -> PVectorArray:
+        return PVectorArray._wrap(self._vel)
+
+    @property
+    def acceleration(self) -> PVectorArray:
+        return PVectorArray._wrap(self._acc)
+
+    @property
+    def count(self) -> int:
+        """Number of live particles."""
+        return self.capacity - self._free_top
+
+    def __len__(self) -> int:
+        return self.count
+
+    def alive_indices(self) -> Any:
+        return np.flatnonzero(self.alive)
+
+    # --- lifecycle ---
+    def emit(
+        self,
+        n: int,
+        x: Any,
+        y: Any,
+        vx: Any = 0.0,
+        vy: Any = 0.0,
+        spread: float = 0.0,
+        lifespan: Optional[float] = None,
+    ) -> Any:
+        """Spawn up to `n` particles and return their slot indices.
+
+        `x`, `y`, `vx`, `vy` may be scalars or length-`n` arrays. `spread`
+        adds Gaussian noise (standard deviation `spread`) to each velocity
+        component. Emission stops silently when the pool is full; array
+        arguments are then truncated to the particles actually spawned.
+        """
+        requested = max(0, int(n))
+        # validate shapes before any slot is taken so a bad call leaks nothing
+        x, y, vx, vy = (np.broadcast_to(np.asarray(v, dtype=np.float64), (requested,)) for v in (x, y, vx, vy))
+        n = min(requested, self._free_top)
+        if n <= 0:
+            return np.empty(0, dtype=np.intp)
+        top = self._free_top
+        idx = self._free[top - n:top].copy()
+        self._free_top = top - n
+        self._pos[0, idx] = x[:n]
+        self._pos[1, idx] = y[:n]
+        self._vel[0, idx] = vx[:n]
+        self._vel[1, idx] = vy[:n]
+        if spread:
+            self._vel[:, idx] += self.rng.normal(0.0, float(spread), (2, n))
+        self._acc[:, idx] = 0.0
+        life = self.lifespan if lifespan is None else float(lifespan)
+        self.life[idx] = life
+        self.max_life[idx] = life if life > 0 else 1.0
+        self.alive[idx] = True
+        return idx
+
+    def kill(self, which: Any) -> None:
+        """Return particles (indices or boolean mask) to the free list."""
+        idx = np.asarray(which)
+        if idx.dtype == bool:
+            idx = np.flatnonzero(idx & self.alive)
+        else:
+            # a repeated index must only be freed once
+            idx = np.unique(idx[self.alive[idx]])
+        k = len(idx)
+        if k == 0:
+            return
+        self.alive[idx] = False
+        self.life[idx] = 0.0
+        self._free[self._free_top:self._free_top + k] = idx
+        self._free_top += k
+
+    def clear(self) -> None:
+        """Kill every particle."""
+        self.alive[:] = False
+        self.life[:] = 0.0
+        self._free[:] = np.arange(self.capacity - 1, -1, -1, dtype=np.intp)
+        self._free_top = self.capacity
+
+    # --- forces & integration ---
+    def add_force(self, force: Force) -> Force:
+        """Register a persistent force applied on every update()."""
+        self.forces.append(force)
+        return force
+
+    def remove_force(self, force: Force) -> None:
+        try:
+            self.forces.remove(force)
+        except ValueError:
+            pass
+
+    def apply_force(self, fx: Any, fy: Any = None) -> None:
+        """Add a one-off acceleration for the next update (e.g. wind).
+
+        Accepts (fx, fy) scalars/arrays or a single PVector-like value.
+        """
+        if fy is None:
+            if hasattr(fx, "x") and hasattr(fx, "y"):
+                fx, fy = fx.x, fx.y
+            else:
+                fx, fy = fx
+        self._acc[0] += fx
+        self._acc[1] += fy
+
+    def update(self, dt: float = 1.0) -> None:
+        """Apply forces, integrate motion, age particles and recycle the dead."""
+        for force in self.forces:
+            if force.enabled:
+                force.apply(self)
+        if dt == 1.0:
+            self._vel += self._acc
+            self._pos += self._vel
+            self.life -= self.decay
+        else:
+            self._vel += self._acc * dt
+            self._pos += self._vel * dt
+            self.life -= self.decay * dt
+        self._acc[:] = 0.0
+        self.kill(self.alive & (self.life <= 0.0))
+
+    def alpha(self) -> Any:
+        """Remaining-life fraction in [0, 1] for every slot."""
+        return np.clip(self.life / self.max_life, 0.0, 1.0)
+
+    def draw(self, target: Any, sprite: Any = None, size: float = 8.0, color: Any = (255, 255, 255), blend: Optional[str] = None, alpha_levels: int = 32) -> None:
+        """Render all live particles with one batched blit (see `render.render`)."""
+        from .render import render
+
+        render(self, target, sprite=sprite, size=size, color=color, blend=blend, alpha_levels=alpha_levels)
@@ -456,6 +456,130 @@ def point(surface, x: float, y: float, color: Optional[Tuple[int, ...]] = None,
         return
 
 
+def _point_list(pts) -> list:
+    """Normalize PVectorArray, (N,2) arrays or iterables of pairs to [[x, y], ...]."""
+    xy = getattr(pts, "xy", None)
+    if xy is not None and hasattr(xy, "tolist"):
+        return xy.tolist()
+    if hasattr(pts, "tolist"):
+        return pts.tolist()
+    return [(float(p[0]), float(p[1])) for p in pts]
+
+
+def _transformed_int_points(surface, pts) -> list[tuple[int, int]]:
+    coords = _point_list(pts)
+    if not surface._is_identity_transform():
+        coords = surface.transform_points([(x, y) for x, y in coords])
+    return [(int(round(x)), int(round(y))) for x, y in coords]
+
+
+def points(surface, pts, color: Optional[Tuple[int, ...]] = None) -> None:
+    """Draw many points in one call; see `point()` for styling rules.
+
+    `pts` may be a PVectorArray, an (N, 2) array or an iterable of pairs.
+    """
+    draw_color = color if color is not None else surface._stroke
+    draw_color = _ensure_color_tuple(surface, draw_color)
+    if draw_color is None:
+        return
+    ipts = _transformed_int_points(surface, pts)
+    if not ipts:
+        return
+    sw = max(1, int(surface._stroke_weight))
+    target = surface._surf
+    if sw <= 1:
+        w, h = target.get_size()
+        target.lock()
+        try:
+            for ix, iy in ipts:
+                if 0 <= ix < w and 0 <= iy < h:
+                    target.set_at((ix, iy), draw_color)
+        finally:
+            target.unlock()
+        return
+    # stamp one pre-rendered dot for every point in a single blits() call
+    dot = pygame.Surface((sw, sw), pygame.SRCALPHA)
+    c = sw // 2
+    pygame.draw.circle(dot, draw_color, (c, c), sw // 2)
+    target.blits([(dot, (ix - c, iy - c)) for ix, iy in ipts], doreturn=False)
+
+
+def lines(surface, starts, ends=None, color: Optional[Tuple[int, ...]] = None, width: Optional[int] = None) -> None:
+    """Draw many independent line segments in one call.
+
+    Pass an (N, 4) array / iterable of (x1, y1, x2, y2) rows, or two point
+    collections `starts` and `ends` (PVectorArray, (N, 2) arrays or pairs).
+    Segments use the current (or given) stroke colour and weight and the
+    current transform. Translucent strokes are drawn onto one overlay that
+    is blitted once.
+    """
+    col = _ensure_color_tuple(surface, color if color is not None else surface._stroke)
+    w = int(width) if width is not None else int(surface._stroke_weight)
+    if col is None or w <= 0:
+        return
+    if ends is None:
+        rows = _point_list(starts)
+    else:
+        rows = [(ax, ay, bx, by) for (ax, ay), (bx, by) in zip(_point_list(starts), _point_list(ends))]
+    if not rows:
+        return
+    if not surface._is_identity_transform():
+        (m00, m01, m02), (m10, m11, m12) = surface._current_matrix()[:2]
+        rows = [
+            (m00 * x1 + m01 * y1 + m02, m10 * x1 + m11 * y1 + m12, m00 * x2 + m01 * y2 + m02, m10 * x2 + m11 * y2 + m12)
+            for x1, y1, x2, y2 in rows
+        ]
+    target = surface._surf
+    translucent = len(col) == 4 and col[3] != 255
+    canvas = pygame.Surface(target.get_size(), pygame.SRCALPHA) if translucent else target
+    draw_line = pygame.draw.line
+    # pygame truncates float coordinates itself; converting here costs
+    # more than the draw for short segments
+    for x1, y1, x2, y2 in rows:
+        draw_line(canvas, col, (x1, y1), (x2, y2), w)
+    if translucent:
+        target.blit(canvas, (0, 0))
+
+
+def circles(surface, pts, d: float, fill: Optional[Tuple[int, ...]] = None, stroke: Optional[Tuple[int, ...]] = None, stroke_weight: Optional[int] = None, blend_flags: int = 0) -> None:
+    """Draw equal circles of diameter `d` at many positions in one call.
+
+    The circle is rendered once with the current (or given) fill/stroke and
+    stamped at every position with a single `blits()` call. Positions
+    follow `ellipse_mode` and the current transform (diameter scaled by the
+    transform's average scale). `blend_flags` is passed to pygame as
+    `special_flags` (e.g. pygame.BLEND_RGB_ADD).
+    """
+    from .transforms import decompose_scale
+
+    fill_col = _ensure_color_tuple(surface, fill if fill is not None else surface._fill)
+    stroke_col = _ensure_color_tuple(surface, stroke if stroke is not None else surface._stroke)
+    sw = int(stroke_weight) if stroke_weight is not None else int(surface._stroke_weight)
+    coords = _point_list(pts)
+    if not coords:
+        return
+    if surface._ellipse_mode != surface.MODE_CENTER:
+        r0 = d / 2.0
+        coords = [(x + r0, y + r0) for x, y in coords]
+    scale = 1.0
+    if not surface._is_identity_transform():
+        coords = surface.transform_points([(x, y) for x, y in coords])
+        sx, sy = decompose_scale(surface._current_matrix())
+        scale = (sx + sy) / 2.0 if sx > 0 and sy > 0 else 1.0
+    size = max(1, int(round(d * scale)))
+    stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+    rect = stamp.get_rect()
+    if fill_col is not None:
+        pygame.draw.ellipse(stamp, fill_col, rect)
+    if stroke_col is not None and sw > 0:
+        pygame.draw.ellipse(stamp, stroke_col, rect, sw)
+    half = size / 2.0
+    surface._surf.blits(
+        [(stamp, (int(x - half), int(y - half)), None, blend_flags) for x, y in coords],
+        doreturn=False,
+    )
+
+
 def polygon_with_style(surface, points: Sequence[tuple[float, float]], fill: Optional[Tuple[int, ...]] = None, stroke: Optional[Tuple[int, ...]] = None, stroke_weight: Optional[int] = None, cap: Optional[str] = None, join: Optional[str] = None) -> None:
     if surface._is_identity_transform():
         pts = [(int(round(x)), int(round(y))) for (x, y) in points]
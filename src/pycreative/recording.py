@@ -0,0 +1,149 @@
+"""Input recording and deterministic replay.
+
+`InputRecorder` captures the input events the run loop dispatches, tagged
+with their frame index, together with a per-frame snapshot of the mouse
+state (position and button). `InputReplay` feeds the same events back
+frame by frame. Replays use a fixed `dt`, so together with the seed stored
+in the recording a replayed run is identical on every machine. This is
+how interactive sketches are benchmarked in CI without anyone at the mouse.
+
+Recordings are gzip-compressed JSON lines: a header object followed by
+one `[frame, kind, fields]` row per event and `[frame, "mouse", x, y,
+pressed]` rows whenever the mouse state changes.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional
+import gzip
+import json
+
+import pygame
+
+FORMAT_VERSION = 1
+
+# Only user input is recorded; window and system events are left to the
+# replaying machine.
+_KINDS = {
+    "KEYDOWN": pygame.KEYDOWN,
+    "KEYUP": pygame.KEYUP,
+    "MOUSEBUTTONDOWN": pygame.MOUSEBUTTONDOWN,
+    "MOUSEBUTTONUP": pygame.MOUSEBUTTONUP,
+    "MOUSEMOTION": pygame.MOUSEMOTION,
+    "MOUSEWHEEL": pygame.MOUSEWHEEL,
+    "TEXTINPUT": pygame.TEXTINPUT,
+}
+_NAMES = {v: k for k, v in _KINDS.items()}
+_FIELDS = ("pos", "rel", "button", "buttons", "key", "mod", "unicode", "scancode", "x", "y", "text", "flipped")
+
+
+def _encode(ev: Any) -> Optional[tuple[str, dict]]:
+    kind = _NAMES.get(ev.type)
+    if kind is None:
+        return None
+    fields = {}
+    for name in _FIELDS:
+        if hasattr(ev, name):
+            v = getattr(ev, name)
+            fields[name] = list(v) if isinstance(v, tuple) else v
+    return kind, fields
+
+
+def _decode(kind: str, fields: dict) -> Any:
+    data = {k: tuple(v) if isinstance(v, list) else v for k, v in fields.items()}
+    return pygame.event.Event(_KINDS[kind], data)
+
+
+def _mouse_state(sketch: Any) -> tuple[Any, Any, bool]:
+    return (getattr(sketch, "_mouse_x", None), getattr(sketch, "_mouse_y", None), bool(getattr(sketch, "mouse_is_pressed", False)))
+
+
+class InputRecorder:
+    """Collects input events per frame; `save()` writes them to `path`."""
+
+    def __init__(self, path: str, seed: Optional[int] = None, frame_rate: int = 60, size: tuple[int, int] = (0, 0)) -> None:
+        self.path = str(path)
+        self.seed = seed
+        self.frame_rate = int(frame_rate)
+        self.size = (int(size[0]), int(size[1]))
+        self.frames = 0
+        self.rows: list[list[Any]] = []
+        self._mouse: Optional[tuple[Any, Any, bool]] = None
+
+    def capture(self, frame: int, events: Any) -> None:
+        """Record the input events dispatched in `frame`."""
+        rows = self.rows
+        for ev in events:
+            enc = _encode(ev)
+            if enc is not None:
+                rows.append([frame, enc[0], enc[1]])
+        self.frames = max(self.frames, frame + 1)
+
+    def capture_mouse(self, frame: int, sketch: Any) -> None:
+        """Record the sketch's mouse state after dispatch if it changed."""
+        state = _mouse_state(sketch)
+        if state != self._mouse:
+            self._mouse = state
+            self.rows.append([frame, "mouse", state[0], state[1], state[2]])
+
+    def save(self) -> str:
+        header = {
+            "pycreative_input": FORMAT_VERSION,
+            "frames": self.frames,
+            "seed": self.seed,
+            "frame_rate": self.frame_rate,
+            "size": list(self.size),
+        }
+        with gzip.open(self.path, "wt", encoding="utf8") as f:
+            f.write(json.dumps(header, separators=(",", ":")) + "\n")
+            for row in self.rows:
+                f.write(json.dumps(row, separators=(",", ":")) + "\n")
+        return self.path
+
+
+class InputReplay:
+    """Recorded input served back frame by frame.
+
+    `mismatches` counts frames where the sketch's mouse state after
+    dispatch differed from the recording, which means the replay diverged.
+    """
+
+    def __init__(self, path: str, dt: Optional[float] = None) -> None:
+        self.path = str(path)
+        with gzip.open(self.path, "rt", encoding="utf8") as f:
+            header = json.loads(f.readline())
+            if header.get("pycreative_input") != FORMAT_VERSION:
+                raise ValueError(f"{self.path} is not a pycreative input recording")
+            rows = [json.loads(line) for line in f if line.strip()]
+        self.frames = int(header.get("frames", 0))
+        self.seed: Optional[int] = header.get("seed")
+        self.frame_rate = int(header.get("frame_rate") or 60)
+        self.size = tuple(header.get("size") or (0, 0))
+        self.dt = float(dt) if dt is not None else 1.0 / self.frame_rate
+        self.mismatches = 0
+        self._events: dict[int, list[tuple[str, dict]]] = {}
+        self._mouse: dict[int, tuple[Any, Any, bool]] = {}
+        for row in rows:
+            if row[1] == "mouse":
+                self._mouse[row[0]] = (row[2], row[3], bool(row[4]))
+            else:
+                self._events.setdefault(row[0], []).append((row[1], row[2]))
+
+    def __len__(self) -> int:
+        return self.frames
+
+    def events_for(self, frame: int) -> list:
+        """pygame events to dispatch in `frame` (empty when nothing happened)."""
+        return [_decode(kind, fields) for kind, fields in self._events.get(frame, ())]
+
+    def check(self, frame: int, sketch: Any) -> bool:
+        """Compare the sketch's mouse state with the recording for `frame`."""
+        expected = self._mouse.get(frame)
+        if expected is None:
+            return True
+        ok = _mouse_state(sketch) == expected
+        if not ok:
+            self.mismatches += 1
+        return ok
+
+    def done(self, frame: int) -> bool:
+        return frame >= self.frames
@@ -0,0 +1,15 @@
+"""Spatial indexes for neighbour queries over many points.
+
+- `BinLattice`: a uniform grid rebuilt from coordinate arrays (cheap enough
+  to rebuild every frame), with all-pairs neighbour search for flocking.
+- `QuadTree`: adaptive tree with bulk insert from arrays and incremental
+  updates for moving points.
+
+Both answer radius and k-nearest queries with NumPy index arrays into the
+coordinate arrays they were built from. Requires NumPy (the `numeric`
+extra).
+"""
+from .grid import BinLattice
+from .quadtree import QuadTree
+
+__all__ = ["BinLattice", "QuadTree"]
@@ -0,0 +1,29 @@
+"""Helpers shared by the spatial indexes."""
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+def as_xy(xs: Any, ys: Any = None) -> tuple[Any, Any]:
+    """Return float64 (x, y) arrays from separate arrays, an (N, 2) array or a PVectorArray."""
+    if ys is None:
+        xy = getattr(xs, "xy", None)
+        arr = np.asarray(xy if xy is not None else xs, dtype=np.float64)
+        if arr.ndim != 2 or arr.shape[1] != 2:
+            raise ValueError("expected an (N, 2) array or separate x and y arrays")
+        return np.ascontiguousarray(arr[:, 0]), np.ascontiguousarray(arr[:, 1])
+    return np.asarray(xs, dtype=np.float64).ravel(), np.asarray(ys, dtype=np.float64).ravel()
+
+
+def nearest_k(idx: Any, xs: Any, ys: Any, x: float, y: float, k: int) -> Any:
+    """The `k` entries of `idx` closest to (x, y), nearest first."""
+    if len(idx) == 0:
+        return idx
+    d2 = (xs[idx] - x) ** 2 + (ys[idx] - y) ** 2
+    if len(idx) > k:
+        part = np.argpartition(d2, k - 1)[:k]
+        idx = idx[part]
+        d2 = d2[part]
+    return idx[np.argsort(d2, kind="stable")]
@@ -0,0 +1,194 @@
+"""Uniform-grid bin lattice over coordinate arrays."""
+from __future__ import annotations
+
+from typing import Any, Optional
+import math
+
+import numpy as np
+
+from ._common import as_xy, nearest_k
+
+
+class BinLattice:
+    """Bins points into square cells of `cell_size` for fast neighbour lookup.
+
+    Points are sorted by cell key (row-major), so every horizontal run of
+    cells is one contiguous slice of `order`. Rebuilding is a single
+    argsort, cheap enough to do every frame; `update()` skips the sort when
+    no point changed cell.
+    """
+
+    def __init__(self, cell_size: float, xs: Any = None, ys: Any = None) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self.x: Any = np.empty(0)
+        self.y: Any = np.empty(0)
+        self.order: Any = np.empty(0, dtype=np.intp)
+        self._keys: Any = np.empty(0, dtype=np.int64)
+        self._sorted_keys: Any = np.empty(0, dtype=np.int64)
+        self._origin = (0, 0)
+        self._dims = (0, 0)
+        if xs is not None:
+            self.rebuild(xs, ys)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    # --- building ---
+    def rebuild(self, xs: Any, ys: Any = None) -> "BinLattice":
+        """Index new point coordinates (separate arrays, (N, 2) or PVectorArray)."""
+        self.x, self.y = as_xy(xs, ys)
+        self._index()
+        return self
+
+    def update(self, xs: Any, ys: Any = None) -> "BinLattice":
+        """Refresh coordinates of the same points; re-sorts only if a cell changed."""
+        x, y = as_xy(xs, ys)
+        if len(x) != len(self.x):
+            return self.rebuild(x, y)
+        self.x, self.y = x, y
+        cx, cy = self._cells(x, y)
+        ox, oy = self._origin
+        nx, ny = self._dims
+        if len(cx) and (cx.min() < ox or cy.min() < oy or cx.max() >= ox + nx or cy.max() >= oy + ny):
+            self._index()
+            return self
+        keys = (cy - oy) * nx + (cx - ox)
+        if not np.array_equal(keys, self._keys):
+            self._sort(keys)
+        return self
+
+    def _cells(self, x: Any, y: Any) -> tuple[Any, Any]:
+        inv = 1.0 / self.cell_size
+        return np.floor(x * inv).astype(np.int64), np.floor(y * inv).astype(np.int64)
+
+    def _index(self) -> None:
+        if len(self.x) == 0:
+            self._origin = (0, 0)
+            self._dims = (0, 0)
+            self._sort(np.empty(0, dtype=np.int64))
+            return
+        cx, cy = self._cells(self.x, self.y)
+        ox, oy = int(cx.min()), int(cy.min())
+        nx = int(cx.max()) - ox + 1
+        ny = int(cy.max()) - oy + 1
+        self._origin = (ox, oy)
+        self._dims = (nx, ny)
+        self._sort((cy - oy) * nx + (cx - ox))
+
+    def _sort(self, keys: Any) -> None:
+        self._keys = keys
+        self.order = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self.order]
+
+    # --- queries ---
+    def _row_slices(self, x0: float, y0: float, x1: float, y1: float) -> Any:
+        """Indices of points in cells overlapping the box [x0, x1] x [y0, y1]."""
+        ox, oy = self._origin
+        nx, ny = self._dims
+        if nx == 0:
+            return np.empty(0, dtype=np.intp)
+        inv = 1.0 / self.cell_size
+        cx0 = max(int(math.floor(x0 * inv)), ox) - ox
+        cx1 = min(int(math.floor(x1 * inv)), ox + nx - 1) - ox
+        cy0 = max(int(math.floor(y0 * inv)), oy) - oy
+        cy1 = min(int(math.floor(y1 * inv)), oy + ny - 1) - oy
+        if cx0 > cx1 or cy0 > cy1:
+            return np.empty(0, dtype=np.intp)
+        rows = np.arange(cy0, cy1 + 1, dtype=np.int64) * nx
+        lo = np.searchsorted(self._sorted_keys, rows + cx0, side="left")
+        hi = np.searchsorted(self._sorted_keys, rows + cx1, side="right")
+        parts = [self.order[a:b] for a, b in zip(lo.tolist(), hi.tolist()) if b > a]
+        if not parts:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(parts)
+
+    def query_radius(self, x: float, y: float, r: float) -> Any:
+        """Indices of points within distance `r` of (x, y)."""
+        cand = self._row_slices(x - r, y - r, x + r, y + r)
+        if len(cand) == 0:
+            return cand
+        d2 = (self.x[cand] - x) ** 2 + (self.y[cand] - y) ** 2
+        return cand[d2 <= r * r]
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> Any:
+        """Indices of points inside the axis-aligned box."""
+        cand = self._row_slices(x0, y0, x1, y1)
+        if len(cand) == 0:
+            return cand
+        px = self.x[cand]
+        py = self.y[cand]
+        return cand[(px >= x0) & (px <= x1) & (py >= y0) & (py <= y1)]
+
+    def knn(self, x: float, y: float, k: int, exclude: Optional[int] = None) -> Any:
+        """Indices of the `k` nearest points to (x, y), nearest first."""
+        n = len(self.x)
+        want = k + (1 if exclude is not None else 0)
+        if n == 0 or k <= 0:
+            return np.empty(0, dtype=np.intp)
+        r = self.cell_size
+        nx, ny = self._dims
+        limit = self.cell_size * (nx + ny + 2) + abs(x) + abs(y)
+        while True:
+            cand = self.query_radius(x, y, r)
+            # every point within r is in cand, so its k nearest are exact
+            if len(cand) >= want or r > limit:
+                break
+            r *= 2.0
+        if len(cand) < want:
+            cand = np.arange(n)
+        if exclude is not None:
+            cand = cand[cand != exclude]
+        return nearest_k(cand, self.x, self.y, x, y, k)
+
+    def neighbors(self, i: int, r: float) -> Any:
+        """Indices of points within `r` of point `i`, excluding `i`."""
+        idx = self.query_radius(float(self.x[i]), float(self.y[i]), r)
+        return idx[idx != i]
+
+    def pairs(self, r: float) -> tuple[Any, Any]:
+        """All ordered pairs (i, j), i != j, within `r` (inclusive), as two index arrays.
+
+        Each neighbouring pair appears in both orders, which suits
+        accumulating per-agent sums with `np.add.at`/`np.bincount`.
+        """
+        n = len(self.x)
+        empty = np.empty(0, dtype=np.intp)
+        if n == 0:
+            return empty, empty
+        nx, ny = self._dims
+        cx = self._keys % nx
+        cy = self._keys // nx
+        span = int(math.ceil(r / self.cell_size))
+        pts = np.arange(n, dtype=np.intp)
+        r2 = r * r
+        out_i = []
+        out_j = []
+        for dy in range(-span, span + 1):
+            for dx in range(-span, span + 1):
+                tx = cx + dx
+                ty = cy + dy
+                ok = (tx >= 0) & (tx < nx) & (ty >= 0) & (ty < ny)
+                if not ok.any():
+                    continue
+                src = pts[ok]
+                nk = ty[ok] * nx + tx[ok]
+                lo = np.searchsorted(self._sorted_keys, nk, side="left")
+                hi = np.searchsorted(self._sorted_keys, nk, side="right")
+                counts = hi - lo
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+                # expand ragged [lo, hi) ranges without a Python loop
+                first = np.cumsum(counts) - counts
+                pos = np.repeat(lo - first, counts) + np.arange(total)
+                i = np.repeat(src, counts)
+                j = self.order[pos]
+                d2 = (self.x[i] - self.x[j]) ** 2 + (self.y[i] - self.y[j]) ** 2
+                keep = (i != j) & (d2 <= r2)
+                out_i.append(i[keep])
+                out_j.append(j[keep])
+        if not out_i:
+            return empty, empty
+        return np.concatenate(out_i), np.concatenate(out_j)
@@ -0,0 +1,300 @@
+"""Point quadtree with bulk construction and incremental updates."""
+from __future__ import annotations
+
+from typing import Any, Optional
+import heapq
+import math
+
+import numpy as np
+
+from ._common import as_xy, nearest_k
+
+
+class _Node:
+    __slots__ = ("x0", "y0", "x1", "y1", "depth", "children", "items")
+
+    def __init__(self, x0: float, y0: float, x1: float, y1: float, depth: int) -> None:
+        self.x0 = x0
+        self.y0 = y0
+        self.x1 = x1
+        self.y1 = y1
+        self.depth = depth
+        self.children: Optional[list["_Node"]] = None
+        self.items: list[int] = []
+
+    def split(self) -> list["_Node"]:
+        mx = (self.x0 + self.x1) * 0.5
+        my = (self.y0 + self.y1) * 0.5
+        d = self.depth + 1
+        # order matches _child_index: bit 0 = right half, bit 1 = bottom half
+        self.children = [
+            _Node(self.x0, self.y0, mx, my, d),
+            _Node(mx, self.y0, self.x1, my, d),
+            _Node(self.x0, my, mx, self.y1, d),
+            _Node(mx, my, self.x1, self.y1, d),
+        ]
+        return self.children
+
+    def child_index(self, x: float, y: float) -> int:
+        mx = (self.x0 + self.x1) * 0.5
+        my = (self.y0 + self.y1) * 0.5
+        return (1 if x >= mx else 0) | (2 if y >= my else 0)
+
+    def min_dist_sq(self, x: float, y: float) -> float:
+        dx = max(self.x0 - x, 0.0, x - self.x1)
+        dy = max(self.y0 - y, 0.0, y - self.y1)
+        return dx * dx + dy * dy
+
+
+class QuadTree:
+    """A point quadtree over the region `bounds` = (x, y, w, h).
+
+    Leaves hold up to `capacity` point indices before splitting (leaves at
+    `max_depth` never split). `build()` partitions whole index arrays with
+    NumPy masks instead of inserting points one by one. Points outside
+    `bounds` are kept in an overflow list so queries stay correct.
+
+    For moving points call `update()` with the new coordinates: only points
+    that left their leaf are removed and reinserted, which is much cheaper
+    than a rebuild when most points move a little per frame.
+    """
+
+    def __init__(self, bounds: tuple[float, float, float, float], capacity: int = 8, max_depth: int = 16, xs: Any = None, ys: Any = None) -> None:
+        bx, by, bw, bh = (float(v) for v in bounds)
+        if bw <= 0 or bh <= 0:
+            raise ValueError("QuadTree bounds must have a positive size")
+        self.bounds = (bx, by, bw, bh)
+        self.capacity = max(1, int(capacity))
+        self.max_depth = max(0, int(max_depth))
+        # half-open cells everywhere: nudge the far edges so points lying
+        # exactly on the right/bottom border still belong to the root
+        self._x1 = math.nextafter(bx + bw, math.inf)
+        self._y1 = math.nextafter(by + bh, math.inf)
+        self.x: Any = np.empty(0)
+        self.y: Any = np.empty(0)
+        self._clear()
+        if xs is not None:
+            self.build(xs, ys)
+
+    def _clear(self) -> None:
+        bx, by, _, _ = self.bounds
+        self.root = _Node(bx, by, self._x1, self._y1, 0)
+        self._leaf_of: list[Optional[_Node]] = [None] * len(self.x)
+        self._outside: set[int] = set()
+        n = len(self.x)
+        # per-point bounds of the containing leaf (NaN when outside the root)
+        self._lb = np.full((4, n), np.nan)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    # --- building ---
+    def build(self, xs: Any, ys: Any = None) -> "QuadTree":
+        """Replace the contents with new points (separate arrays, (N, 2) or PVectorArray)."""
+        x, y = as_xy(xs, ys)
+        self.x = np.array(x, dtype=np.float64)
+        self.y = np.array(y, dtype=np.float64)
+        self._clear()
+        bx, by, _, _ = self.bounds
+        inside = (self.x >= bx) & (self.x < self._x1) & (self.y >= by) & (self.y < self._y1)
+        self._outside = set(np.flatnonzero(~inside).tolist())
+        self._build(self.root, np.flatnonzero(inside))
+        return self
+
+    def _build(self, node: _Node, idx: Any) -> None:
+        stack = [(node, idx)]
+        while stack:
+            node, idx = stack.pop()
+            if len(idx) <= self.capacity or node.depth >= self.max_depth:
+                self._fill_leaf(node, idx)
+                continue
+            mx = (node.x0 + node.x1) * 0.5
+            my = (node.y0 + node.y1) * 0.5
+            right = self.x[idx] >= mx
+            bottom = self.y[idx] >= my
+            children = node.split()
+            stack.append((children[0], idx[~right & ~bottom]))
+            stack.append((children[1], idx[right & ~bottom]))
+            stack.append((children[2], idx[~right & bottom]))
+            stack.append((children[3], idx[right & bottom]))
+
+    def _fill_leaf(self, node: _Node, idx: Any) -> None:
+        items = idx.tolist()
+        node.items = items
+        for i in items:
+            self._leaf_of[i] = node
+        self._lb[0, idx] = node.x0
+        self._lb[1, idx] = node.y0
+        self._lb[2, idx] = node.x1
+        self._lb[3, idx] = node.y1
+
+    def _place(self, i: int) -> None:
+        x = float(self.x[i])
+        y = float(self.y[i])
+        root = self.root
+        if not (root.x0 <= x < root.x1 and root.y0 <= y < root.y1):
+            self._outside.add(i)
+            self._leaf_of[i] = None
+            self._lb[:, i] = np.nan
+            return
+        node = root
+        while node.children is not None:
+            node = node.children[node.child_index(x, y)]
+        node.items.append(i)
+        if len(node.items) > self.capacity and node.depth < self.max_depth:
+            items = node.items
+            node.items = []
+            node.split()
+            for j in items:
+                self._place(j)
+            return
+        self._leaf_of[i] = node
+        self._lb[:, i] = (node.x0, node.y0, node.x1, node.y1)
+
+    def _remove(self, i: int) -> None:
+        node = self._leaf_of[i]
+        if node is None:
+            self._outside.discard(i)
+        else:
+            node.items.remove(i)
+            self._leaf_of[i] = None
+
+    def insert(self, x: float, y: float) -> int:
+        """Add one point and return its index."""
+        i = len(self.x)
+        self.x = np.append(self.x, float(x))
+        self.y = np.append(self.y, float(y))
+        self._leaf_of.append(None)
+        self._lb = np.concatenate([self._lb, np.full((4, 1), np.nan)], axis=1)
+        self._place(i)
+        return i
+
+    def move(self, i: int, x: float, y: float) -> None:
+        """Move point `i`, relocating it only if it left its leaf."""
+        self.x[i] = x
+        self.y[i] = y
+        x0, y0, x1, y1 = self._lb[:, i]
+        if x0 <= x < x1 and y0 <= y < y1:
+            return
+        self._remove(i)
+        self._place(i)
+
+    def update(self, xs: Any, ys: Any = None, rebuild_fraction: float = 0.25) -> int:
+        """Set new coordinates for all points; returns how many were relocated.
+
+        Falls back to a full `build()` when the point count changed or more
+        than `rebuild_fraction` of the points left their leaves.
+        """
+        x, y = as_xy(xs, ys)
+        if len(x) != len(self.x):
+            self.build(x, y)
+            return len(x)
+        self.x[:] = x
+        self.y[:] = y
+        lb = self._lb
+        stay = (x >= lb[0]) & (x < lb[2]) & (y >= lb[1]) & (y < lb[3])
+        moved = np.flatnonzero(~stay)
+        if self._outside:
+            # points that were and still are outside the root need no work
+            bx, by, _, _ = self.bounds
+            out = (x[moved] < bx) | (x[moved] >= self._x1) | (y[moved] < by) | (y[moved] >= self._y1)
+            still_out = np.fromiter((i in self._outside for i in moved.tolist()), dtype=bool, count=len(moved))
+            moved = moved[~(out & still_out)]
+        if len(moved) > rebuild_fraction * max(1, len(x)):
+            self.build(self.x, self.y)
+            return len(moved)
+        for i in moved.tolist():
+            self._remove(i)
+            self._place(i)
+        return len(moved)
+
+    # --- queries ---
+    def _collect(self, x0: float, y0: float, x1: float, y1: float, cx: Optional[float] = None, cy: Optional[float] = None, r2: float = 0.0) -> Any:
+        cand: list[int] = list(self._outside)
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.x0 > x1 or node.x1 < x0 or node.y0 > y1 or node.y1 < y0:
+                continue
+            if cx is not None and cy is not None and node.min_dist_sq(cx, cy) > r2:
+                continue
+            if node.children is None:
+                cand.extend(node.items)
+            else:
+                stack.extend(node.children)
+        return np.asarray(cand, dtype=np.intp)
+
+    def query_radius(self, x: float, y: float, r: float) -> Any:
+        """Indices of points within distance `r` of (x, y)."""
+        r2 = r * r
+        cand = self._collect(x - r, y - r, x + r, y + r, x, y, r2)
+        if len(cand) == 0:
+            return cand
+        d2 = (self.x[cand] - x) ** 2 + (self.y[cand] - y) ** 2
+        return cand[d2 <= r2]
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> Any:
+        """Indices of points inside the axis-aligned box."""
+        cand = self._collect(x0, y0, x1, y1)
+        if len(cand) == 0:
+            return cand
+        px = self.x[cand]
+        py = self.y[cand]
+        return cand[(px >= x0) & (px <= x1) & (py >= y0) & (py <= y1)]
+
+    def knn(self, x: float, y: float, k: int, exclude: Optional[int] = None) -> Any:
+        """Indices of the `k` nearest points to (x, y), nearest first.
+
+        Visits nodes best-first by distance to their bounds and stops once
+        the next node is farther than the current k-th candidate.
+        """
+        if k <= 0 or len(self.x) == 0:
+            return np.empty(0, dtype=np.intp)
+        px = self.x
+        py = self.y
+        # max-heap (negated) of the best k (d2, index) pairs so far
+        best: list[tuple[float, int]] = []
+
+        def offer(i: int) -> None:
+            if i == exclude:
+                return
+            d2 = (float(px[i]) - x) ** 2 + (float(py[i]) - y) ** 2
+            if len(best) < k:
+                heapq.heappush(best, (-d2, i))
+            elif d2 < -best[0][0]:
+                heapq.heapreplace(best, (-d2, i))
+
+        for i in self._outside:
+            offer(i)
+        tick = 0
+        frontier: list[tuple[float, int, _Node]] = [(self.root.min_dist_sq(x, y), tick, self.root)]
+        while frontier:
+            d2, _, node = heapq.heappop(frontier)
+            if len(best) >= k and d2 > -best[0][0]:
+                break
+            if node.children is None:
+                for i in node.items:
+                    offer(i)
+            else:
+                for child in node.children:
+                    tick += 1
+                    heapq.heappush(frontier, (child.min_dist_sq(x, y), tick, child))
+        idx = np.asarray([i for _, i in best], dtype=np.intp)
+        return nearest_k(idx, px, py, x, y, k)
+
+    def neighbors(self, i: int, r: float) -> Any:
+        """Indices of points within `r` of point `i`, excluding `i`."""
+        idx = self.query_radius(float(self.x[i]), float(self.y[i]), r)
+        return idx[idx != i]
+
+    def leaves(self) -> list[tuple[float, float, float, float]]:
+        """(x, y, w, h) rectangles of every leaf, e.g. for debug drawing."""
+        out = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.children is None:
+                out.append((node.x0, node.y0, node.x1 - node.x0, node.y1 - node.y0))
+            else:
+                stack.extend(node.children)
+        return out
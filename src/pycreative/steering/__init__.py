@@ -0,0 +1,29 @@
+"""Vectorized steering behaviours (Nature of Code chapter 5).
+
+`Agents` keeps position, velocity, max speed and max force for a whole
+group of vehicles in NumPy arrays. Behaviours (`Seek`, `Flee`, `Arrive`,
+`Separate`, `Align`, `Cohesion`, `FollowPath`, `FollowField`) compute
+steering forces for every agent at once and are combined as weighted
+terms. Neighbour sums for the flocking behaviours come from one
+`BinLattice` pair search per step, so flocking costs near-linear array
+work instead of an O(N^2) Python loop.
+
+Requires NumPy (the `numeric` extra).
+"""
+from .agents import Agents
+from .behaviors import Behavior, Seek, Flee, Arrive, Separate, Align, Cohesion, FollowPath, FollowField
+from .neighbors import Neighborhood
+
+__all__ = [
+    "Agents",
+    "Behavior",
+    "Seek",
+    "Flee",
+    "Arrive",
+    "Separate",
+    "Align",
+    "Cohesion",
+    "FollowPath",
+    "FollowField",
+    "Neighborhood",
+]
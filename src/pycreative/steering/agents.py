@@ -0,0 +1,137 @@
+"""Structure-of-arrays vehicles driven by weighted steering behaviours."""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+from ..vector_array import PVectorArray
+from .behaviors import Behavior, limit
+from .neighbors import Neighborhood
+
+
+class Agents:
+    """A group of `n` vehicles stored as (2, n) position/velocity arrays.
+
+    `max_speed` and `max_force` are per-agent arrays (scalars broadcast).
+    Behaviours added with `add_behavior()` are evaluated on every
+    `update()` and their forces summed with each behaviour's `weight`:
+
+        flock = Agents(500, x=xs, y=ys, max_speed=3, max_force=0.05)
+        flock.add_behavior(Separate(25), weight=1.5)
+        flock.add_behavior(Align(50))
+        flock.add_behavior(Cohesion(50))
+        ...
+        flock.update()
+        flock.wrap(self.width, self.height)
+    """
+
+    def __init__(
+        self,
+        n: int,
+        x: Any = 0.0,
+        y: Any = 0.0,
+        vx: Any = 0.0,
+        vy: Any = 0.0,
+        max_speed: Any = 4.0,
+        max_force: Any = 0.1,
+    ) -> None:
+        n = int(n)
+        self._pos = np.zeros((2, n), dtype=np.float64)
+        self._vel = np.zeros((2, n), dtype=np.float64)
+        self._acc = np.zeros((2, n), dtype=np.float64)
+        self._pos[0] = x
+        self._pos[1] = y
+        self._vel[0] = vx
+        self._vel[1] = vy
+        self.max_speed = np.broadcast_to(np.asarray(max_speed, dtype=np.float64), (n,)).copy()
+        self.max_force = np.broadcast_to(np.asarray(max_force, dtype=np.float64), (n,)).copy()
+        self.behaviors: list[Behavior] = []
+        self.neighbors: Optional[Neighborhood] = None
+        self._lattice: Any = None
+
+    def __len__(self) -> int:
+        return self._pos.shape[1]
+
+    # --- views ---
+    @property
+    def position(self) -> PVectorArray:
+        """Positions as a PVectorArray sharing memory."""
+        return PVectorArray._wrap(self._pos)
+
+    @property
+    def velocity(self) -> PVectorArray:
+        return PVectorArray._wrap(self._vel)
+
+    @property
+    def acceleration(self) -> PVectorArray:
+        return PVectorArray._wrap(self._acc)
+
+    def headings(self) -> Any:
+        """Direction of travel of every agent in radians (for drawing)."""
+        return np.arctan2(self._vel[1], self._vel[0])
+
+    # --- behaviours ---
+    def add_behavior(self, behavior: Behavior, weight: Optional[float] = None) -> Behavior:
+        """Register a behaviour evaluated on every update(); `weight` overrides its own."""
+        if weight is not None:
+            behavior.weight = float(weight)
+        self.behaviors.append(behavior)
+        return behavior
+
+    def remove_behavior(self, behavior: Behavior) -> None:
+        try:
+            self.behaviors.remove(behavior)
+        except ValueError:
+            pass
+
+    def apply_force(self, fx: Any, fy: Any = None) -> None:
+        """Add to the acceleration of every agent (scalars or per-agent arrays).
+
+        A single PVector-like value or (fx, fy) pair is also accepted.
+        """
+        if fy is None:
+            if hasattr(fx, "x") and hasattr(fx, "y"):
+                fx, fy = fx.x, fx.y
+            else:
+                fx, fy = fx
+        self._acc[0] += fx
+        self._acc[1] += fy
+
+    def neighborhood(self, radius: float) -> Neighborhood:
+        """Neighbour pairs within `radius` of the current positions."""
+        nb = Neighborhood(self, radius, self._lattice)
+        self._lattice = nb.lattice
+        return nb
+
+    def steer(self) -> None:
+        """Accumulate the weighted forces of all enabled behaviours."""
+        active = [b for b in self.behaviors if b.enabled and b.weight != 0.0]
+        radius = max((b.radius for b in active), default=0.0)
+        self.neighbors = self.neighborhood(radius) if radius > 0.0 and len(self) else None
+        for b in active:
+            fx, fy = b.force(self, self.neighbors)
+            self._acc[0] += fx * b.weight
+            self._acc[1] += fy * b.weight
+
+    def update(self, dt: float = 1.0) -> None:
+        """Steer, integrate with speed limited to `max_speed`, then clear acceleration."""
+        self.steer()
+        vel = self._vel
+        if dt == 1.0:
+            vel += self._acc
+        else:
+            vel += self._acc * dt
+        vel[0], vel[1] = limit(vel[0], vel[1], self.max_speed)
+        if dt == 1.0:
+            self._pos += vel
+        else:
+            self._pos += vel * dt
+        self._acc[:] = 0.0
+
+    def wrap(self, width: float, height: float, margin: float = 0.0) -> None:
+        """Wrap agents leaving the (width, height) area around to the other side."""
+        for axis, size in ((0, width), (1, height)):
+            p = self._pos[axis]
+            p[p < -margin] = size + margin
+            p[p > size + margin] = -margin
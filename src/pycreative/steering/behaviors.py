@@ -0,0 +1,238 @@
+"""Steering behaviours evaluated for every agent at once.
+
+A behaviour is any object with `force(agents, neighbors)` returning an
+(fx, fy) pair of arrays, plus `weight`, `enabled` and `radius` attributes.
+`radius` is the neighbour distance the behaviour needs (0 for none);
+`Agents` runs one neighbour search per step at the largest radius and
+passes the resulting `Neighborhood` to every behaviour.
+
+Forces follow Reynolds' "steering = desired velocity - velocity", limited
+to each agent's `max_force`, as in the chapter 5 examples.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+from ..vector_array import _components
+
+if TYPE_CHECKING:
+    from .agents import Agents
+    from .neighbors import Neighborhood
+
+
+def limit(fx: Any, fy: Any, max_mag: Any) -> tuple[Any, Any]:
+    """Clamp vector lengths to `max_mag` (scalar or per-agent array)."""
+    m = np.hypot(fx, fy)
+    scale = np.where(m > max_mag, max_mag / np.where(m == 0.0, 1.0, m), 1.0)
+    return fx * scale, fy * scale
+
+
+def steer(agents: "Agents", dx: Any, dy: Any, speed: Any = None) -> tuple[Any, Any]:
+    """Steering force towards direction (dx, dy) at `speed` (default max speed).
+
+    Agents with a zero direction get no force.
+    """
+    m = np.hypot(dx, dy)
+    zero = m == 0.0
+    s = agents.max_speed if speed is None else speed
+    k = s / np.where(zero, 1.0, m)
+    fx = dx * k - agents._vel[0]
+    fy = dy * k - agents._vel[1]
+    fx, fy = limit(fx, fy, agents.max_force)
+    return np.where(zero, 0.0, fx), np.where(zero, 0.0, fy)
+
+
+def no_force(agents: "Agents") -> tuple[Any, Any]:
+    """Zero force for every agent (e.g. an empty flock with no neighbours)."""
+    n = len(agents)
+    return np.zeros(n), np.zeros(n)
+
+
+class Behavior:
+    """Base class; subclasses implement `force(agents, neighbors)`."""
+
+    weight = 1.0
+    enabled = True
+    radius = 0.0
+
+    def force(self, agents: "Agents", neighbors: Optional["Neighborhood"]) -> tuple[Any, Any]:  # pragma: no cover - interface
+        raise NotImplementedError
+
+
+class Seek(Behavior):
+    """Steer at full speed towards `target`.
+
+    `target` may be a PVector, an (x, y) pair, or per-agent targets as a
+    PVectorArray / (N, 2) array. Assign `target` every frame to chase a
+    moving point.
+    """
+
+    def __init__(self, target: Any, weight: float = 1.0) -> None:
+        self.target = target
+        self.weight = float(weight)
+
+    def force(self, agents: "Agents", neighbors: Optional["Neighborhood"]) -> tuple[Any, Any]:
+        tx, ty = _components(self.target)
+        return steer(agents, tx - agents._pos[0], ty - agents._pos[1])
+
+
+class Flee(Seek):
+    """Steer away from `target`; with `panic` set, only agents within that distance react."""
+
+    def __init__(self, target: Any, weight: float = 1.0, panic: Optional[float] = None) -> None:
+        super().__init__(target, weight)
+        self.panic = panic
+
+    def force(self, agents: "Agents", neighbors: Optional["Neighborhood"]) -> tuple[Any, Any]:
+        tx, ty = _components(self.target)
+        dx = agents._pos[0] - tx
+        dy = agents._pos[1] - ty
+        fx, fy = steer(agents, dx, dy)
+        if self.panic is not None:
+            far = np.hypot(dx, dy) > self.panic
+            fx = np.where(far, 0.0, fx)
+            fy = np.where(far, 0.0, fy)
+        return fx, fy
+
+
+class Arrive(Seek):
+    """Seek that slows down linearly within `slow_radius` of the target (Example 5.2)."""
+
+    def __init__(self, target: Any, weight: float = 1.0, slow_radius: float = 100.0) -> None:
+        super().__init__(target, weight)
+        self.slow_radius = float(slow_radius)
+
+    def force(self, agents: "Agents", neighbors: Optional["Neighborhood"]) -> tuple[Any, Any]:
+        tx, ty = _components(self.target)
+        dx = tx - agents._pos[0]
+        dy = ty - agents._pos[1]
+        d = np.hypot(dx, dy)
+        speed = agents.max_speed * np.minimum(d / self.slow_radius, 1.0)
+        k = speed / np.where(d == 0.0, 1.0, d)
+        return limit(dx * k - agents._vel[0], dy * k - agents._vel[1], agents.max_force)
+
+
+class Separate(Behavior):
+    """Steer away from neighbours closer than `radius`, weighted by 1/distance."""
+
+    def __init__(self, radius: float = 25.0, weight: float = 1.5) -> None:
+        self.radius = float(radius)
+        self.weight = float(weight)
+
+    def force(self, agents: "Agents", neighbors: Optional["Neighborhood"]) -> tuple[Any, Any]:
+        if neighbors is None or len(agents) == 0:
+            return no_force(agents)
+        i, _, dx, dy, d = neighbors.within(self.radius)
+        # unit vector away from the neighbour divided by distance
+        inv = 1.0 / (d * d)
+        sx = neighbors.sum(i, dx * inv)
+        sy = neighbors.sum(i, dy * inv)
+        # averaging does not change the direction steer() normalizes away
+        return steer(agents, sx, sy)
+
+
+class Align(Behavior):
+    """Steer towards the average heading of neighbours within `radius`."""
+
+    def __init__(self, radius: float = 50.0, weight: float = 1.0) -> None:
+        self.radius = float(radius)
+        self.weight = float(weight)
+
+    def force(self, agents: "Agents", neighbors: Optional["Neighborhood"]) -> tuple[Any, Any]:
+        if neighbors is None or len(agents) == 0:
+            return no_force(agents)
+        i, j, _, _, _ = neighbors.within(self.radius)
+        vx = neighbors.sum(i, agents._vel[0][j])
+        vy = neighbors.sum(i, agents._vel[1][j])
+        return steer(agents, vx, vy)
+
+
+class Cohesion(Behavior):
+    """Seek the centre of neighbours within `radius`."""
+
+    def __init__(self, radius: float = 50.0, weight: float = 1.0) -> None:
+        self.radius = float(radius)
+        self.weight = float(weight)
+
+    def force(self, agents: "Agents", neighbors: Optional["Neighborhood"]) -> tuple[Any, Any]:
+        if neighbors is None or len(agents) == 0:
+            return no_force(agents)
+        i, j, _, _, _ = neighbors.within(self.radius)
+        count = neighbors.count(i)
+        has = count > 0
+        safe = np.where(has, count, 1.0)
+        cx = neighbors.sum(i, agents._pos[0][j]) / safe
+        cy = neighbors.sum(i, agents._pos[1][j]) / safe
+        dx = np.where(has, cx - agents._pos[0], 0.0)
+        dy = np.where(has, cy - agents._pos[1], 0.0)
+        return steer(agents, dx, dy)
+
+
+class FollowPath(Behavior):
+    """Reynolds path following over a polyline (Examples 5.6-5.8).
+
+    Each agent predicts its position `lookahead` pixels ahead, projects it
+    onto the nearest path segment and, when farther than `path_radius` from
+    the path, seeks a point `ahead` pixels further along that segment.
+    `points` is a sequence of PVectors / pairs or an (M, 2) array.
+    """
+
+    def __init__(self, points: Any, path_radius: float = 20.0, weight: float = 1.0, lookahead: float = 50.0, ahead: float = 10.0, closed: bool = False) -> None:
+        pts = np.asarray([(p.x, p.y) if hasattr(p, "x") else (p[0], p[1]) for p in points], dtype=np.float64)
+        if len(pts) < 2:
+            raise ValueError("FollowPath needs at least two points")
+        if closed:
+            pts = np.vstack([pts, pts[:1]])
+        self.points = pts
+        self.path_radius = float(path_radius)
+        self.weight = float(weight)
+        self.lookahead = float(lookahead)
+        self.ahead = float(ahead)
+
+    def force(self, agents: "Agents", neighbors: Optional["Neighborhood"]) -> tuple[Any, Any]:
+        vx = agents._vel[0]
+        vy = agents._vel[1]
+        speed = np.hypot(vx, vy)
+        k = self.lookahead / np.where(speed == 0.0, 1.0, speed)
+        fx = agents._pos[0] + vx * k
+        fy = agents._pos[1] + vy * k
+        a = self.points[:-1]
+        b = self.points[1:]
+        seg = b - a
+        seg_len = np.hypot(seg[:, 0], seg[:, 1])
+        seg_len = np.where(seg_len == 0.0, 1.0, seg_len)
+        ux = seg[:, 0] / seg_len
+        uy = seg[:, 1] / seg_len
+        # (N, M) projections of every prediction onto every segment
+        t = (fx[:, None] - a[None, :, 0]) * ux[None, :] + (fy[:, None] - a[None, :, 1]) * uy[None, :]
+        t = np.clip(t, 0.0, seg_len[None, :])
+        nx = a[None, :, 0] + ux[None, :] * t
+        ny = a[None, :, 1] + uy[None, :] * t
+        dist = np.hypot(fx[:, None] - nx, fy[:, None] - ny)
+        best = np.argmin(dist, axis=1)
+        rows = np.arange(len(best))
+        record = dist[rows, best]
+        tx = nx[rows, best] + ux[best] * self.ahead
+        ty = ny[rows, best] + uy[best] * self.ahead
+        sx, sy = steer(agents, tx - agents._pos[0], ty - agents._pos[1])
+        off = record > self.path_radius
+        return np.where(off, sx, 0.0), np.where(off, sy, 0.0)
+
+
+class FollowField(Behavior):
+    """Steer along a flow field at full speed (Example 5.4).
+
+    `field` is any object with `sample(xs, ys, mode)` returning (vx, vy)
+    arrays, such as `pycreative.flow_field.FlowField`.
+    """
+
+    def __init__(self, field: Any, weight: float = 1.0, mode: str = "bilinear") -> None:
+        self.field = field
+        self.weight = float(weight)
+        self.mode = mode
+
+    def force(self, agents: "Agents", neighbors: Optional["Neighborhood"]) -> tuple[Any, Any]:
+        vx, vy = self.field.sample(agents._pos[0], agents._pos[1], mode=self.mode)
+        return steer(agents, vx, vy)
@@ -0,0 +1,54 @@
+"""Per-step neighbour pairs shared by the flocking behaviours."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ..spatial import BinLattice
+
+if TYPE_CHECKING:
+    from .agents import Agents
+
+
+class Neighborhood:
+    """All agent pairs within `radius` (inclusive), found with one grid search.
+
+    `i`, `j` are index arrays (each pair in both orders), `dx`, `dy` the
+    offset from agent j to agent i and `d` its length. Behaviours with a
+    smaller radius filter these arrays with `within()` and reduce them
+    per agent with `sum()`/`count()`.
+    """
+
+    def __init__(self, agents: "Agents", radius: float, lattice: Any = None) -> None:
+        self.n = len(agents)
+        self.radius = float(radius)
+        x = agents._pos[0]
+        y = agents._pos[1]
+        if lattice is None or lattice.cell_size != self.radius:
+            lattice = BinLattice(self.radius)
+        self.lattice = lattice.rebuild(x, y)
+        i, j = lattice.pairs(self.radius)
+        self.i = i
+        self.j = j
+        self.dx = x[i] - x[j]
+        self.dy = y[i] - y[j]
+        self.d = np.hypot(self.dx, self.dy)
+        self._within: dict[float, tuple[Any, Any, Any, Any, Any]] = {}
+
+    def within(self, r: float) -> tuple[Any, Any, Any, Any, Any]:
+        """(i, j, dx, dy, d) for pairs with 0 < d < r (cached per radius)."""
+        key = float(r)
+        hit = self._within.get(key)
+        if hit is None:
+            keep = (self.d > 0.0) & (self.d < key)
+            hit = (self.i[keep], self.j[keep], self.dx[keep], self.dy[keep], self.d[keep])
+            self._within[key] = hit
+        return hit
+
+    def sum(self, i: Any, values: Any) -> Any:
+        """Per-agent sum of `values` grouped by index array `i`."""
+        return np.bincount(i, weights=values, minlength=self.n)
+
+    def count(self, i: Any) -> Any:
+        return np.bincount(i, minlength=self.n).astype(np.float64)
@@ -0,0 +1,108 @@
+"""Reusable pool of offscreen pygame surfaces.
+
+`create_graphics()` takes its buffers from a `SurfacePool`. A buffer comes
+back to the pool only when it is explicitly released (`off.release()`, or
+at the end of a `with self.scratch_graphics(w, h) as g:` block), so
+long-lived offscreen surfaces behave exactly as before. Sketches that build
+scratch buffers every frame (glow passes, masks) reuse the same allocations
+instead of creating new multi-megabyte surfaces each time.
+
+Surfaces are reused only with the same size and alpha flag and are
+cleared before they are handed out again. Idle pooled surfaces are bounded
+by a byte budget and evicted least recently released first.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import weakref
+
+import pygame
+
+from . import transform_cache as _transform_cache
+from .transform_cache import surface_bytes
+
+DEFAULT_POOL_BYTES = 64 * 1024 * 1024
+
+PoolKey = tuple[int, int, int]
+
+
+class SurfacePool:
+    """Free lists of surfaces keyed by (w, h, SRCALPHA flag) with a byte budget."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_POOL_BYTES) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        self.current_bytes = 0
+        self._free: dict[PoolKey, list[pygame.Surface]] = {}
+        # id(surface) -> key, in release order (oldest first) for eviction
+        self._order: "OrderedDict[int, PoolKey]" = OrderedDict()
+        # buffers currently handed out; weak so never-released surfaces
+        # (ordinary create_graphics() buffers) are freed normally
+        self._leased: "weakref.WeakValueDictionary[int, pygame.Surface]" = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def acquire(self, w: int, h: int, flags: int = pygame.SRCALPHA) -> pygame.Surface:
+        """Return a cleared surface of the given size, reusing a released one if possible."""
+        key = (max(1, int(w)), max(1, int(h)), int(flags) & pygame.SRCALPHA)
+        free = self._free.get(key)
+        if free:
+            surf = free.pop()
+            self._order.pop(id(surf), None)
+            self.current_bytes -= surface_bytes(surf)
+            surf.fill((0, 0, 0, 0) if surf.get_flags() & pygame.SRCALPHA else (0, 0, 0))
+            _transform_cache.mark_modified(surf)
+            self.hits += 1
+        else:
+            surf = pygame.Surface(key[:2], flags=int(flags))
+            self.misses += 1
+        self._leased[id(surf)] = surf
+        return surf
+
+    def release(self, surf: pygame.Surface) -> bool:
+        """Return a leased surface to the pool. Unknown or already released surfaces are ignored."""
+        if self._leased.get(id(surf)) is not surf:
+            return False
+        del self._leased[id(surf)]
+        w, h = surf.get_size()
+        key = (w, h, surf.get_flags() & pygame.SRCALPHA)
+        self._free.setdefault(key, []).append(surf)
+        self._order[id(surf)] = key
+        self.current_bytes += surface_bytes(surf)
+        self._evict()
+        return True
+
+    def set_budget(self, budget_bytes: int) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._evict()
+
+    def clear(self) -> None:
+        """Drop every idle surface (leased surfaces are unaffected)."""
+        self._free.clear()
+        self._order.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "idle": len(self._order),
+            "leased": len(self._leased),
+            "bytes": self.current_bytes,
+            "leased_bytes": sum(surface_bytes(s) for s in list(self._leased.values())),
+            "budget": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self) -> None:
+        while self.current_bytes > self.budget_bytes and self._order:
+            sid, key = self._order.popitem(last=False)
+            free = self._free.get(key, [])
+            for i, s in enumerate(free):
+                if id(s) == sid:
+                    del free[i]
+                    self.current_bytes -= surface_bytes(s)
+                    break
+            if not free:
+                self._free.pop(key, None)
+            self.evictions += 1
@@ -0,0 +1,429 @@
+"""Caches for derived (scaled) versions of static images.
+
+Drawing `image(img, x, y, w, h)` used to call `pygame.transform.smoothscale`
+on every frame. For images whose pixels do not change (anything loaded via
+`Assets.load_image`) the scaled result is cached here, keyed by
+(source, version, target size, filter). Downscales start from a lazily
+built power-of-two mipmap chain so arbitrary sizes resample from the nearest
+larger level instead of the full-resolution source.
+
+Only surfaces registered with `register_static()` are cached; all other
+sources (the display, per-frame offscreen buffers) are scaled directly every
+call, exactly as before. Every `Surface` drawing and pixel method calls
+`mark_modified()` after writing; code that edits a registered image through
+its raw `pygame.Surface` must call it too so stale entries are never served.
+
+All derived surfaces share one LRU with a byte budget. `Assets` exposes the
+budget as its asset cache budget (`Assets.set_cache_budget()`).
+
+Rotated copies (drawn under a rotate/scale transform) live in a second LRU
+with its own budget so a precomputed set of sprite rotations is not flushed
+by ordinary scaled draws. Rotations are cached by their exact angle and
+zoom, so repeated transforms are reused without changing how anything
+looks; sketches that want more reuse (slowly spinning sprites) can opt in
+to quantized steps with `set_rotation_quantization()`, and
+`precompute_rotations()` fills every step up front. Transforms containing shear or non-uniform scale are not a
+rotozoom at all and go through `affine()`, which reproduces the matrix
+exactly instead.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Hashable, Optional
+import math
+import weakref
+
+import pygame
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+SMOOTH = "smooth"
+NEAREST = "nearest"
+
+# Quantization applied to rotozoom parameters of static sources; 0 = exact
+DEFAULT_ANGLE_STEP = 0.0
+DEFAULT_SCALE_STEP = 0.0
+# step used by precompute_rotations() when quantization is off
+PRECOMPUTE_ANGLE_STEP = 1.0
+
+
+def surface_bytes(surf: pygame.Surface) -> int:
+    """Approximate memory held by a surface's pixels."""
+    try:
+        w, h = surf.get_size()
+        return w * h * max(1, surf.get_bytesize())
+    except Exception:
+        return 0
+
+
+class SurfaceLRU:
+    """Least-recently-used cache of surfaces bounded by total pixel bytes."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        self.budget_bytes = int(budget_bytes)
+        self._items: "OrderedDict[Hashable, tuple[Any, int]]" = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def get(self, key: Hashable) -> Any:
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None) -> None:
+        size = surface_bytes(value) if nbytes is None else int(nbytes)
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.current_bytes -= old[1]
+        if size > self.budget_bytes:
+            # never let one oversized entry flush the whole cache
+            return
+        self._items[key] = (value, size)
+        self.current_bytes += size
+        self._evict()
+
+    def pop(self, key: Hashable) -> Any:
+        item = self._items.pop(key, None)
+        if item is None:
+            return None
+        self.current_bytes -= item[1]
+        return item[0]
+
+    def set_budget(self, budget_bytes: int) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._evict()
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._items),
+            "bytes": self.current_bytes,
+            "budget": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self) -> None:
+        while self.current_bytes > self.budget_bytes and self._items:
+            _key, (_val, size) = self._items.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+
+
+# Shared cache for all derived surfaces
+_cache = SurfaceLRU()
+# Rotated/affine copies, kept apart so precomputed rotations survive
+_rot_cache = SurfaceLRU()
+_angle_step = DEFAULT_ANGLE_STEP
+_scale_step = DEFAULT_SCALE_STEP
+
+# Registered static sources -> [token, version]. Tokens are never reused, so
+# entries for a garbage-collected source can never be served for a new one.
+_registry: "weakref.WeakKeyDictionary[pygame.Surface, list[int]]" = weakref.WeakKeyDictionary()
+_tokens = count(1)
+# ids of registered sources; lets mark_modified(), which runs after every
+# Surface draw call, skip the weak-dict lookup for non-static surfaces
+_static_ids: set[int] = set()
+
+
+def register_static(surf: pygame.Surface) -> None:
+    """Mark `surf` as a static image whose derived surfaces may be cached."""
+    try:
+        if surf not in _registry:
+            _registry[surf] = [next(_tokens), 0]
+            _static_ids.add(id(surf))
+            weakref.finalize(surf, _static_ids.discard, id(surf))
+    except TypeError:
+        pass
+
+
+def is_static(surf: object) -> bool:
+    try:
+        return surf in _registry
+    except TypeError:
+        return False
+
+
+def mark_modified(surf: pygame.Surface) -> None:
+    """Invalidate cached derivatives of `surf` after its pixels changed."""
+    if id(surf) not in _static_ids:
+        return
+    try:
+        entry = _registry.get(surf)
+    except TypeError:
+        return
+    if entry is not None:
+        entry[1] += 1
+
+
+def set_budget(budget_bytes: int) -> None:
+    """Set the byte budget shared by all cached derived surfaces."""
+    _cache.set_budget(budget_bytes)
+
+
+def get_budget() -> int:
+    return _cache.budget_bytes
+
+
+def clear() -> None:
+    _cache.clear()
+    _rot_cache.clear()
+
+
+def stats() -> dict:
+    """Return hit/miss/eviction counters and memory use of the shared cache."""
+    return _cache.stats()
+
+
+def _resample(src: pygame.Surface, size: tuple[int, int], filt: str) -> pygame.Surface:
+    if filt == NEAREST:
+        return pygame.transform.scale(src, size)
+    try:
+        return pygame.transform.smoothscale(src, size)
+    except ValueError:
+        # smoothscale only supports 24/32-bit surfaces
+        return pygame.transform.scale(src, size)
+
+
+def _mip_level(src: pygame.Surface, ident: tuple[int, int], level: int) -> pygame.Surface:
+    """Return mip `level` of `src` (level 0 is the source), building lazily."""
+    if level <= 0:
+        return src
+    key = (ident, "mip", level)
+    surf = _cache.get(key)
+    if surf is not None:
+        return surf
+    parent = _mip_level(src, ident, level - 1)
+    pw, ph = parent.get_size()
+    surf = _resample(parent, (max(1, pw // 2), max(1, ph // 2)), SMOOTH)
+    _cache.put(key, surf)
+    return surf
+
+
+def _pick_level(src_size: tuple[int, int], size: tuple[int, int]) -> int:
+    """Deepest power-of-two level still at least as large as `size`."""
+    sw, sh = src_size
+    tw, th = size
+    level = 0
+    while (sw >> (level + 1)) >= tw and (sh >> (level + 1)) >= th and (sw >> (level + 1)) > 0 and (sh >> (level + 1)) > 0:
+        level += 1
+    return level
+
+
+def scaled(src: pygame.Surface, size: tuple[int, int], filt: str = SMOOTH) -> pygame.Surface:
+    """Return `src` resampled to `size`, cached when `src` is registered static."""
+    size = (int(size[0]), int(size[1]))
+    if src.get_size() == size:
+        return src
+    try:
+        entry = _registry.get(src)
+    except TypeError:
+        entry = None
+    if entry is None or size[0] <= 0 or size[1] <= 0:
+        return _resample(src, size, filt)
+    ident = (entry[0], entry[1])
+    key = (ident, size, filt)
+    out = _cache.get(key)
+    if out is not None:
+        return out
+    base = src
+    if filt == SMOOTH:
+        base = _mip_level(src, ident, _pick_level(src.get_size(), size))
+    out = _resample(base, size, filt)
+    _cache.put(key, out)
+    # derived copies never change, so they can feed the rotation cache too
+    register_static(out)
+    return out
+
+
+def scaled_region(src: pygame.Surface, rect: pygame.Rect, size: tuple[int, int], filt: str = SMOOTH) -> pygame.Surface:
+    """Return the `rect` region of `src` resampled to `size` (cached when static)."""
+    size = (int(size[0]), int(size[1]))
+    region = (rect.x, rect.y, rect.width, rect.height)
+    try:
+        entry = _registry.get(src)
+    except TypeError:
+        entry = None
+    key = None
+    if entry is not None:
+        key = ((entry[0], entry[1]), "region", region, size, filt)
+        out = _cache.get(key)
+        if out is not None:
+            return out
+    flags = pygame.SRCALPHA if (src.get_flags() & pygame.SRCALPHA) else 0
+    tmp = pygame.Surface((rect.width, rect.height), flags)
+    tmp.blit(src, (0, 0), rect)
+    out = tmp if tmp.get_size() == size else _resample(tmp, size, filt)
+    if key is not None:
+        _cache.put(key, out)
+    return out
+
+
+def set_rotation_quantization(angle_step: Optional[float] = None, scale_step: Optional[float] = None) -> None:
+    """Set the angle (degrees) and zoom steps used to quantize cached rotations.
+
+    A step of 0 (the default) caches exact values without snapping.
+    """
+    global _angle_step, _scale_step
+    if angle_step is not None:
+        if angle_step < 0:
+            raise ValueError("angle_step must not be negative")
+        _angle_step = float(angle_step)
+    if scale_step is not None:
+        if scale_step < 0:
+            raise ValueError("scale_step must not be negative")
+        _scale_step = float(scale_step)
+    _rot_cache.clear()
+
+
+def set_rotation_budget(budget_bytes: int) -> None:
+    """Set the byte budget of the rotated-image cache."""
+    _rot_cache.set_budget(budget_bytes)
+
+
+def rotation_stats() -> dict:
+    return _rot_cache.stats()
+
+
+def _quantize(value: float, step: float) -> float:
+    if step <= 0.0:
+        return round(value, 6)
+    return round(round(value / step) * step, 6)
+
+
+def rotozoomed(src: pygame.Surface, angle: float, scale: float = 1.0) -> pygame.Surface:
+    """`pygame.transform.rotozoom`, cached (and quantized if enabled) for static sources.
+
+    `angle` is in degrees (counter-clockwise, as in pygame). Non-static
+    sources are rotated exactly on every call.
+    """
+    try:
+        entry = _registry.get(src)
+    except TypeError:
+        entry = None
+    if entry is None:
+        return pygame.transform.rotozoom(src, angle, scale)
+    qa = _quantize(angle % 360.0, _angle_step) % 360.0
+    qs = _quantize(scale, _scale_step)
+    if qa == 0.0 and qs == 1.0:
+        return src
+    key = ((entry[0], entry[1]), "rot", qa, qs)
+    out = _rot_cache.get(key)
+    if out is None:
+        out = pygame.transform.rotozoom(src, qa, qs)
+        _rot_cache.put(key, out)
+    return out
+
+
+def precompute_rotations(src: pygame.Surface, scale: float = 1.0, angle_step: Optional[float] = None) -> int:
+    """Build every quantized rotation of `src` at `scale` up front.
+
+    `src` is registered as static if needed. Passing `angle_step` also
+    changes the global quantization step; without it, quantization is
+    switched on at `PRECOMPUTE_ANGLE_STEP` degrees if it was off, since
+    exact angles would never hit the precomputed set. Returns the number
+    of rotations now cached (limited by the rotation budget).
+    """
+    if angle_step is None and _angle_step <= 0.0:
+        angle_step = PRECOMPUTE_ANGLE_STEP
+    if angle_step is not None:
+        set_rotation_quantization(angle_step=angle_step)
+    register_static(src)
+    steps = max(1, int(round(360.0 / _angle_step)))
+    for i in range(steps):
+        rotozoomed(src, i * _angle_step, scale)
+    entry = _registry.get(src)
+    if entry is None:
+        return 0
+    ident = (entry[0], entry[1])
+    qs = _quantize(scale, _scale_step)
+    count_cached = 0
+    for i in range(steps):
+        qa = _quantize(i * _angle_step, _angle_step) % 360.0
+        if (qa == 0.0 and qs == 1.0) or (ident, "rot", qa, qs) in _rot_cache:
+            count_cached += 1
+    return count_cached
+
+
+def is_similarity(a: float, b: float, c: float, d: float, tol: float = 1e-6) -> bool:
+    """True if the linear part [[a, c], [b, d]] is rotation + uniform scale."""
+    scale = max(abs(a), abs(b), abs(c), abs(d), 1.0)
+    return abs(a - d) <= tol * scale and abs(b + c) <= tol * scale
+
+
+def _affine_build(src: pygame.Surface, a: float, b: float, c: float, d: float) -> Optional[tuple[pygame.Surface, tuple[float, float]]]:
+    w, h = src.get_size()
+    # QR decomposition: M = Q(theta) @ [[r11, r12], [0, r22]], r11 > 0
+    r11 = math.hypot(a, b)
+    if r11 == 0.0 or w == 0 or h == 0:
+        return None
+    q1x, q1y = a / r11, b / r11
+    r12 = q1x * c + q1y * d
+    r22 = -q1y * c + q1x * d
+    if abs(r22) < 1e-12:
+        return None
+    sw = max(1, int(round(r11 * w)))
+    sh = max(1, int(round(abs(r22) * h)))
+    body = scaled(src, (sw, sh))
+    if r22 < 0:
+        body = pygame.transform.flip(body, False, True)
+    # Shear along x: row j (at y' = ymin + j) shifts by r12 * y, y = y' / r22
+    ymin = min(0.0, r22 * h)
+    xmin = min(0.0, r12 * h)
+    k = r12 / r22
+    extra = int(math.ceil(abs(r12) * h))
+    flags = pygame.SRCALPHA
+    sheared = pygame.Surface((sw + extra, sh), flags)
+    sheared.fill((0, 0, 0, 0))
+    row = pygame.Rect(0, 0, sw, 1)
+    for j in range(sh):
+        row.y = j
+        shift = k * (ymin + j + 0.5) - xmin
+        sheared.blit(body, (int(round(shift)), j), row)
+    angle = math.degrees(math.atan2(b, a))
+    out = pygame.transform.rotozoom(sheared, -angle, 1.0) if angle else sheared
+    # rotozoom keeps the centre: map the pre-rotation box centre through Q
+    cx = xmin + sheared.get_width() / 2.0
+    cy = ymin + sheared.get_height() / 2.0
+    rx = q1x * cx - q1y * cy
+    ry = q1y * cx + q1x * cy
+    return out, (rx - out.get_width() / 2.0, ry - out.get_height() / 2.0)
+
+
+def affine(src: pygame.Surface, a: float, b: float, c: float, d: float) -> Optional[tuple[pygame.Surface, tuple[float, float]]]:
+    """Apply the linear map [[a, c], [b, d]] (shear allowed) to `src`.
+
+    Returns `(surface, (ox, oy))` where `(ox, oy)` is the offset of the
+    result's top-left corner from the transformed image origin, or None
+    for a degenerate matrix. Results are cached for static sources.
+    """
+    try:
+        entry = _registry.get(src)
+    except TypeError:
+        entry = None
+    if entry is None:
+        return _affine_build(src, a, b, c, d)
+    key = ((entry[0], entry[1]), "affine", tuple(round(v, 4) for v in (a, b, c, d)))
+    out = _rot_cache.get(key)
+    if out is None:
+        out = _affine_build(src, a, b, c, d)
+        if out is not None:
+            _rot_cache.put(key, out, surface_bytes(out[0]))
+    return out
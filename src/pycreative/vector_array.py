@@ -0,0 +1,298 @@
+"""Structure-of-arrays storage for many 2D vectors.
+
+`PVector` is convenient for a handful of movers, but operator overloads
+allocate a new object per particle per frame. `PVectorArray` stores N vectors
+as two contiguous float64 arrays (`x` and `y`) and performs the familiar
+PVector operations on all of them at once. Mutating methods work in place
+and return self, mirroring PVector's chaining style.
+
+Indexing returns a live `PVectorView`, a PVector subclass reading and writing
+the underlying arrays, so code written against PVector keeps working on
+individual elements. Slices return PVectorArrays sharing memory.
+
+Pass a PVectorArray straight to the batched draw helpers
+(`points()`, `circles()`).
+
+Requires NumPy (the `numeric` extra).
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator
+import math
+
+import numpy as np
+
+from .vector import PVector
+
+
+class PVectorView(PVector):
+    """A PVector bound to element `i` of a PVectorArray (reads/writes are live)."""
+
+    __slots__ = ("_arr", "_i")
+
+    def __init__(self, arr: "PVectorArray", i: int) -> None:
+        # bypass PVector.__init__: storage lives in the array
+        self._arr = arr
+        self._i = i
+
+    @property
+    def x(self) -> float:
+        return float(self._arr._xy[0, self._i])
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._arr._xy[0, self._i] = value
+
+    @property
+    def y(self) -> float:
+        return float(self._arr._xy[1, self._i])
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._arr._xy[1, self._i] = value
+
+    def __repr__(self) -> str:  # pragma: no cover - trivial
+        return f"PVectorView({self.x!r}, {self.y!r})"
+
+
+def _components(other: Any) -> tuple[Any, Any]:
+    """Return (x, y) operands for a PVectorArray, PVector, pair or (N,2) array."""
+    if isinstance(other, PVectorArray):
+        return other.x, other.y
+    if isinstance(other, PVector):
+        return other.x, other.y
+    arr = np.asarray(other, dtype=np.float64)
+    if arr.ndim == 1 and arr.shape[0] == 2:
+        return arr[0], arr[1]
+    if arr.ndim == 2 and arr.shape[1] == 2:
+        return arr[:, 0], arr[:, 1]
+    raise TypeError("Expected a PVectorArray, PVector, (x, y) pair or (N, 2) array")
+
+
+class PVectorArray:
+    """N two-dimensional vectors stored as contiguous `x` and `y` arrays."""
+
+    __slots__ = ("_xy",)
+
+    def __init__(self, n: int = 0, x: Any = None, y: Any = None) -> None:
+        if x is None and y is None:
+            self._xy = np.zeros((2, int(n)), dtype=np.float64)
+            return
+        xs = np.asarray(x if x is not None else 0.0, dtype=np.float64)
+        ys = np.asarray(y if y is not None else 0.0, dtype=np.float64)
+        xs, ys = np.broadcast_arrays(xs, ys)
+        if xs.ndim != 1:
+            raise ValueError("PVectorArray components must be one-dimensional")
+        self._xy = np.stack([xs, ys]).astype(np.float64, copy=True)
+
+    @classmethod
+    def _wrap(cls, xy: Any) -> "PVectorArray":
+        out = cls.__new__(cls)
+        out._xy = xy
+        return out
+
+    # --- constructors ---
+    @classmethod
+    def zeros(cls, n: int) -> "PVectorArray":
+        return cls(n)
+
+    @classmethod
+    def from_xy(cls, x: Any, y: Any) -> "PVectorArray":
+        return cls(x=x, y=y)
+
+    @classmethod
+    def from_points(cls, points: Iterable[Any]) -> "PVectorArray":
+        """Build from PVectors or (x, y) pairs."""
+        pts = [(p.x, p.y) if isinstance(p, PVector) else (float(p[0]), float(p[1])) for p in points]
+        if not pts:
+            return cls(0)
+        arr = np.asarray(pts, dtype=np.float64)
+        return cls(x=arr[:, 0], y=arr[:, 1])
+
+    @classmethod
+    def from_angles(cls, theta: Any, mag: Any = 1.0) -> "PVectorArray":
+        """Vectors of length `mag` pointing along angles `theta` (radians)."""
+        t = np.asarray(theta, dtype=np.float64)
+        m = np.asarray(mag, dtype=np.float64)
+        return cls(x=np.cos(t) * m, y=np.sin(t) * m)
+
+    @classmethod
+    def random2d(cls, n: int, rng: Any = None) -> "PVectorArray":
+        """`n` random unit vectors; `rng` is an optional NumPy Generator."""
+        gen = rng if rng is not None else np.random.default_rng()
+        return cls.from_angles(gen.random(int(n)) * 2 * math.pi)
+
+    # --- storage ---
+    @property
+    def x(self) -> Any:
+        return self._xy[0]
+
+    @x.setter
+    def x(self, value: Any) -> None:
+        self._xy[0] = value
+
+    @property
+    def y(self) -> Any:
+        return self._xy[1]
+
+    @y.setter
+    def y(self, value: Any) -> None:
+        self._xy[1] = value
+
+    @property
+    def xy(self) -> Any:
+        """An (N, 2) view of the vectors (shares memory)."""
+        return self._xy.T
+
+    def __len__(self) -> int:
+        return self._xy.shape[1]
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, (int, np.integer)):
+            i = int(index)
+            n = len(self)
+            if i < 0:
+                i += n
+            if not 0 <= i < n:
+                raise IndexError("PVectorArray index out of range")
+            return PVectorView(self, i)
+        # slices share memory; masks / index arrays copy (NumPy semantics)
+        return PVectorArray._wrap(self._xy[:, index])
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        vx, vy = _components(value)
+        self._xy[0, index] = vx
+        self._xy[1, index] = vy
+
+    def __iter__(self) -> Iterator[PVectorView]:
+        for i in range(len(self)):
+            yield PVectorView(self, i)
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> Any:
+        out = self._xy.T
+        return out.astype(dtype) if dtype is not None else out
+
+    def copy(self) -> "PVectorArray":
+        return PVectorArray._wrap(self._xy.copy())
+
+    def to_list(self) -> list[PVector]:
+        """Return independent PVector copies."""
+        return [PVector(x, y) for x, y in self._xy.T.tolist()]
+
+    def __repr__(self) -> str:  # pragma: no cover - trivial
+        return f"PVectorArray(n={len(self)})"
+
+    # --- mutating whole-array operations (return self) ---
+    def set(self, other: Any) -> "PVectorArray":
+        ox, oy = _components(other)
+        self._xy[0] = ox
+        self._xy[1] = oy
+        return self
+
+    def add(self, other: Any) -> "PVectorArray":
+        ox, oy = _components(other)
+        self._xy[0] += ox
+        self._xy[1] += oy
+        return self
+
+    def sub(self, other: Any) -> "PVectorArray":
+        ox, oy = _components(other)
+        self._xy[0] -= ox
+        self._xy[1] -= oy
+        return self
+
+    def mult(self, scalar: Any) -> "PVectorArray":
+        """Scale by a scalar or a per-vector array of factors."""
+        self._xy *= np.asarray(scalar, dtype=np.float64)
+        return self
+
+    def div(self, scalar: Any) -> "PVectorArray":
+        """Divide by a scalar or per-vector array; zero divisors leave vectors unchanged."""
+        s = np.asarray(scalar, dtype=np.float64)
+        if s.ndim == 0:
+            if float(s) != 0.0:
+                self._xy /= s
+            return self
+        safe = np.where(s == 0.0, 1.0, s)
+        self._xy /= safe
+        return self
+
+    def mag(self) -> Any:
+        return np.hypot(self._xy[0], self._xy[1])
+
+    def mag_sq(self) -> Any:
+        return self._xy[0] * self._xy[0] + self._xy[1] * self._xy[1]
+
+    def normalize(self) -> "PVectorArray":
+        """Scale every non-zero vector to unit length."""
+        return self.div(self.mag())
+
+    def set_mag(self, m: Any) -> "PVectorArray":
+        return self.normalize().mult(m)
+
+    def limit(self, max_val: Any) -> "PVectorArray":
+        """Clamp vector lengths to `max_val` (scalar or per-vector array)."""
+        m = self.mag()
+        limit = np.asarray(max_val, dtype=np.float64)
+        over = m > limit
+        if np.any(over):
+            factor = np.where(over, limit / np.where(m == 0.0, 1.0, m), 1.0)
+            self._xy *= factor
+        return self
+
+    def heading(self) -> Any:
+        return np.arctan2(self._xy[1], self._xy[0])
+
+    def rotate(self, theta: Any) -> "PVectorArray":
+        """Rotate by `theta` radians (scalar or per-vector array)."""
+        c = np.cos(theta)
+        s = np.sin(theta)
+        x = self._xy[0]
+        y = self._xy[1]
+        nx = x * c - y * s
+        self._xy[1] = x * s + y * c
+        self._xy[0] = nx
+        return self
+
+    def lerp(self, other: Any, t: Any) -> "PVectorArray":
+        ox, oy = _components(other)
+        tt = np.asarray(t, dtype=np.float64)
+        self._xy[0] += (ox - self._xy[0]) * tt
+        self._xy[1] += (oy - self._xy[1]) * tt
+        return self
+
+    def dist(self, other: Any) -> Any:
+        ox, oy = _components(other)
+        return np.hypot(self._xy[0] - ox, self._xy[1] - oy)
+
+    def dot(self, other: Any) -> Any:
+        ox, oy = _components(other)
+        return self._xy[0] * ox + self._xy[1] * oy
+
+    # --- operators: in-place forms mutate, binary forms return new arrays ---
+    def __iadd__(self, other: Any) -> "PVectorArray":
+        return self.add(other)
+
+    def __isub__(self, other: Any) -> "PVectorArray":
+        return self.sub(other)
+
+    def __imul__(self, scalar: Any) -> "PVectorArray":
+        return self.mult(scalar)
+
+    def __itruediv__(self, scalar: Any) -> "PVectorArray":
+        return self.div(scalar)
+
+    def __add__(self, other: Any) -> "PVectorArray":
+        return self.copy().add(other)
+
+    def __sub__(self, other: Any) -> "PVectorArray":
+        return self.copy().sub(other)
+
+    def __mul__(self, scalar: Any) -> "PVectorArray":
+        return self.copy().mult(scalar)
+
+    def __rmul__(self, scalar: Any) -> "PVectorArray":
+        return self.copy().mult(scalar)
+
+    def __truediv__(self, scalar: Any) -> "PVectorArray":
+        return self.copy().div(scalar)
@@ -0,0 +1,56 @@
+import os
+
+from pycreative.assets import Assets
+
+
+def test_resolve_path_caches_hits_and_misses(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "a.png").write_bytes(b"")
+    assets = Assets(str(tmp_path))
+
+    assert assets._resolve_path("a.png") == str(data / "a.png")
+    assert assets._resolve_path("missing.png") is None
+
+    calls = []
+    real_listdir = os.listdir
+
+    def counting_listdir(p):
+        calls.append(p)
+        return real_listdir(p)
+
+    monkeypatch.setattr(os, "listdir", counting_listdir)
+    for _ in range(5):
+        assert assets._resolve_path("a.png") == str(data / "a.png")
+        assert assets._resolve_path("missing.png") is None
+    assert calls == []
+
+
+def test_resolve_path_prefers_data_then_sketch_dir(tmp_path):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "both.txt").write_text("x")
+    (tmp_path / "data" / "both.txt").write_text("y")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "nested.txt").write_text("z")
+    assets = Assets(str(tmp_path))
+    assert assets._resolve_path("both.txt") == str(tmp_path / "data" / "both.txt")
+    assert assets._resolve_path("sub/nested.txt") == str(tmp_path / "sub" / "nested.txt")
+
+
+def test_invalidation_explicit_and_by_polling(tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    assets = Assets(str(tmp_path))
+    assert assets._resolve_path("late.png") is None
+    (data / "late.png").write_bytes(b"")
+    # negative cache still answers until invalidated
+    assert assets._resolve_path("late.png") is None
+    assets.invalidate_paths()
+    assert assets._resolve_path("late.png") == str(data / "late.png")
+
+    polled = Assets(str(tmp_path), poll_interval=0.0)
+    assert polled._resolve_path("later.png") is None
+    (data / "later.png").write_bytes(b"")
+    st = os.stat(data)
+    os.utime(data, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert polled._resolve_path("later.png") == str(data / "later.png")
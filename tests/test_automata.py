@@ -0,0 +1,61 @@
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pycreative.automata import ElementaryCA, GridRenderer, LifeLike, parse_rule
+from pycreative.graphics import Surface
+
+
+def _reference_life(board):
+    rows, cols = board.shape
+    out = board.copy()
+    for y in range(rows):
+        for x in range(cols):
+            n = sum(board[(y + dy) % rows, (x + dx) % cols] for dy in (-1, 0, 1) for dx in (-1, 0, 1)) - board[y, x]
+            out[y, x] = 1 if (n == 3 or (board[y, x] and n == 2)) else 0
+    return out
+
+
+def test_elementary_rule_90_matches_example_ruleset():
+    ruleset = [0, 1, 0, 1, 1, 0, 1, 0]
+    ca = ElementaryCA(31, rule=90, history=8).seed_center()
+    cells = ca.cells.tolist()
+    for _ in range(6):
+        nxt = cells[:]
+        for i in range(1, len(cells) - 1):
+            nxt[i] = ruleset[7 - (cells[i - 1] * 4 + cells[i] * 2 + cells[i + 1])]
+        cells = nxt
+        ca.step()
+        assert ca.cells.tolist() == cells
+    assert ca.history.shape == (7, 31)
+    assert ca.history[-1].tolist() == cells
+
+
+def test_life_matches_reference_and_rule_parsing():
+    assert parse_rule("B3/S23") == parse_rule("23/3") == (frozenset({3}), frozenset({2, 3}))
+    assert parse_rule("b36/s23") == (frozenset({3, 6}), frozenset({2, 3}))
+    life = LifeLike(24, 16).randomize(0.4, np.random.default_rng(2))
+    board = life.cells.copy()
+    for _ in range(4):
+        board = _reference_life(board)
+        life.step()
+        assert np.array_equal(life.cells, board)
+    # a glider on a bounded grid keeps its population
+    g = LifeLike(10, 10, wrap=False)
+    g.cells[1, 2] = g.cells[2, 3] = g.cells[3, 1] = g.cells[3, 2] = g.cells[3, 3] = 1
+    g.step(4)
+    assert g.population() == 5 and g.cells[2, 3] == 1 and g.cells[4, 3] == 1
+
+
+def test_grid_renderer_scales_cells_in_one_blit():
+    pygame.init()
+    surf = Surface(pygame.Surface((40, 20)))
+    life = LifeLike(4, 2)
+    life.cells[1, 2] = 1
+    life.draw(surf, cell=10, palette=[(255, 255, 255), (255, 0, 0)])
+    raw = surf.raw
+    assert raw.get_at((25, 15))[:3] == (255, 0, 0)
+    assert raw.get_at((5, 5))[:3] == (255, 255, 255)
+    img = GridRenderer().to_surface(life.cells, cell=3)
+    assert img.get_size() == (12, 6)
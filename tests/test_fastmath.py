@@ -0,0 +1,47 @@
+import math
+
+import pytest
+
+from pycreative import fastmath, pmath
+from pycreative.app import Sketch
+
+
+def test_lut_trig_within_table_precision():
+    table = fastmath.SinCosTable(precision=0.5)
+    step = math.radians(0.5)
+    for k in range(-800, 800, 7):
+        a = k * 0.0137
+        assert abs(table.sin(a) - math.sin(a)) <= step / 2 + 1e-12
+        assert abs(table.cos(a) - math.cos(a)) <= step / 2 + 1e-12
+    assert table.sin(math.pi / 2) == 1.0
+    for y, x in [(1, 2), (-3, 1), (2, -5), (-1, -1), (0, -2), (4, 0), (0, 0)]:
+        assert table.atan2(y, x) == pytest.approx(math.atan2(y, x), abs=1e-3)
+
+
+def test_array_paths_match_scalars():
+    np = pytest.importorskip("numpy")
+    table = fastmath.SinCosTable(precision=1.0)
+    a = np.linspace(-10, 10, 101)
+    assert np.array_equal(table.sin(a), [table.sin(float(v)) for v in a])
+    ys = np.array([1.0, -3.0, 2.0, -1.0, 0.0])
+    xs = np.array([2.0, 1.0, -5.0, -1.0, -2.0])
+    assert np.allclose(table.atan2(ys, xs), [table.atan2(y, x) for y, x in zip(ys, xs)])
+    v = np.array([0.0, 5.0, 10.0, 20.0])
+    assert np.allclose(fastmath.map(v, 0, 10, 100, 200), [100, 150, 200, 300])
+    assert np.allclose(fastmath.constrain(v, 10, 0), [0, 5, 10, 10])
+    assert np.allclose(fastmath.lerp(v, v + 2, 0.5), v + 1)
+    assert np.allclose(fastmath.dist(0, 0, v, v), v * math.sqrt(2))
+
+
+def test_sketch_use_lut_routes_sin_cos_per_sketch():
+    s = Sketch()
+    other = Sketch()
+    assert s.math.PI == pmath.PI and s.sin(1.0) == math.sin(1.0)
+    s.math.use_lut(True, precision=10.0)
+    assert s.math.lut_enabled
+    assert s.sin(0.05) == 0.0 and s.cos(0.05) == 1.0
+    assert s.sin(0.1) == pytest.approx(math.sin(math.radians(10)))
+    assert other.sin(0.1) == math.sin(0.1)
+    s.math.use_lut(False)
+    assert s.sin(0.1) == math.sin(0.1)
+    assert s.map(5, 0, 10, 0, 1) == 0.5 and s.lerp(2, 4, 0.25) == 2.5
@@ -0,0 +1,52 @@
+import math
+
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pycreative.flow_field import FlowField
+from pycreative.graphics import Surface
+from pycreative.noise import PerlinNoise
+from pycreative.vector import PVector
+
+
+def test_noise_build_matches_per_cell_angles():
+    ff = FlowField(200, 100, resolution=20, seed=3)
+    gen = PerlinNoise(3)
+    for i, j in [(0, 0), (4, 2), (9, 4)]:
+        a = gen.noise3d(i * 0.1, j * 0.1, 0.0) * 2 * math.pi
+        v = ff.lookup(PVector(i * 20 + 5, j * 20 + 5))
+        assert v.x == pytest.approx(math.cos(a)) and v.y == pytest.approx(math.sin(a))
+
+
+def test_user_fn_and_sampling_modes():
+    ff = FlowField(100, 100, resolution=10, fn=lambda xs, ys, t: (xs, ys * 0.0))
+    vx, vy = ff.sample([15.0, 20.0, -5.0, 500.0], [15.0, 15.0, 50.0, 50.0])
+    # bilinear between cell centres 15 and 25, clamped outside the field
+    assert np.allclose(vx, [15.0, 20.0, 5.0, 95.0]) and np.allclose(vy, 0.0)
+    nx, _ = ff.sample([15.0, 20.0], [15.0, 15.0], mode="nearest")
+    assert np.allclose(nx, [15.0, 25.0])
+
+
+def test_evolve_recomputes_one_band_per_call():
+    ff = FlowField(100, 100, resolution=10, fn=lambda xs, ys, t: np.full(xs.shape, t))
+    ff.evolve(0.5, rows=4)
+    angles = np.arctan2(ff.field[1], ff.field[0])
+    assert np.allclose(angles[:4], 0.5) and np.allclose(angles[4:], 0.0)
+    ff.evolve(0.5, rows=4)
+    ff.evolve(0.5, rows=4)
+    angles = np.arctan2(ff.field[1], ff.field[0])
+    assert np.allclose(angles[4:8], 1.0) and np.allclose(angles[8:], 1.5)
+    ff.evolve(0.25)
+    assert np.allclose(np.arctan2(ff.field[1], ff.field[0]), 1.75)
+
+
+def test_draw_is_one_batched_line_call():
+    pygame.init()
+    surf = Surface(pygame.Surface((40, 40)))
+    surf.raw.fill((0, 0, 0))
+    ff = FlowField(40, 40, resolution=20, fn=lambda xs, ys, t: np.zeros(xs.shape))
+    ff.draw(surf, color=(255, 0, 0))
+    assert surf.raw.get_at((15, 10))[:3] == (255, 0, 0)
+    assert surf.raw.get_at((5, 10))[:3] == (0, 0, 0)
@@ -0,0 +1,71 @@
+import pygame
+
+from pycreative import font_index
+from pycreative.assets import Assets
+from pycreative.font_index import FontIndex
+
+
+def test_lookup_prefers_new_variant_and_skips_collections():
+    idx = FontIndex(
+        ["courier", "couriernew", "dejavusans"],
+        {"couriernew": "/fonts/CourierNew.ttf", "dejavusans": "/fonts/DejaVuSans.ttf"},
+    )
+    assert idx.lookup("Courier") == "/fonts/CourierNew.ttf"
+    # no family contains the name: fall back to any installed family
+    assert idx.lookup("nosuchfont") == "/fonts/CourierNew.ttf"
+    assert idx.path_for("DejaVu Sans") == "/fonts/DejaVuSans.ttf"
+
+
+def test_build_resolves_each_family_once_and_filters_ttc(monkeypatch):
+    calls = []
+
+    def fake_match(name):
+        calls.append(name)
+        return {"alpha": "/f/alpha.ttc", "beta": "/f/beta.ttf"}.get(name)
+
+    monkeypatch.setattr(pygame.font, "get_fonts", lambda: ["alpha", "beta"])
+    monkeypatch.setattr(pygame.font, "match_font", fake_match)
+    idx = FontIndex.build()
+    assert calls == ["alpha", "beta"]
+    assert idx.paths == {"beta": "/f/beta.ttf"}
+
+
+def test_persisted_index_round_trip(tmp_path):
+    font_file = tmp_path / "beta.ttf"
+    font_file.write_bytes(b"")
+    idx = FontIndex(["beta"], {"beta": str(font_file)})
+    target = str(tmp_path / "fonts.json")
+    assert idx.save(target)
+    loaded = FontIndex.load(target, ["beta"])
+    assert loaded is not None and loaded.paths == idx.paths
+    # a different installed set invalidates the file
+    assert FontIndex.load(target, ["beta", "gamma"]) is None
+
+
+def test_load_font_fallback_uses_shared_index(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_match(name):
+        calls.append(name)
+        return None
+
+    font_index.reset_font_index()
+    monkeypatch.setattr(font_index, "_index", FontIndex(["x"], {}))
+    monkeypatch.setattr(pygame.font, "match_font", fake_match)
+    assets = Assets(str(tmp_path))
+    assert assets.load_font("missing", 12) is None
+    assert assets.load_font("missing", 18) is None
+    # only the exact-name probe hits pygame; the fallback walk is indexed
+    assert calls == ["missing", "missing"]
+    font_index.reset_font_index()
+
+
+def test_list_fonts_scans_local_dirs_once(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "Bundled.ttf").write_bytes(b"")
+    monkeypatch.setattr(font_index, "_index", FontIndex(["sysfam"], {}))
+    assets = Assets(str(tmp_path))
+    assert assets.list_fonts() == ["bundled", "sysfam"]
+    (data / "Later.otf").write_bytes(b"")
+    assert assets.list_fonts() == ["bundled", "sysfam"]
@@ -0,0 +1,100 @@
+from pycreative.app import Sketch
+from pycreative.observable import Observable
+
+
+def _counter():
+    calls = []
+
+    def render(g):
+        calls.append(g)
+        g.raw.fill((255, 0, 0, 255))
+
+    return calls, render
+
+
+def test_cached_graphics_rerenders_only_when_deps_change():
+    s = Sketch()
+    calls, render = _counter()
+    a = s.cached_graphics("bg", 10, 10, render, deps=(1, "red"))
+    b = s.cached_graphics("bg", 10, 10, render, deps=(1, "red"))
+    assert a is b
+    assert len(calls) == 1
+    c = s.cached_graphics("bg", 10, 10, render, deps=(2, "red"))
+    assert len(calls) == 2
+    # same size: redrawn in place, so earlier references see the new render
+    assert c is a
+    s.cached_graphics("bg", 12, 10, render, deps=(2, "red"))
+    assert len(calls) == 3
+
+
+def test_cached_graphics_redraw_in_place_starts_from_default_state():
+    s = Sketch()
+    seen = []
+
+    def render(g):
+        seen.append((g._fill, g._stroke, g._stroke_weight, g._blend_mode, g.get_matrix()))
+        g.fill((255, 0, 0))
+        g.stroke((0, 0, 255))
+        g.stroke_weight(7)
+        g.blend_mode(g.ADD)
+        g.push()
+        g.translate(3, 3)
+
+    a = s.cached_graphics("state", 10, 10, render, deps=1)
+    b = s.cached_graphics("state", 10, 10, render, deps=2)
+    assert b is a
+    assert seen[1] == seen[0]
+    fresh = s.create_graphics(10, 10)
+    assert (fresh._fill, fresh._stroke, fresh._stroke_weight, fresh._blend_mode, fresh.get_matrix()) == seen[1]
+
+
+def test_cached_graphics_watches_observable_attributes():
+    class Palette(Observable):
+        def __init__(self):
+            self.hue = 0
+
+    s = Sketch()
+    pal = Palette()
+    calls, render = _counter()
+    s.cached_graphics("swatch", 4, 4, render, watch=[(pal, "hue")])
+    s.cached_graphics("swatch", 4, 4, render, watch=[(pal, "hue")])
+    assert len(calls) == 1
+    pal.hue = 120
+    s.cached_graphics("swatch", 4, 4, render, watch=[(pal, "hue")])
+    assert len(calls) == 2
+    s.clear_cache("swatch")
+    assert not pal._attr_observers.get("hue")
+
+
+def test_cached_graphics_byte_budget_evicts_lru():
+    s = Sketch()
+    s.graphics_cache.set_budget(2 * 10 * 10 * 4)
+    calls, render = _counter()
+    for key in ("a", "b", "c"):
+        s.cached_graphics(key, 10, 10, render)
+    st = s.graphics_cache.stats()
+    assert st["entries"] == 2
+    assert st["evictions"] == 1
+    assert st["bytes"] <= st["budget"]
+    s.cached_graphics("a", 10, 10, render)  # evicted, so rendered again
+    assert len(calls) == 4
+
+
+def test_cached_graphics_async_swaps_in_when_ready():
+    s = Sketch()
+    calls, render = _counter()
+    placeholder = object()
+    first = s.cached_graphics_async("slow", 8, 8, render, placeholder=placeholder)
+    assert first is placeholder
+    entry = s.graphics_cache._items["slow"]
+    entry.future.result(timeout=5)
+    ready = s.cached_graphics_async("slow", 8, 8, render, placeholder=placeholder)
+    assert ready is not placeholder
+    assert tuple(ready.raw.get_at((0, 0))) == (255, 0, 0, 255)
+    # a dependency change keeps serving the old render until the new one lands
+    again = s.cached_graphics_async("slow", 8, 8, render, deps=(1,), placeholder=placeholder)
+    assert again is ready
+    s.graphics_cache._items["slow"].future.result(timeout=5)
+    newer = s.cached_graphics_async("slow", 8, 8, render, deps=(1,), placeholder=placeholder)
+    assert newer is not ready
+    assert len(calls) == 2
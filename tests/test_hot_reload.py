@@ -0,0 +1,162 @@
+import importlib.util
+import os
+import sys
+
+from pycreative.hot_reload import HotReloader
+
+SKETCH = """
+from pycreative.app import Sketch
+from hr_mover import Mover
+
+
+class Reloadable(Sketch):
+    def setup(self):
+        self.count = 0
+        self.mover = Mover()
+        self.reloaded = 0
+
+    def draw(self):
+        self.count += {step}
+
+    def on_reload(self):
+        self.reloaded += 1
+"""
+
+MOVER = """
+class Mover:
+    def speed(self):
+        return {speed}
+"""
+
+
+def _write(path, text, stamp):
+    path.write_text(text)
+    os.utime(path, (stamp, stamp))
+
+
+def _load(path):
+    spec = importlib.util.spec_from_file_location("user_sketch", str(path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_reload_swaps_methods_and_keeps_state(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "hr_mover", raising=False)
+    sketch_py = tmp_path / "sketch.py"
+    mover_py = tmp_path / "hr_mover.py"
+    _write(sketch_py, SKETCH.format(step=1), 1000)
+    _write(mover_py, MOVER.format(speed=1), 1000)
+
+    s = _load(sketch_py).Reloadable(sketch_path=str(sketch_py))
+    s.setup()
+    s.draw()
+    mover = s.mover
+    reloader = HotReloader(s, str(sketch_py), interval=0.0)
+    assert reloader.poll(1.0) is False
+
+    _write(sketch_py, SKETCH.format(step=10), 2000)
+    _write(mover_py, MOVER.format(speed=5), 2000)
+    assert reloader.poll(2.0) is True
+    s.draw()
+    assert s.count == 11
+    assert s.mover is mover
+    assert mover.speed() == 5
+    assert s.reloaded == 1
+
+
+def test_failed_reload_keeps_previous_code(tmp_path, monkeypatch, capsys):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "hr_mover", raising=False)
+    sketch_py = tmp_path / "sketch.py"
+    _write(sketch_py, SKETCH.format(step=1), 1000)
+    _write(tmp_path / "hr_mover.py", MOVER.format(speed=1), 1000)
+
+    s = _load(sketch_py).Reloadable(sketch_path=str(sketch_py))
+    s.setup()
+    reloader = HotReloader(s, str(sketch_py), interval=0.0)
+    _write(sketch_py, "def broken(:\n", 2000)
+    assert reloader.poll(1.0) is False
+    s.draw()
+    assert s.count == 1
+    assert s.reloaded == 0
+    assert "reload failed" in capsys.readouterr().out
+
+
+PARTICLES = """
+class Particle:
+    def __init__(self):
+        self.x = 0
+
+    def step(self):
+        self.x += {step}
+
+
+class Confetti(Particle):
+    def step(self):
+        super().step()
+        self.x *= 2
+"""
+
+
+def test_reload_keeps_super_and_class_identity(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "hr_particles", raising=False)
+    sketch_py = tmp_path / "sketch.py"
+    particles_py = tmp_path / "hr_particles.py"
+    _write(sketch_py, SKETCH.format(step=1), 1000)
+    _write(tmp_path / "hr_mover.py", MOVER.format(speed=1), 1000)
+    _write(particles_py, PARTICLES.format(step=1), 1000)
+    monkeypatch.delitem(sys.modules, "hr_mover", raising=False)
+
+    import hr_particles
+
+    monkeypatch.setitem(sys.modules, "hr_particles", hr_particles)
+    old_confetti = hr_particles.Confetti
+    c = old_confetti()
+    s = _load(sketch_py).Reloadable(sketch_path=str(sketch_py))
+    s.setup()
+    reloader = HotReloader(s, str(sketch_py), interval=0.0)
+
+    _write(particles_py, PARTICLES.format(step=3), 2000)
+    assert reloader.poll(1.0) is True
+    c.step()
+    assert c.x == 6
+    assert hr_particles.Confetti is old_confetti
+    fresh = hr_particles.Confetti()
+    assert isinstance(fresh, type(c)) and isinstance(c, hr_particles.Particle)
+
+
+INLINE = """
+from pycreative.app import Sketch
+
+
+class Mover:
+    def speed(self):
+        return {speed}
+
+
+class InlineSketch(Sketch):
+    def setup(self):
+        self.mover = Mover()
+
+    def spawn(self):
+        return Mover()
+"""
+
+
+def test_reload_patches_helper_classes_in_sketch_file(tmp_path):
+    sketch_py = tmp_path / "sketch.py"
+    _write(sketch_py, INLINE.format(speed=1), 1000)
+    module = _load(sketch_py)
+    s = module.InlineSketch(sketch_path=str(sketch_py))
+    s.setup()
+    reloader = HotReloader(s, str(sketch_py), interval=0.0)
+
+    _write(sketch_py, INLINE.format(speed=5), 2000)
+    assert reloader.poll(1.0) is True
+    assert s.mover.speed() == 5
+    fresh = s.spawn()
+    assert type(fresh) is type(s.mover) is module.Mover
+    assert fresh.speed() == 5
@@ -0,0 +1,115 @@
+import os
+
+import pygame
+import pytest
+
+from pycreative.assets import Assets
+from pycreative.image_cache import DiskImageCache
+
+
+@pytest.fixture(autouse=True)
+def init_pygame():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _make_png(path, alpha=True):
+    flags = pygame.SRCALPHA if alpha else 0
+    surf = pygame.Surface((6, 4), flags)
+    surf.fill((10, 20, 30, 200) if alpha else (10, 20, 30))
+    surf.set_at((2, 1), (250, 0, 5, 255) if alpha else (250, 0, 5))
+    pygame.image.save(surf, str(path))
+
+
+def test_load_image_populates_and_reuses_disk_cache(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    data.mkdir()
+    _make_png(data / "tile.png")
+    cache_dir = tmp_path / "cache"
+
+    first = Assets(str(tmp_path), image_cache_dir=str(cache_dir)).load_image("tile.png")
+    assert first is not None
+    assert len(os.listdir(cache_dir)) == 1
+
+    # A fresh Assets (new process) must not decode again
+    def _no_decode(*args, **kwargs):
+        raise AssertionError("image was decoded instead of mapped from the cache")
+
+    monkeypatch.setattr(pygame.image, "load", _no_decode)
+    second = Assets(str(tmp_path), image_cache_dir=str(cache_dir)).load_image("tile.png")
+    assert second is not None
+    assert second.get_size() == (6, 4)
+    assert tuple(second.get_at((2, 1))) == tuple(first.get_at((2, 1)))
+    assert tuple(second.get_at((0, 0))) == tuple(first.get_at((0, 0)))
+    # drawing into the mapped surface must not corrupt the cache file
+    second.fill((0, 0, 0, 0))
+    third = Assets(str(tmp_path), image_cache_dir=str(cache_dir)).load_image("tile.png")
+    assert tuple(third.get_at((2, 1))) == (250, 0, 5, 255)
+
+
+def test_opaque_images_keep_rgb_format(tmp_path):
+    _make_png(tmp_path / "opaque.png", alpha=False)
+    cache = DiskImageCache(str(tmp_path / "cache"))
+    src = str(tmp_path / "opaque.png")
+    assert cache.warm([src]) == 1
+    img = cache.load(src)
+    assert img is not None
+    assert not img.get_flags() & pygame.SRCALPHA
+    assert tuple(img.get_at((2, 1)))[:3] == (250, 0, 5)
+
+
+def test_modified_file_misses_and_clear_removes_entries(tmp_path):
+    src = tmp_path / "a.png"
+    _make_png(src)
+    cache = DiskImageCache(str(tmp_path / "cache"))
+    cache.warm([str(src)])
+    assert cache.contains(str(src))
+    # bump mtime so the key changes
+    st = os.stat(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert not cache.contains(str(src))
+    assert cache.clear() == 1
+    assert cache.load(str(src)) is None
+
+
+def test_colorkeyed_images_keep_their_colorkey(tmp_path):
+    src = tmp_path / "keyed.bmp"
+    surf = pygame.Surface((4, 4))
+    surf.fill((255, 0, 255))
+    surf.set_at((1, 1), (10, 20, 30))
+    pygame.image.save(surf, str(src))
+    cache = DiskImageCache(str(tmp_path / "cache"))
+    decoded = pygame.image.load(str(src))
+    decoded.set_colorkey((255, 0, 255))
+    assert cache.store(str(src), decoded)
+    img = cache.load(str(src))
+    assert img is not None
+    assert tuple(img.get_colorkey())[:3] == (255, 0, 255)
+    target = pygame.Surface((4, 4))
+    target.fill((0, 0, 0))
+    target.blit(img, (0, 0))
+    assert tuple(target.get_at((0, 0)))[:3] == (0, 0, 0)
+    assert tuple(target.get_at((1, 1)))[:3] == (10, 20, 30)
+
+
+def test_stale_entries_are_pruned(tmp_path):
+    src = tmp_path / "a.png"
+    _make_png(src)
+    other = tmp_path / "b.png"
+    _make_png(other)
+    cache_dir = tmp_path / "cache"
+    cache = DiskImageCache(str(cache_dir))
+    assert cache.warm([str(src), str(other)]) == 2
+    st = os.stat(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    # the miss on open removes the outdated entry, leaving the other file's
+    assert cache.load(str(src)) is None
+    assert len(os.listdir(cache_dir)) == 1
+    assert cache.contains(str(other))
+    # re-storing a newer version also replaces the old entry
+    cache.warm([str(src)])
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+    cache.warm([str(src)])
+    assert len(os.listdir(cache_dir)) == 2
+    assert cache.contains(str(src)) and cache.contains(str(other))
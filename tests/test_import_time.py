@@ -0,0 +1,70 @@
+"""Import-time budget: `python -X importtime` on the entry points.
+
+Budgets are generous (they must hold without cached bytecode on slow CI
+machines); the module checks are what keep heavy subsystems lazy.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+# cumulative microseconds spent importing pycreative's own modules
+BUDGET_US = {
+    "pycreative": 50_000,
+    "pycreative.cli": 150_000,
+    "pycreative.app": 400_000,
+}
+
+# subsystems only a few sketches use; they load on first use
+DEFERRED = {
+    "pycreative.blending",
+    "pycreative.shape",
+    "pycreative.font_index",
+    "pycreative.image_cache",
+    "pycreative.recording",
+    "pycreative.hot_reload",
+    "pycreative.flow_field",
+}
+
+
+def _importtime(module):
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""), SDL_VIDEODRIVER="dummy")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    self_us = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            self_us[parts[2].strip()] = int(parts[0])
+        except ValueError:
+            continue
+    return self_us
+
+
+def test_package_import_is_lightweight():
+    mods = _importtime("pycreative")
+    assert "pygame" not in mods
+    assert sum(t for m, t in mods.items() if m.startswith("pycreative")) < BUDGET_US["pycreative"]
+
+
+def test_cli_import_skips_pygame_for_help_and_version():
+    mods = _importtime("pycreative.cli")
+    assert "pygame" not in mods
+    assert "pycreative.app" not in mods
+    assert sum(t for m, t in mods.items() if m.startswith("pycreative")) < BUDGET_US["pycreative.cli"]
+
+
+def test_app_import_defers_rare_subsystems():
+    mods = _importtime("pycreative.app")
+    assert not DEFERRED & set(mods)
+    assert sum(t for m, t in mods.items() if m.startswith("pycreative")) < BUDGET_US["pycreative.app"]
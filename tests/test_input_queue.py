@@ -0,0 +1,64 @@
+from collections import deque
+
+import pygame
+
+from pycreative.app import Sketch
+from pycreative import input as input_mod
+
+
+class MotionSketch(Sketch):
+    def setup(self):
+        self.moves = []
+        self.drags = 0
+
+    def mouse_moved(self):
+        self.moves.append((self.mouse_x, self.mouse_y, self.pmouse_x, self.pmouse_y))
+
+    def mouse_dragged(self):
+        self.drags += 1
+
+
+def _motion(pos, rel=(1, 0), buttons=(0, 0, 0)):
+    return pygame.event.Event(pygame.MOUSEMOTION, {"pos": pos, "rel": rel, "buttons": buttons})
+
+
+def test_pending_queue_is_deque():
+    s = MotionSketch()
+    assert isinstance(s._pending_event_queue, deque)
+
+
+def test_dispatch_events_without_coalescing_calls_every_motion():
+    s = MotionSketch()
+    s.setup()
+    input_mod.dispatch_events(s, [_motion((i, 0)) for i in range(5)])
+    assert len(s.moves) == 5
+    assert s.mouse_path == [(i, 0) for i in range(5)]
+
+
+def test_coalesced_motion_keeps_full_path():
+    s = MotionSketch()
+    s.setup()
+    s.set_motion_coalescing(True)
+    down = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"pos": (4, 0), "button": 1})
+    events = [_motion((i, 0)) for i in range(5)] + [down, _motion((5, 0), buttons=(1, 0, 0)), _motion((6, 0), buttons=(1, 0, 0))]
+    input_mod.dispatch_events(s, events)
+    assert s.moves == [(4, 0, None, None)]
+    assert s.drags == 1
+    assert s.mouse_path == [(i, 0) for i in range(7)]
+    assert (s.mouse_x, s.mouse_y) == (6, 0)
+    # next frame: path is reset, pmouse is the last position of the previous frame
+    input_mod.dispatch_events(s, [_motion((9, 9))])
+    assert s.mouse_path == [(9, 9)]
+    assert (s.pmouse_x, s.pmouse_y) == (6, 0)
+
+
+def test_event_budget_carries_over_and_quit_stops():
+    s = MotionSketch()
+    s.setup()
+    s.set_motion_coalescing(False, max_events_per_frame=2)
+    s._running = True
+    input_mod.dispatch_events(s, [_motion((i, 0)) for i in range(5)])
+    assert len(s.moves) == 2
+    input_mod.dispatch_events(s, [pygame.event.Event(pygame.QUIT, {})])
+    assert len(s.moves) == 4
+    assert s._running is False
@@ -0,0 +1,138 @@
+import pygame
+
+from pycreative.app import Sketch
+
+
+def _layer(color, calls, name):
+    def draw(g):
+        calls.append(name)
+        g.raw.fill(color)
+
+    return draw
+
+
+def _sketch():
+    s = Sketch()
+    s.width, s.height = 8, 8
+    return s
+
+
+def test_layers_redraw_only_when_due():
+    s = _sketch()
+    calls = []
+    s.layers.add("bg", _layer((0, 0, 255, 255), calls, "bg"), every=None)
+    s.layers.add("mid", _layer((0, 255, 0, 255), calls, "mid"), every=3)
+    s.layers.add("fg", _layer((255, 0, 0, 255), calls, "fg"))
+    target = pygame.Surface((8, 8), pygame.SRCALPHA)
+    for frame in range(6):
+        s.frame_count = frame
+        s.layers.render(target)
+    assert calls.count("bg") == 1
+    assert calls.count("mid") == 2
+    assert calls.count("fg") == 6
+
+    s.layers.invalidate("bg")
+    s.layers.render(target)
+    assert calls.count("bg") == 2
+
+
+def test_layers_redraw_starts_from_default_state():
+    s = _sketch()
+    seen = []
+
+    def draw(g):
+        seen.append((g._fill, g._stroke, g._blend_mode, g.get_matrix()))
+        g.fill((255, 0, 0))
+        g.stroke((0, 0, 255))
+        g.blend_mode(g.ADD)
+        g.translate(2, 2)
+
+    s.layers.add("fg", draw)
+    target = pygame.Surface((8, 8), pygame.SRCALPHA)
+    for frame in range(2):
+        s.frame_count = frame
+        s.layers.render(target)
+    assert len(seen) == 2 and seen[1] == seen[0]
+
+
+def test_layers_cache_static_base():
+    s = _sketch()
+    calls = []
+    s.layers.add("bg", _layer((0, 0, 255, 255), calls, "bg"), every=None)
+    s.layers.add("mid", _layer((0, 255, 0, 128), calls, "mid"), every=None)
+    s.layers.add("fg", lambda g: g.raw.fill((0, 0, 0, 0)))
+    target = pygame.Surface((8, 8), pygame.SRCALPHA)
+    for frame in range(5):
+        s.frame_count = frame
+        s.layers.render(target)
+    assert s.layers.stats()["base_rebuilds"] == 1
+    # a property change on a cached layer rebuilds the base once
+    s.layers["mid"].opacity = 0.5
+    s.layers.render(target)
+    s.layers.render(target)
+    assert s.layers.stats()["base_rebuilds"] == 2
+
+
+def test_layers_composite_in_z_order_with_opacity():
+    s = _sketch()
+    calls = []
+    s.layers.add("top", _layer((255, 0, 0, 255), calls, "top"), z=2, opacity=0.5)
+    s.layers.add("bottom", _layer((0, 0, 255, 255), calls, "bottom"), z=0)
+    target = pygame.Surface((8, 8))
+    s.layers.render(target)
+    r, g, b = target.get_at((4, 4))[:3]
+    assert abs(r - 128) <= 2 and g == 0 and abs(b - 127) <= 2
+    assert [layer.name for layer in s.layers] == ["bottom", "top"]
+
+    s.layers["top"].visible = False
+    target.fill((0, 0, 0))
+    s.layers.render(target)
+    assert tuple(target.get_at((4, 4))[:3]) == (0, 0, 255)
+
+
+def _direct(layers, target):
+    # reference: blit every layer straight onto the target
+    from pycreative.blending import apply_blit_with_blend
+
+    for layer in layers:
+        src = layer.surface.raw
+        src.set_alpha(int(round(layer.opacity * 255)))
+        if layer.blend is None:
+            target.blit(src, (layer.x, layer.y))
+        else:
+            apply_blit_with_blend(target, src, layer.x, layer.y, layer.blend)
+        src.set_alpha(255)
+
+
+def _compare(specs):
+    s = _sketch()
+    calls = []
+    for name, color, opacity, blend in specs:
+        s.layers.add(name, _layer(color, calls, name), every=None, opacity=opacity, blend=blend)
+    s.layers.add("fg", lambda g: None)
+    cached = pygame.Surface((8, 8))
+    for frame in range(2):
+        s.frame_count = frame
+        cached.fill((255, 255, 255))
+        s.layers.render(cached)
+    direct = pygame.Surface((8, 8))
+    direct.fill((255, 255, 255))
+    _direct(list(s.layers), direct)
+    return tuple(cached.get_at((4, 4))), tuple(direct.get_at((4, 4))), s.layers.stats()
+
+
+def test_layers_translucent_bottom_matches_direct_compositing():
+    cached, direct, stats = _compare([("a", (255, 0, 0, 255), 0.5, None), ("b", (0, 0, 255, 255), 0.5, None)])
+    assert cached == direct
+    assert stats["base_rebuilds"] == 0
+
+
+def test_layers_blended_bottom_matches_direct_compositing():
+    cached, direct, _stats = _compare([("a", (255, 0, 0, 255), 1.0, "MULTIPLY"), ("b", (0, 0, 255, 255), 0.5, None)])
+    assert cached == direct
+
+
+def test_layers_opaque_bottom_flattens_exactly():
+    cached, direct, stats = _compare([("a", (20, 200, 40, 255), 1.0, None), ("b", (0, 0, 255, 255), 0.5, "ADD"), ("c", (255, 0, 0, 255), 0.3, None)])
+    assert cached == direct
+    assert stats["base_rebuilds"] == 1
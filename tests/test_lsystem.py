@@ -0,0 +1,85 @@
+import math
+
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pycreative.graphics import Surface
+from pycreative.lsystem import LSystem, Turtle
+from pycreative.lsystem import system as lsystem_mod
+
+
+def _naive_sentence(axiom, rules, n):
+    s = axiom
+    for _ in range(n):
+        s = "".join(rules.get(c, c) for c in s)
+    return s
+
+
+def _naive_segments(sentence, length, angle):
+    x = y = 0.0
+    h = -math.pi / 2
+    stack = []
+    segs = []
+    for c in sentence:
+        if c in "FG":
+            nx, ny = x + math.cos(h) * length, y + math.sin(h) * length
+            segs.append((x, y, nx, ny))
+            x, y = nx, ny
+        elif c == "+":
+            h += angle
+        elif c == "-":
+            h -= angle
+        elif c == "[":
+            stack.append((x, y, h))
+        elif c == "]":
+            x, y, h = stack.pop()
+    return np.asarray(segs)
+
+
+def test_lazy_expansion_matches_string_rewriting(monkeypatch):
+    monkeypatch.setattr(lsystem_mod, "MEMO_MAX_LEN", 50)
+    rules = {"A": "AB", "B": "A"}
+    ls = LSystem("A", rules)
+    for n in range(12):
+        assert ls.sentence == _naive_sentence("A", rules, n)
+        assert len(ls) == len(ls.sentence)
+        ls.generate()
+    # large generations stream without building the whole sentence
+    big = LSystem("F", {"F": "FF+[+F-F-F]-[-F+F+F]"}).generate(7)
+    assert len(big) == big.symbol_length("F", 7) > 5_000_000
+    assert "".join(c for c, _ in zip(big.expand(), range(30))) == _naive_sentence("F", big.rules, 7)[:30]
+
+
+def test_turtle_segments_cover_naive_turtle():
+    rules = {"F": "FF+[+F-F-F]-[-F+F+F]"}
+    ls = LSystem("F", rules).generate(3)
+    turtle = Turtle(6, math.radians(25))
+    segs = turtle.trace(ls)
+    ref = _naive_segments(_naive_sentence("F", rules, 3), 6, math.radians(25))
+    # collinear steps are merged, so there are fewer but equally long segments
+    assert len(segs) < len(ref)
+    seg_len = np.hypot(segs[:, 2] - segs[:, 0], segs[:, 3] - segs[:, 1]).sum()
+    assert seg_len == pytest.approx(len(ref) * 6)
+    mid = (ref[:, :2] + ref[:, 2:]) / 2
+    a = segs[:, :2][None]
+    ab = (segs[:, 2:] - segs[:, :2])[None]
+    t = np.clip(((mid[:, None] - a) * ab).sum(-1) / (ab * ab).sum(-1), 0, 1)
+    d = np.hypot(*np.moveaxis(mid[:, None] - (a + ab * t[..., None]), -1, 0)).min(axis=1)
+    assert d.max() < 1e-6
+
+
+def test_draw_batched_and_cached():
+    pygame.init()
+    surf = Surface(pygame.Surface((40, 40)))
+    surf.raw.fill((255, 255, 255))
+    turtle = Turtle(10, math.pi / 2)
+    turtle.draw(surf, "FF", x=20, y=35, color=(0, 0, 0), weight=1)
+    assert surf.raw.get_at((20, 20))[:3] == (0, 0, 0)
+    ls = LSystem("F+F", {})
+    turtle.draw(surf, ls, x=5, y=20, color=(255, 0, 0), weight=1, cache=True)
+    turtle.draw(surf, ls, x=5, y=20, color=(255, 0, 0), weight=1, cache=True)
+    assert len(turtle._images) == 1
+    assert surf.raw.get_at((5, 15))[:3] == (255, 0, 0)
+    assert surf.raw.get_at((10, 10))[:3] == (255, 0, 0)
@@ -0,0 +1,56 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pycreative import noise_field
+from pycreative.noise_field import NoiseField
+
+
+def test_field_matches_generator_and_samples_bilinearly():
+    f = NoiseField(32, 16, scale=0.1, octaves=2, seed=9, tileable=False, background=False)
+    assert f.data.shape == (16, 32)
+    assert 0.0 <= float(f.data.min()) and float(f.data.max()) <= 1.0
+    # integer coordinates hit the texels exactly
+    assert f.sample(5, 7) == pytest.approx(float(f.data[7, 5]))
+    mid = f.sample(5.5, 7)
+    assert mid == pytest.approx((float(f.data[7, 5]) + float(f.data[7, 6])) / 2, abs=1e-6)
+    arr = f.sample_array([5.5, 10.25], [7, 3.75])
+    assert arr[0] == pytest.approx(mid, abs=1e-6)
+    assert arr[1] == pytest.approx(f.sample(10.25, 3.75), abs=1e-6)
+
+
+def test_tileable_field_wraps_continuously():
+    f = NoiseField(64, 64, scale=0.05, seed=3, background=True).wait()
+    d = f.data
+    # the last column flows into the first: the seam step is no larger
+    # than an ordinary neighbouring step
+    seam = float(np.abs(d[:, -1] - d[:, 0]).max())
+    inner = float(np.abs(np.diff(d, axis=1)).max())
+    assert seam <= inner * 1.5
+    assert f.sample(64 + 3, -61) == pytest.approx(f.sample(3, 3))
+
+
+def test_tileable_sample_wraps_tiny_negative_coordinates():
+    f = NoiseField(64, 32, seed=1, background=False)
+    # -1e-20 % 64 rounds to exactly 64.0
+    assert f.sample(-1e-20, 0) == pytest.approx(f.sample(0, 0))
+    assert f.sample(0, -1e-20) == pytest.approx(f.sample(0, 0))
+
+
+def test_cache_reuses_memory_and_disk(tmp_path):
+    noise_field.clear_cache()
+    a = NoiseField(8, 8, seed=1, background=False, cache_dir=str(tmp_path))
+    assert list(tmp_path.glob("*.npy"))
+    b = NoiseField(8, 8, seed=1, background=False)
+    assert b.data is a.data
+    noise_field.clear_cache()
+    c = NoiseField(8, 8, seed=1, background=False, cache_dir=str(tmp_path))
+    assert np.array_equal(c.data, a.data)
+
+
+def test_to_surface_is_grayscale():
+    f = NoiseField(10, 6, seed=2, background=False)
+    surf = f.to_surface()
+    assert surf.raw.get_size() == (10, 6)
+    r, g, b, _a = surf.raw.get_at((4, 3))
+    assert r == g == b == int(float(f.data[3, 4]) * 255 + 0.5)
@@ -53,3 +53,71 @@ def test_explicit_observe_unobserve():
     o.x = 2
     # callback removed, list unchanged
     assert seen == [1]
+
+
+def test_hooks_precomputed_per_class_and_inherited():
+    calls = []
+
+    class Base(Observable):
+        def on_size(self, old, new):
+            calls.append((old, new))
+
+    class Child(Base):
+        pass
+
+    assert Base._on_hooks == {"size": ("on_size", 2)}
+    assert Child._on_hooks == {"size": ("on_size", 2)}
+    c = Child()
+    c.size = 1
+    c.size = 2
+    c.other = 3  # unobserved attribute: plain assignment
+    assert calls == [(1, 2)]
+    assert c.other == 3
+
+
+def test_batched_notifications_coalesce():
+    calls = []
+    seen = []
+
+    class Mover(Observable):
+        def __init__(self):
+            self.mass = 1
+
+        def on_mass(self, old, new):
+            calls.append((old, new))
+
+    m = Mover()
+    m.observe("mass", seen.append)
+    with m.batched():
+        m.mass = 2
+        m.mass = 3
+        m.mass = 4
+        assert calls == []
+        assert m.mass == 4
+    assert calls == [(1, 4)]
+    assert seen == [4]
+
+
+def test_batch_notifications_flag_defers_until_flush():
+    from pycreative import observable
+
+    calls = []
+
+    class Particle(Observable):
+        batch_notifications = True
+
+        def __init__(self):
+            self.x = 0
+
+        def on_x(self, new):
+            calls.append(new)
+
+    ps = [Particle() for _ in range(3)]
+    for p in ps:
+        for i in range(5):
+            p.x = i
+    assert calls == []
+    observable.flush_pending()
+    assert calls == [4, 4, 4]
+    observable.flush_pending()
+    assert calls == [4, 4, 4]
@@ -0,0 +1,93 @@
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pycreative.graphics import Surface
+from pycreative.particles import Gravity, ParticleSystem, Repeller
+
+
+def test_emit_recycles_slots_without_growing():
+    ps = ParticleSystem(capacity=10, lifespan=3.0, decay=1.0, seed=0)
+    first = ps.emit(10, 0, 0)
+    assert len(first) == 10 and ps.count == 10
+    # pool is full: further emission is dropped
+    assert len(ps.emit(5, 0, 0)) == 0
+    for _ in range(3):
+        ps.update()
+    assert ps.count == 0
+    again = ps.emit(4, 1, 1)
+    assert set(again.tolist()) <= set(first.tolist())
+    assert ps.count == 4 and ps.alive.sum() == 4
+
+
+def test_emit_arrays_into_nearly_full_pool():
+    ps = ParticleSystem(capacity=10, seed=0)
+    ps.emit(8, 0, 0)
+    xs = np.arange(5, dtype=float)
+    idx = ps.emit(5, xs, xs * 2, vx=xs, vy=-xs)
+    assert len(idx) == 2 and ps.count == 10
+    assert ps.position.x[idx].tolist() == [0.0, 1.0]
+    assert ps.velocity.y[idx].tolist() == [0.0, -1.0]
+    # mismatched arrays are rejected before any slot is taken
+    ps.kill(idx)
+    with pytest.raises(ValueError):
+        ps.emit(2, np.zeros(3), 0)
+    assert ps.count == 8
+
+
+def test_forces_are_vectorized_over_pool():
+    ps = ParticleSystem(capacity=100, seed=0)
+    ps.add_force(Gravity(0.0, 0.5))
+    ps.emit(50, 10.0, 10.0, vx=1.0)
+    ps.update()
+    idx = ps.alive_indices()
+    assert np.allclose(ps.velocity.y[idx], 0.5)
+    assert np.allclose(ps.position.x[idx], 11.0)
+    rep = ParticleSystem(capacity=2, seed=0)
+    rep.add_force(Repeller(0.0, 0.0, strength=100.0))
+    rep.emit(1, 10.0, 0.0)
+    rep.update()
+    assert rep.velocity.x[rep.alive_indices()[0]] > 0
+
+
+def test_alpha_follows_lifespan_and_kill():
+    ps = ParticleSystem(capacity=4, lifespan=100.0, decay=25.0, seed=0)
+    idx = ps.emit(2, 0, 0)
+    ps.update()
+    assert np.allclose(ps.alpha()[idx], 0.75)
+    ps.kill(idx[:1])
+    assert ps.count == 1
+
+
+def test_kill_duplicate_index_frees_slot_once():
+    ps = ParticleSystem(capacity=4, seed=0)
+    idx = ps.emit(2, 0, 0)
+    ps.kill([idx[0], idx[0]])
+    assert ps.count == 1
+    fresh = ps.emit(4, 0, 0)
+    assert len(fresh) == 3 and len(set(fresh.tolist())) == 3
+    assert idx[1] not in fresh
+
+
+def test_apply_force_accepts_pvector():
+    from pycreative.vector import PVector
+
+    ps = ParticleSystem(capacity=2, seed=0)
+    ps.emit(1, 0, 0)
+    ps.apply_force(PVector(0.5, -1.0))
+    ps.apply_force((0.5, 0.0))
+    ps.update()
+    i = ps.alive_indices()[0]
+    assert ps.velocity.x[i] == 1.0 and ps.velocity.y[i] == -1.0
+
+
+def test_draw_batches_with_add_blend():
+    surf = Surface(pygame.Surface((40, 40)))
+    surf.raw.fill((10, 10, 10))
+    ps = ParticleSystem(capacity=8, lifespan=100.0, seed=0)
+    ps.emit(2, 20.0, 20.0)
+    ps.draw(surf, size=4, color=(100, 0, 0), blend="ADD")
+    r, g, b, _ = surf.raw.get_at((20, 20))
+    # two full-alpha particles stacked additively on the background
+    assert (r, g, b) == (210, 10, 10)
@@ -0,0 +1,57 @@
+import pygame
+
+from pycreative.app import Sketch
+from pycreative.recording import InputReplay
+
+
+class TrailSketch(Sketch):
+    # posts synthetic mouse input while recording; replays get it from the file
+    live = True
+
+    def setup(self):
+        self.size(40, 30)
+        self.trail = []
+        self.dts = []
+
+    def update(self, dt):
+        self.dts.append(dt)
+
+    def draw(self):
+        if self.live and self.frame_count in (1, 3):
+            for i in range(3):
+                x = self.frame_count * 5 + i
+                pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, {"pos": (x, 7), "rel": (1, 0), "buttons": (0, 0, 0)}))
+
+    def mouse_moved(self):
+        self.trail.append((self.frame_count, self.mouse_x, self.mouse_y, self.random(100)))
+
+
+def test_record_then_replay_is_identical(tmp_path, monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    path = str(tmp_path / "input.jsonl.gz")
+
+    rec = TrailSketch()
+    rec.record_input(path)
+    rec.run(max_frames=6)
+    assert len(rec.trail) == 6
+
+    rep = TrailSketch()
+    rep.live = False
+    replay = rep.replay_input(path)
+    rep.run()
+    assert rep.trail == rec.trail
+    assert rep.frame_count == 6
+    assert rep.dts == [1 / 60] * 6
+    assert replay.mismatches == 0
+
+
+def test_replay_rejects_other_files(tmp_path):
+    import gzip
+
+    import pytest
+
+    path = tmp_path / "bogus.gz"
+    with gzip.open(path, "wt") as f:
+        f.write('{"something": 1}\n')
+    with pytest.raises(ValueError):
+        InputReplay(str(path))
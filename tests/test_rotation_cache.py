@@ -0,0 +1,98 @@
+import pygame
+
+from pycreative import transform_cache
+from pycreative.graphics import Surface
+from pycreative.transforms import transform_point
+
+
+def _sprite(w=20, h=10):
+    s = pygame.Surface((w, h), pygame.SRCALPHA)
+    s.fill((255, 0, 0, 255))
+    return s
+
+
+def test_rotozoomed_quantizes_static_sources():
+    transform_cache.clear()
+    transform_cache.set_rotation_quantization(angle_step=5.0)
+    try:
+        img = _sprite()
+        transform_cache.register_static(img)
+        a = transform_cache.rotozoomed(img, 31.0, 1.0)
+        b = transform_cache.rotozoomed(img, 29.0, 1.0)
+        assert a is b
+    finally:
+        transform_cache.set_rotation_quantization(angle_step=transform_cache.DEFAULT_ANGLE_STEP)
+
+
+def test_precompute_rotations_fills_cache():
+    transform_cache.clear()
+    img = _sprite()
+    n = transform_cache.precompute_rotations(img, angle_step=10.0)
+    try:
+        assert n == 36
+        before = transform_cache.rotation_stats()["misses"]
+        transform_cache.rotozoomed(img, 90.0)
+        assert transform_cache.rotation_stats()["misses"] == before
+    finally:
+        transform_cache.set_rotation_quantization(angle_step=transform_cache.DEFAULT_ANGLE_STEP)
+
+
+def test_shear_draw_covers_exact_affine_footprint():
+    s = Surface(pygame.Surface((200, 200), pygame.SRCALPHA))
+    M = [[1.0, 0.5, 50.0], [0.2, 1.5, 60.0], [0.0, 0.0, 1.0]]
+    s._matrix_stack[-1] = M
+    s.image(_sprite(40, 20), 10, 10)
+    corners = [transform_point(M, x, y) for x in (10, 50) for y in (10, 30)]
+    xs = [p[0] for p in corners]
+    ys = [p[1] for p in corners]
+    r = s.raw.get_bounding_rect()
+    assert abs(r.left - min(xs)) <= 1 and abs(r.right - max(xs)) <= 1
+    assert abs(r.top - min(ys)) <= 1 and abs(r.bottom - max(ys)) <= 1
+    cx, cy = transform_point(M, 30, 20)
+    assert s.raw.get_at((int(cx), int(cy)))[:3] == (255, 0, 0)
+    # a point just outside the sheared edge stays empty
+    ox, oy = transform_point(M, 53, 20)
+    assert s.raw.get_at((int(ox), int(oy)))[3] == 0
+
+
+def test_drawing_on_static_image_invalidates_rotated_copy():
+    transform_cache.clear()
+    img = _sprite(20, 20)
+    transform_cache.register_static(img)
+    sprite = Surface(img)
+    dst = Surface(pygame.Surface((60, 60), pygame.SRCALPHA))
+    dst.translate(30, 30)
+    dst.rotate(0.5)
+    dst.image(sprite, -10, -10)
+    assert tuple(dst.raw.get_at((30, 30)))[:3] == (255, 0, 0)
+    sprite.no_stroke()
+    sprite.fill((0, 255, 0))
+    sprite.ellipse(10, 10, 20, 20)
+    dst.image(sprite, -10, -10)
+    assert tuple(dst.raw.get_at((30, 30)))[:3] == (0, 255, 0)
+
+
+def test_rotations_are_exact_unless_quantization_is_enabled():
+    transform_cache.clear()
+    img = _sprite()
+    transform_cache.register_static(img)
+    a = transform_cache.rotozoomed(img, 30.0, 1.0)
+    assert transform_cache.rotozoomed(img, 30.0, 1.0) is a
+    assert transform_cache.rotozoomed(img, 30.2, 1.0) is not a
+    assert transform_cache.rotozoomed(img, 30.0, 1.004) is not a
+
+
+def test_image_anchor_does_not_jump_between_transform_paths():
+    img = _sprite(40, 20)
+    rects = []
+    for sy in (1.0, 1.001):
+        s = Surface(pygame.Surface((300, 300), pygame.SRCALPHA))
+        s.translate(100, 100)
+        s.scale(1, sy)
+        s.image(img, 0, 0)
+        rects.append(s.raw.get_bounding_rect())
+    assert rects[0].topleft == rects[1].topleft == (100, 100)
+    # identity path agrees
+    s = Surface(pygame.Surface((300, 300), pygame.SRCALPHA))
+    s.image(img, 100, 100)
+    assert s.raw.get_bounding_rect() == rects[0]
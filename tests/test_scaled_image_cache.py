@@ -0,0 +1,88 @@
+import pygame
+
+from pycreative import transform_cache
+from pycreative.graphics import Surface
+
+
+def _img(w=64, h=32, color=(200, 40, 40, 255)):
+    s = pygame.Surface((w, h), pygame.SRCALPHA)
+    s.fill(color)
+    return s
+
+
+def test_scaled_static_image_is_cached():
+    transform_cache.clear()
+    img = _img()
+    transform_cache.register_static(img)
+    a = transform_cache.scaled(img, (16, 8))
+    b = transform_cache.scaled(img, (16, 8))
+    assert a is b
+    assert a.get_size() == (16, 8)
+    # mip levels for 64x32 -> 16x8 were built (32x16, 16x8)
+    assert transform_cache.stats()["entries"] >= 2
+
+
+def test_unregistered_source_is_not_cached():
+    transform_cache.clear()
+    img = _img()
+    a = transform_cache.scaled(img, (16, 8))
+    b = transform_cache.scaled(img, (16, 8))
+    assert a is not b
+    assert transform_cache.stats()["entries"] == 0
+
+
+def test_mark_modified_invalidates():
+    transform_cache.clear()
+    img = _img()
+    transform_cache.register_static(img)
+    surf = Surface(img)
+    a = transform_cache.scaled(img, (32, 16))
+    surf.set_pixel(0, 0, (0, 255, 0, 255))
+    b = transform_cache.scaled(img, (32, 16))
+    assert a is not b
+
+
+def test_budget_evicts_lru():
+    transform_cache.clear()
+    old = transform_cache.get_budget()
+    try:
+        # room for roughly two 32x32 RGBA entries
+        transform_cache.set_budget(2 * 32 * 32 * 4)
+        img = _img(128, 128)
+        transform_cache.register_static(img)
+        for size in (30, 31, 32):
+            transform_cache.scaled(img, (size, size), transform_cache.NEAREST)
+        st = transform_cache.stats()
+        assert st["bytes"] <= st["budget"]
+        assert st["evictions"] >= 1
+    finally:
+        transform_cache.set_budget(old)
+        transform_cache.clear()
+
+
+def test_surface_image_uses_cache_and_matches_direct_scale():
+    transform_cache.clear()
+    img = _img(40, 40, (10, 20, 30, 255))
+    transform_cache.register_static(img)
+    target = Surface(pygame.Surface((50, 50), pygame.SRCALPHA))
+    target.image(img, 0, 0, 20, 20)
+    target.image(img, 0, 0, 20, 20)
+    assert transform_cache.stats()["hits"] >= 1
+    assert target.raw.get_at((10, 10))[:3] == (10, 20, 30)
+
+
+def test_drawing_on_loaded_image_invalidates_scaled_copy(tmp_path):
+    from pycreative.assets import Assets
+    from pycreative.graphics import OffscreenSurface
+
+    transform_cache.clear()
+    pygame.image.save(_img(40, 40, (255, 0, 0, 255)), str(tmp_path / "red.png"))
+    img = OffscreenSurface(Assets(str(tmp_path)).load_image("red.png"))
+    dst = Surface(pygame.Surface((20, 20), pygame.SRCALPHA))
+    dst.image(img, 0, 0, 20, 20)
+    assert tuple(dst.raw.get_at((10, 10)))[:3] == (255, 0, 0)
+    img.no_stroke()
+    img.fill((0, 0, 255))
+    img.rect(0, 0, 40, 40)
+    dst.image(img, 0, 0, 20, 20)
+    assert tuple(dst.raw.get_at((10, 10)))[:3] == (0, 0, 255)
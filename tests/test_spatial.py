@@ -0,0 +1,67 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pycreative.spatial import BinLattice, QuadTree
+from pycreative.vector_array import PVectorArray
+
+
+def _points(n=400, seed=1):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0, 200, n), rng.uniform(0, 100, n)
+
+
+def _brute_radius(xs, ys, x, y, r):
+    return set(np.flatnonzero((xs - x) ** 2 + (ys - y) ** 2 <= r * r).tolist())
+
+
+def _brute_knn(xs, ys, x, y, k):
+    d2 = (xs - x) ** 2 + (ys - y) ** 2
+    return np.argsort(d2, kind="stable")[:k].tolist()
+
+
+@pytest.mark.parametrize("make", [
+    lambda xs, ys: BinLattice(10.0, xs, ys),
+    lambda xs, ys: QuadTree((0, 0, 200, 100), capacity=4, xs=xs, ys=ys),
+])
+def test_radius_and_knn_match_brute_force(make):
+    xs, ys = _points()
+    index = make(xs, ys)
+    for x, y, r in [(50, 50, 15), (0, 0, 30), (199, 99, 5), (120, 40, 60), (500, 500, 10)]:
+        assert set(index.query_radius(x, y, r).tolist()) == _brute_radius(xs, ys, x, y, r)
+    for x, y in [(10, 10), (150, 80), (-50, 300)]:
+        assert index.knn(x, y, 7).tolist() == _brute_knn(xs, ys, x, y, 7)
+    assert 3 not in index.neighbors(3, 20).tolist()
+
+
+def test_bin_lattice_pairs_and_incremental_update():
+    xs, ys = _points(300)
+    grid = BinLattice(8.0).rebuild(PVectorArray.from_xy(xs, ys))
+    i, j = grid.pairs(12.0)
+    got = set(zip(i.tolist(), j.tolist()))
+    d2 = (xs[:, None] - xs[None, :]) ** 2 + (ys[:, None] - ys[None, :]) ** 2
+    bi, bj = np.nonzero(d2 <= 144.0)
+    assert got == {(a, b) for a, b in zip(bi.tolist(), bj.tolist()) if a != b}
+
+    xs2 = xs + 3.0
+    grid.update(xs2, ys)
+    assert set(grid.query_radius(60, 60, 20).tolist()) == _brute_radius(xs2, ys, 60, 60, 20)
+
+
+def test_quadtree_update_relocates_only_moved_points():
+    xs, ys = _points(500, seed=3)
+    qt = QuadTree((0, 0, 200, 100), capacity=8, xs=xs, ys=ys)
+    xs2 = xs.copy()
+    ys2 = ys.copy()
+    xs2[:5] = [1.0, 199.0, 250.0, 100.0, 100.0]
+    ys2[:5] = [1.0, 99.0, 50.0, 100.0, 0.0]
+    moved = qt.update(xs2, ys2)
+    assert 0 < moved <= 5
+    for x, y, r in [(0, 0, 10), (200, 100, 10), (250, 50, 1), (100, 50, 40)]:
+        assert set(qt.query_radius(x, y, r).tolist()) == _brute_radius(xs2, ys2, x, y, r)
+
+    qt.move(0, 150.0, 20.0)
+    xs2[0], ys2[0] = 150.0, 20.0
+    assert qt.knn(150.0, 20.0, 3).tolist() == _brute_knn(xs2, ys2, 150.0, 20.0, 3)
+    i = qt.insert(10.0, 10.0)
+    assert i == 500 and i in qt.query_radius(10.0, 10.0, 0.5).tolist()
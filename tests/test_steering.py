@@ -0,0 +1,109 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pycreative.steering import Agents, Align, Arrive, Cohesion, FollowPath, Seek, Separate
+
+
+def _limit(v, m):
+    n = math.hypot(*v)
+    return v if n <= m or n == 0 else (v[0] / n * m, v[1] / n * m)
+
+
+def _steer(direction, vel, maxspeed, maxforce):
+    n = math.hypot(*direction)
+    if n == 0:
+        return (0.0, 0.0)
+    desired = (direction[0] / n * maxspeed, direction[1] / n * maxspeed)
+    return _limit((desired[0] - vel[0], desired[1] - vel[1]), maxforce)
+
+
+def _reference_flock(pos, vel, maxspeed, maxforce):
+    """Per-boid loops from Example 5.11 (separate 25 x1.5, align 50, cohere 50)."""
+    out = []
+    for k, (p, v) in enumerate(zip(pos, vel)):
+        sep = [0.0, 0.0]
+        ali = [0.0, 0.0]
+        coh = [0.0, 0.0]
+        n_coh = 0
+        for q, w in zip(pos, vel):
+            d = math.dist(p, q)
+            if 0 < d < 25:
+                sep[0] += (p[0] - q[0]) / d / d
+                sep[1] += (p[1] - q[1]) / d / d
+            if 0 < d < 50:
+                ali[0] += w[0]
+                ali[1] += w[1]
+                coh[0] += q[0]
+                coh[1] += q[1]
+                n_coh += 1
+        fs = _steer(sep, v, maxspeed, maxforce)
+        fa = _steer(ali, v, maxspeed, maxforce)
+        fc = (0.0, 0.0)
+        if n_coh:
+            fc = _steer((coh[0] / n_coh - p[0], coh[1] / n_coh - p[1]), v, maxspeed, maxforce)
+        out.append((1.5 * fs[0] + fa[0] + fc[0], 1.5 * fs[1] + fa[1] + fc[1]))
+    return np.asarray(out)
+
+
+def test_flocking_matches_per_boid_reference():
+    rng = np.random.default_rng(0)
+    n = 120
+    xs = rng.uniform(0, 200, n)
+    ys = rng.uniform(0, 200, n)
+    vx = rng.uniform(-1, 1, n)
+    vy = rng.uniform(-1, 1, n)
+    flock = Agents(n, x=xs, y=ys, vx=vx, vy=vy, max_speed=3.0, max_force=0.05)
+    flock.add_behavior(Separate(25.0), weight=1.5)
+    flock.add_behavior(Align(50.0))
+    flock.add_behavior(Cohesion(50.0))
+    flock.steer()
+    expected = _reference_flock(list(zip(xs, ys)), list(zip(vx, vy)), 3.0, 0.05)
+    assert np.allclose(flock.acceleration.xy, expected)
+    flock.update()
+    assert np.all(flock.velocity.mag() <= 3.0 + 1e-9)
+    assert np.allclose(flock.acceleration.xy, 0.0)
+
+
+def test_seek_and_arrive_per_agent_limits():
+    agents = Agents(3, x=[0.0, 50.0, 100.0], y=0.0, max_speed=[4.0, 4.0, 4.0], max_force=[0.1, 1.0, 10.0])
+    seek = agents.add_behavior(Seek((100.0, 0.0)))
+    agents.steer()
+    assert np.allclose(agents.acceleration.x, [0.1, 1.0, 0.0])
+    agents.acceleration.mult(0)
+    seek.enabled = False
+    agents.add_behavior(Arrive((100.0, 0.0), slow_radius=100.0))
+    agents.steer()
+    # slows linearly inside the radius: desired speed 4, 2 and 0
+    assert np.allclose(agents.acceleration.x, [0.1, 1.0, 0.0])
+    assert np.allclose(agents.acceleration.y, 0.0)
+
+
+
+def test_flocking_behaviors_on_empty_flock():
+    agents = Agents(0)
+    for b in (Separate(), Align(), Cohesion()):
+        agents.add_behavior(b)
+    agents.update()
+    assert len(agents) == 0
+
+
+def test_apply_force_accepts_pvector():
+    from pycreative.vector import PVector
+
+    agents = Agents(2)
+    agents.apply_force(PVector(0.5, -1.0))
+    agents.apply_force((0.5, 0.0))
+    assert np.allclose(agents.acceleration.x, 1.0)
+    assert np.allclose(agents.acceleration.y, -1.0)
+
+def test_follow_path_steers_only_outside_radius():
+    path = [(0.0, 100.0), (400.0, 100.0)]
+    agents = Agents(2, x=[10.0, 10.0], y=[105.0, 160.0], vx=2.0, max_speed=4.0, max_force=0.5)
+    agents.add_behavior(FollowPath(path, path_radius=20.0))
+    agents.steer()
+    ax, ay = agents.acceleration.x, agents.acceleration.y
+    assert ax[0] == 0.0 and ay[0] == 0.0
+    assert ay[1] < 0.0
@@ -0,0 +1,55 @@
+import pygame
+
+from pycreative.app import Sketch
+from pycreative.surface_pool import SurfacePool
+
+
+def test_released_surface_is_reused_and_cleared():
+    pool = SurfacePool()
+    a = pool.acquire(20, 10)
+    a.fill((255, 0, 0, 255))
+    assert pool.release(a) is True
+    assert pool.release(a) is False  # double release is ignored
+    b = pool.acquire(20, 10)
+    assert b is a
+    assert tuple(b.get_at((5, 5))) == (0, 0, 0, 0)
+    c = pool.acquire(20, 11)
+    assert c is not a
+    st = pool.stats()
+    assert (st["hits"], st["misses"], st["leased"], st["idle"]) == (1, 2, 2, 0)
+
+
+def test_pool_budget_evicts_oldest_idle_surfaces():
+    pool = SurfacePool(budget_bytes=2 * 10 * 10 * 4)
+    surfs = [pool.acquire(10, 10) for _ in range(3)]
+    for s in surfs:
+        pool.release(s)
+    st = pool.stats()
+    assert st["idle"] == 2
+    assert st["evictions"] == 1
+    assert st["bytes"] <= st["budget"]
+    # the oldest release was dropped; the newest is handed out first
+    assert pool.acquire(10, 10) is surfs[2]
+
+
+def test_scratch_graphics_leases_and_returns_buffer():
+    s = Sketch()
+    with s.scratch_graphics(32, 16) as g:
+        g.raw.fill((0, 255, 0, 255))
+        first = g.raw
+        assert s.graphics_pool.stats()["leased"] == 1
+    assert s.graphics_pool.stats()["idle"] == 1
+    with s.scratch_graphics(32, 16) as g2:
+        assert g2.raw is first
+        assert tuple(g2.raw.get_at((0, 0))) == (0, 0, 0, 0)
+
+
+def test_create_graphics_without_release_is_not_reused():
+    s = Sketch()
+    a = s.create_graphics(8, 8)
+    b = s.create_graphics(8, 8)
+    assert a.raw is not b.raw
+    a.release()
+    c = s.create_graphics(8, 8)
+    assert c.raw is a.raw
+    assert isinstance(c.raw, pygame.Surface)
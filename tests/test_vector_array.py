@@ -0,0 +1,55 @@
+import math
+
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pycreative.graphics import Surface
+from pycreative.vector import PVector
+from pycreative.vector_array import PVectorArray
+
+
+def test_whole_array_ops_match_pvector():
+    pts = [(3.0, 4.0), (0.0, 0.0), (-1.0, 2.5), (10.0, -7.0)]
+    arr = PVectorArray.from_points(pts)
+    arr.add((1.0, 1.0)).mult(2.0).rotate(0.3).limit(12.0)
+    for (x, y), v in zip(pts, arr):
+        p = PVector(x, y).add((1.0, 1.0)).mult(2.0).rotate(0.3).limit(12.0)
+        assert v.x == pytest.approx(p.x) and v.y == pytest.approx(p.y)
+    arr2 = PVectorArray.from_points(pts).normalize()
+    assert arr2[1].x == 0.0 and arr2[1].y == 0.0
+    assert arr2.mag()[0] == pytest.approx(1.0)
+    assert arr2.heading()[2] == pytest.approx(math.atan2(2.5, -1.0))
+
+
+def test_index_returns_live_pvector_view():
+    arr = PVectorArray(3)
+    v = arr[1]
+    assert isinstance(v, PVector)
+    v.add(PVector(2, 5))
+    assert arr.x[1] == 2.0 and arr.y[1] == 5.0
+    arr.x[1] = 7.0
+    assert v.x == 7.0
+    v2 = PVector(1, 1) + v
+    assert (v2.x, v2.y) == (8.0, 6.0)
+
+
+def test_slices_share_memory_and_per_element_factors():
+    arr = PVectorArray(x=[1.0, 2.0, 3.0, 4.0], y=[0.0, 0.0, 0.0, 0.0])
+    arr[1:3].mult(10.0)
+    assert arr.x.tolist() == [1.0, 20.0, 30.0, 4.0]
+    arr.div(np.array([1.0, 0.0, 2.0, 4.0]))
+    assert arr.x.tolist() == [1.0, 20.0, 15.0, 1.0]
+    arr += PVector(1, 1)
+    assert arr.y.tolist() == [1.0, 1.0, 1.0, 1.0]
+
+
+def test_batched_draws_accept_vector_arrays():
+    surf = Surface(pygame.Surface((40, 40), pygame.SRCALPHA))
+    surf.stroke((255, 0, 0))
+    arr = PVectorArray(x=[5, 10, 15], y=[5, 10, 15])
+    surf.points(arr)
+    assert surf.raw.get_at((10, 10))[:3] == (255, 0, 0)
+    surf.circles(arr, 6, fill=(0, 255, 0), stroke=None)
+    assert surf.raw.get_at((15, 15))[:3] == (0, 255, 0)